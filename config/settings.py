@@ -13,8 +13,44 @@ class TestConfig:
         self.base_url = os.getenv("BASE_URL", "https://tmdb-discover.surge.sh/")
         self.browser = os.getenv("BROWSER", "chromium")
         self.headless = os.getenv("HEADLESS", "false").lower() == "true"
+        self.slow_mo = int(os.getenv("SLOW_MO", "0"))
+        # Videos of every context, as before the browser pool; false to skip
+        self.record_video = os.getenv("RECORD_VIDEO", "true").lower() == "true"
+        self.pool_max_idle_contexts = int(os.getenv("POOL_MAX_IDLE_CONTEXTS", "2"))
+        self.page_pool_size = int(os.getenv("PAGE_POOL_SIZE", "4"))
+        self.network_mode = os.getenv("NETWORK_MODE", "live")
+        self.har_dir = os.getenv("HAR_DIR", "tests/har")
+        self.har_fallback = os.getenv("HAR_FALLBACK", "abort")
+        self.resource_policy = os.getenv("RESOURCE_POLICY", "off")
+        self.perf_budgets_file = os.getenv("PERF_BUDGETS", "config/perf_budgets.yaml")
+        self.perf_budget_tolerance = float(os.getenv("PERF_BUDGET_TOLERANCE", "0"))
+        # Filter matrix values, and the n-wise strength (0 = the file's)
+        self.filter_matrix_file = os.getenv("FILTER_MATRIX", "config/filter_matrix.yaml")
+        self.filter_matrix_strength = int(os.getenv("FILTER_MATRIX_STRENGTH", "0"))
         self.timeout = int(os.getenv("TIMEOUT", "30000"))
+        # Screenshots: always | on-failure | sampled | off, jpeg | png | webp
+        self.screenshot_mode = os.getenv("SCREENSHOT_MODE", "always")
+        self.screenshot_format = os.getenv("SCREENSHOT_FORMAT", "jpeg")
+        self.screenshot_quality = int(os.getenv("SCREENSHOT_QUALITY", "80"))
+        self.screenshot_sample_rate = float(os.getenv("SCREENSHOT_SAMPLE_RATE", "0.1"))
+        self.artifact_store_dir = os.getenv("ARTIFACT_STORE_DIR", "reports/artifacts")
+        # Site-health preflight before the first UI test, consecutive
+        # selector timeouts after which page objects stop waiting (0 = never),
+        # and seconds until a single trial wait is let through again
+        self.site_preflight = os.getenv("SITE_PREFLIGHT", "true").lower() == "true"
+        self.site_preflight_timeout = float(os.getenv("SITE_PREFLIGHT_TIMEOUT", "10"))
+        self.circuit_breaker_threshold = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "3"))
+        self.circuit_breaker_cooldown = float(os.getenv("CIRCUIT_BREAKER_COOLDOWN", "30"))
+        # API target: "local" starts the bundled fake TMDB server,
+        # "live" uses api_base_url as-is
+        self.api_target = os.getenv("API_TARGET", "local")
+        self.api_base_url = os.getenv("API_BASE_URL", "https://api.themoviedb.org/3")
+        self.api_key = os.getenv("TMDB_API_KEY", "")
+        self.api_max_concurrency = int(os.getenv("API_MAX_CONCURRENCY", "50"))
+        self.fake_api_latency_ms = float(os.getenv("FAKE_API_LATENCY_MS", "0"))
+        self.fake_api_error_rate = float(os.getenv("FAKE_API_ERROR_RATE", "0"))
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
+        self.fast_logging = os.getenv("FAST_LOGGING", "false").lower() == "true"
         self.log_file = os.getenv("LOG_FILE", "logs/test_execution.log")
 
 # Global config instance
@@ -1,16 +1,124 @@
 """Simplified pytest configuration and fixtures."""
 
 import asyncio
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
 import pytest
 import pytest_asyncio
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import Browser, Page
+from loguru import logger
+from config.settings import config as settings
+from framework.api_client import TMDBApiClient
+from framework.artifacts import SCREENSHOT_MODES, artifacts
+from framework.browser_pool import BrowserPool
+from framework.fake_tmdb.server import FakeTMDBServer
+from framework.har_replay import HAR_FALLBACKS, NETWORK_MODES, har_path_for
+from framework.page_pool import PagePool
+from framework.performance import PerformanceBudget
+from framework.resource_policy import RESOURCE_POLICIES
+from framework.site_health import check_site
+from framework.timing import recorder
+from framework.base_page import CircuitBreaker, attach_breaker
 from pages.home_page import HomePage
-from utils.logger import setup_logger
+from utils.logger import log_test_fail, log_test_pass, log_test_skip, log_test_start, setup_logger
+
+
+# Longest-first ordering, --shard i/N and the durations database;
+# --record-impact and --changed-since test impact analysis
+pytest_plugins = ["framework.scheduler", "framework.impact"]
+
+
+def pytest_addoption(parser):
+    """Register framework command line options."""
+    parser.addoption("--network-mode", choices=NETWORK_MODES, default=settings.network_mode,
+                     help="live: hit the real site; record/replay: HAR archives per test module")
+    parser.addoption("--har-dir", default=settings.har_dir,
+                     help="Directory holding the HAR archives")
+    parser.addoption("--har-fallback", choices=HAR_FALLBACKS, default=settings.har_fallback,
+                     help="Replay policy for requests missing from the HAR")
+    parser.addoption("--resource-policy", choices=RESOURCE_POLICIES, default=settings.resource_policy,
+                     help="Asset blocking for tests without a resource_policy marker")
+    parser.addoption("--screenshot-mode", choices=SCREENSHOT_MODES, default=settings.screenshot_mode,
+                     help="Which screenshots to keep: all, failure evidence only, a sample, or none")
+    parser.addoption("--fast-logging", action="store_true", default=settings.fast_logging,
+                     help="Lean logging: no diagnose/backtrace, file sink at LOG_LEVEL and enqueued")
 
 
 def pytest_configure(config):
     """Configure pytest - correct signature."""
-    setup_logger()
+    setup_logger(fast=config.getoption("--fast-logging"))
+    
+    # Command line wins over the environment for every context we create
+    settings.network_mode = config.getoption("--network-mode")
+    settings.har_dir = config.getoption("--har-dir")
+    settings.har_fallback = config.getoption("--har-fallback")
+    settings.resource_policy = config.getoption("--resource-policy")
+    artifacts.mode = config.getoption("--screenshot-mode")
+    if hasattr(config, "workerinput"):
+        artifacts.store.worker = config.workerinput["workerid"]
+    else:
+        # xdist workers start after this and record into the same run
+        os.environ["ARTIFACT_RUN_ID"] = artifacts.store.run_id
+    
+    # Stale per-worker timing dumps from a previous run would skew the report
+    if not hasattr(config, "workerinput"):
+        shutil.rmtree(_timing_dir(config) / ".workers", ignore_errors=True)
+
+
+def _timing_dir(config) -> Path:
+    """Directory of the HTML report, where the timing report is written too."""
+    html_path = config.getoption("htmlpath", default=None)
+    return Path(html_path).parent if html_path else Path("reports/html")
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Tag timed page actions with the running test."""
+    recorder.current_test = nodeid
+    log_test_start(nodeid)
+
+
+def pytest_runtest_logreport(report):
+    """Log each test result with its duration."""
+    # Under xdist the controller sees the workers' reports again
+    if hasattr(report, "node"):
+        return
+    if report.when == "call" and report.passed:
+        log_test_pass(report.nodeid, report.duration)
+    elif report.failed:
+        crash = getattr(report.longrepr, "reprcrash", None)
+        log_test_fail(report.nodeid, crash.message if crash else report.longreprtext, report.duration)
+    elif report.skipped:
+        reason = report.longrepr[2] if isinstance(report.longrepr, tuple) else str(report.longrepr)
+        log_test_skip(report.nodeid, reason)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Keep each phase's report on the item so fixtures can see the outcome."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Finish queued screenshot writes and write the timing report next to the HTML report."""
+    artifacts.drain()
+    artifacts.store.save_manifest()
+    timing_dir = _timing_dir(session.config)
+    workerinput = getattr(session.config, "workerinput", None)
+    if workerinput:
+        recorder.dump(timing_dir / ".workers" / f"{workerinput['workerid']}.json")
+        return
+    recorder.load(sorted((timing_dir / ".workers").glob("*.json")))
+    if recorder.samples:
+        recorder.write_report(timing_dir / "timing.json", timing_dir / "timing.html")
+
+
+def pytest_unconfigure(config):
+    """Flush log records still queued for enqueued (fast-logging) sinks."""
+    logger.complete()
 
 
 @pytest.fixture(scope="session")
@@ -21,34 +129,153 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def fake_tmdb():
+    """Local fake TMDB API on a free port."""
+    server = FakeTMDBServer(
+        latency_ms=settings.fake_api_latency_ms,
+        error_rate=settings.fake_api_error_rate
+    )
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def api_base_url(request) -> str:
+    """TMDB API base URL - the fake server unless API_TARGET=live."""
+    if settings.api_target == "live":
+        return settings.api_base_url
+    return request.getfixturevalue("fake_tmdb").base_url
+
+
 @pytest_asyncio.fixture(scope="session")
-async def browser():
+async def api_client(api_base_url):
+    """Session-wide pooled async TMDB API client."""
+    async with TMDBApiClient(api_base_url, max_concurrency=settings.api_max_concurrency) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def perf_budget() -> PerformanceBudget:
+    """Performance budgets for the perf suite."""
+    return PerformanceBudget.load(settings.perf_budgets_file, settings.perf_budget_tolerance)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def browser_pool():
+    """Per-worker browser pool (one browser per xdist worker)."""
+    pool = BrowserPool()
+    await pool.start()
+    yield pool
+    await pool.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def browser(browser_pool) -> Browser:
     """Browser fixture."""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        yield browser
-        await browser.close()
+    return browser_pool.browser
+
+
+@pytest.fixture(scope="session")
+def site_health() -> Optional[str]:
+    """Preflight the site once per session; the problem found, or None.
+    
+    Skipped in record/replay mode, where the site is served from HAR files.
+    """
+    if not settings.site_preflight or settings.network_mode == "replay":
+        return None
+    problem = check_site(settings.base_url, settings.site_preflight_timeout)
+    if problem:
+        logger.error(f"Site preflight failed: {problem}")
+    return problem
+
+
+@pytest.fixture(scope="session")
+def circuit_breaker() -> CircuitBreaker:
+    """Circuit breaker shared by every test context in the session."""
+    return CircuitBreaker(settings.circuit_breaker_threshold, settings.circuit_breaker_cooldown)
+
+
+async def _prime_home(page: Page) -> None:
+    """Bring a page to the loaded home view for the warm snapshot."""
+    await HomePage(page).navigate_to_home()
 
 
 @pytest_asyncio.fixture
-async def context(browser):
-    """Browser context fixture."""
-    context = await browser.new_context(
-        viewport={"width": 1920, "height": 1080}
-    )
+async def context(request, browser_pool, site_health, circuit_breaker):
+    """Browser context fixture.
+    
+    Tests marked ``home_loaded`` get a context cloned from the session's warm
+    home snapshot (storage state plus primed HTTP cache). In record/replay
+    network mode the context is bound to the test's HAR archive instead.
+    A ``resource_policy("placeholder")`` marker stubs posters and blocks
+    fonts and analytics for that test. Tests marked ``cold_context`` get a
+    brand-new context instead of a pooled one with a warm HTTP cache.
+    
+    Page objects on the context share the session's circuit breaker. A
+    failed site preflight or an open breaker stops the session after the
+    current test instead of letting every UI test time out.
+    """
+    if site_health:
+        request.session.shouldstop = site_health
+        pytest.fail(f"Site preflight failed, aborting UI tests: {site_health}", pytrace=False)
+    
+    options = {}
+    if settings.network_mode != "live":
+        options["har_path"] = har_path_for(request.node.nodeid, settings.har_dir)
+    elif request.node.get_closest_marker("home_loaded"):
+        snapshot = await browser_pool.snapshot("home", _prime_home)
+        options = snapshot.context_options()
+    
+    marker = request.node.get_closest_marker("resource_policy")
+    if marker:
+        options["resource_policy"] = marker.args[0] if marker.args else "placeholder"
+    
+    try:
+        context = await browser_pool.acquire_context(
+            fresh=request.node.get_closest_marker("cold_context") is not None, **options)
+    except FileNotFoundError as e:
+        pytest.fail(str(e), pytrace=False)
+    attach_breaker(context, circuit_breaker)
     yield context
-    await context.close()
+    await browser_pool.release_context(context)
+    if circuit_breaker.is_open:
+        request.session.shouldstop = (f"Circuit breaker open after "
+                                      f"{circuit_breaker.consecutive_timeouts} consecutive timeouts")
 
 
 @pytest_asyncio.fixture
-async def page(context):
-    """Page fixture."""
+async def page(request, context):
+    """Page fixture; captures the final page of a failing test."""
     page = await context.new_page()
     yield page
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.failed and not page.is_closed():
+        name = "failed_" + "".join(c if c.isalnum() else "_" for c in request.node.name)
+        try:
+            await artifacts.capture(page, name, failure=True)
+        except Exception as e:
+            logger.warning(f"Could not capture failure screenshot: {e}")
     await page.close()
 
 
 @pytest_asyncio.fixture
-async def home_page(page: Page) -> HomePage:
-    """Home page fixture."""
-    return HomePage(page)
\ No newline at end of file
+async def page_pool(context):
+    """Pages in the test's context for concurrent checks (see HomePage.fan_out)."""
+    pool = PagePool(context, size=settings.page_pool_size)
+    yield pool
+    await pool.close()
+
+
+@pytest_asyncio.fixture
+async def home_page(request, page: Page) -> HomePage:
+    """Home page fixture.
+    
+    With the ``home_loaded`` marker the page is already sitting on the
+    loaded home view, served from the warm snapshot.
+    """
+    home_page = HomePage(page)
+    if request.node.get_closest_marker("home_loaded"):
+        await home_page.navigate_to_home(wait_until="domcontentloaded")
+    return home_page
\ No newline at end of file
@@ -0,0 +1,315 @@
+"""Async TMDB API client shared by the API tests."""
+
+import asyncio
+import random
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+from config.settings import config
+from loguru import logger
+
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class MediaItem(BaseModel):
+    """A movie or TV show as returned in TMDB result lists."""
+    model_config = ConfigDict(extra="ignore")
+    
+    id: int
+    title: Optional[str] = None
+    name: Optional[str] = None
+    release_date: Optional[str] = None
+    first_air_date: Optional[str] = None
+    vote_average: float = 0.0
+    genre_ids: List[int] = Field(default_factory=list)
+    popularity: float = 0.0
+    poster_path: Optional[str] = None
+    media_type: Optional[str] = None
+    
+    @property
+    def display_title(self) -> str:
+        """Movie title or TV show name."""
+        return self.title or self.name or ""
+    
+    @property
+    def year(self) -> Optional[int]:
+        """Release (or first air) year, if known."""
+        date = self.release_date or self.first_air_date
+        return int(date[:4]) if date and date[:4].isdigit() else None
+
+
+class PagedResults(BaseModel):
+    """A page of discover/search/popular results."""
+    model_config = ConfigDict(extra="ignore")
+    
+    page: int
+    results: List[MediaItem]
+    total_pages: int
+    total_results: int
+
+
+class Genre(BaseModel):
+    """A genre id/name pair."""
+    id: int
+    name: str
+
+
+class GenreList(BaseModel):
+    """Response of the genre list endpoints."""
+    genres: List[Genre]
+
+
+class ApiError(BaseModel):
+    """TMDB error body."""
+    model_config = ConfigDict(extra="ignore")
+    
+    status_code: int
+    status_message: str
+    success: bool = False
+
+
+class TMDBApiError(Exception):
+    """Raised when a typed call gets a non-200 answer."""
+    
+    def __init__(self, status: int, error: Optional[ApiError]) -> None:
+        self.status = status
+        self.error = error
+        message = error.status_message if error else "no error body"
+        super().__init__(f"TMDB API returned {status}: {message}")
+
+
+def _http2_available() -> bool:
+    """Whether the optional h2 package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class TMDBApiClient:
+    """Pooled async client for the TMDB API (or the local fake).
+    
+    One instance is meant to live for the whole session: it keeps
+    connections alive, speaks HTTP/2 where the server and the optional
+    ``h2`` package allow it, caps in-flight requests with a semaphore and
+    retries 429/5xx/transport errors with jittered exponential backoff.
+    
+    Usage:
+        async with TMDBApiClient(base_url) as client:
+            popular = await client.popular_movies()
+    """
+    
+    def __init__(self,
+                 base_url: str,
+                 api_key: Optional[str] = None,
+                 timeout: float = 10.0,
+                 max_connections: int = 100,
+                 max_concurrency: int = 50,
+                 retries: int = 3,
+                 backoff_base: float = 0.1,
+                 backoff_max: float = 2.0,
+                 http2: bool = True) -> None:
+        """Initialize TMDBApiClient.
+        
+        Args:
+            base_url: API root, e.g. "https://api.themoviedb.org/3"
+            api_key: TMDB API key sent as ``api_key``, defaults to config.api_key
+            timeout: Per-request timeout in seconds
+            max_connections: Connection pool size
+            max_concurrency: Maximum requests in flight at once
+            retries: Retries for retryable failures
+            backoff_base: First backoff ceiling in seconds
+            backoff_max: Upper bound for a single backoff
+            http2: Use HTTP/2 when the h2 package is installed
+        """
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key or config.api_key or None
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.http2 = http2 and _http2_available()
+        if http2 and not self.http2:
+            logger.debug("h2 not installed - API client falls back to HTTP/1.1")
+        self._limits = httpx.Limits(max_connections=max_connections,
+                                    max_keepalive_connections=max_connections)
+        self._timeout = httpx.Timeout(timeout)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self) -> "TMDBApiClient":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def start(self) -> None:
+        """Open the underlying connection pool."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                limits=self._limits,
+                timeout=self._timeout,
+                headers={"Accept": "application/json"}
+            )
+            logger.info(f"API client started for {self.base_url} (http2: {self.http2})")
+    
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("API client closed")
+    
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Delay before the next attempt, honouring Retry-After.
+        
+        Args:
+            attempt: Zero-based attempt that just failed
+            retry_after: Retry-After header value, if any
+        
+        Returns:
+            Delay in seconds
+        """
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        # Full jitter keeps a burst of concurrent retries from lining up
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+    
+    async def request(self,
+                      method: str,
+                      path: str,
+                      params: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """Send a request with bounded concurrency and retries.
+        
+        Args:
+            method: HTTP method
+            path: Path relative to base_url, e.g. "/movie/popular"
+            params: Query parameters
+            headers: Extra request headers
+        
+        Returns:
+            Final httpx.Response (may still be an error status)
+        """
+        if self._client is None:
+            await self.start()
+        params = dict(params or {})
+        if self.api_key:
+            params.setdefault("api_key", self.api_key)
+        url = path if path.startswith("/") else f"/{path}"
+        
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self._client.request(method, url, params=params, headers=headers)
+            except httpx.TransportError as e:
+                if attempt >= self.retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{method} {url} failed ({e}), retrying in {delay:.2f}s")
+            else:
+                if response.status_code not in RETRYABLE_STATUSES or attempt >= self.retries:
+                    return response
+                delay = self._backoff(attempt, response.headers.get("Retry-After"))
+                logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def get(self,
+                  path: str,
+                  headers: Optional[Dict[str, str]] = None,
+                  **params: Any) -> httpx.Response:
+        """GET a path.
+        
+        Args:
+            path: Path relative to base_url
+            headers: Extra request headers
+            **params: Query parameters
+        
+        Returns:
+            httpx.Response
+        """
+        return await self.request("GET", path, params=params, headers=headers)
+    
+    async def get_json(self, path: str, **params: Any) -> Dict[str, Any]:
+        """GET a path and return its JSON body, raising on non-200.
+        
+        Args:
+            path: Path relative to base_url
+            **params: Query parameters
+        
+        Returns:
+            Parsed JSON body
+        """
+        response = await self.get(path, **params)
+        if response.status_code != 200:
+            try:
+                error = ApiError.model_validate(response.json())
+            except Exception:
+                error = None
+            raise TMDBApiError(response.status_code, error)
+        return response.json()
+    
+    async def get_many(self,
+                       calls: Iterable[Tuple[str, Dict[str, Any]]]) -> List[httpx.Response]:
+        """Fan out many GETs concurrently (bounded by max_concurrency).
+        
+        Args:
+            calls: (path, params) pairs
+        
+        Returns:
+            Responses in the same order as ``calls``
+        """
+        return await asyncio.gather(*(self.get(path, **params) for path, params in calls))
+    
+    async def popular_movies(self, page: int = 1) -> PagedResults:
+        """Popular movies.
+        
+        Args:
+            page: Result page
+        
+        Returns:
+            PagedResults
+        """
+        return PagedResults.model_validate(await self.get_json("/movie/popular", page=page))
+    
+    async def discover(self, media: str = "movie", **filters: Any) -> PagedResults:
+        """Discover movies or TV shows.
+        
+        Args:
+            media: "movie" or "tv"
+            **filters: TMDB discover parameters (dotted names via dict unpacking)
+        
+        Returns:
+            PagedResults
+        """
+        return PagedResults.model_validate(await self.get_json(f"/discover/{media}", **filters))
+    
+    async def search_multi(self, query: str, page: int = 1) -> PagedResults:
+        """Search movies and TV shows by title.
+        
+        Args:
+            query: Search term
+            page: Result page
+        
+        Returns:
+            PagedResults
+        """
+        return PagedResults.model_validate(await self.get_json("/search/multi", query=query, page=page))
+    
+    async def genres(self, media: str = "movie") -> GenreList:
+        """Genre list for movies or TV.
+        
+        Args:
+            media: "movie" or "tv"
+        
+        Returns:
+            GenreList
+        """
+        return GenreList.model_validate(await self.get_json(f"/genre/{media}/list"))
@@ -0,0 +1,312 @@
+"""Content-addressed screenshot store with per-run manifests and visual diffs.
+
+Screenshots are stored once per distinct content under
+``objects/<aa>/<sha256>.<ext>``. Each run writes a manifest mapping
+screenshot names to digests (``runs/<run_id>/<worker>.json``, one file per
+xdist worker), so a run that looks like the last one adds almost nothing
+to disk. A run can be promoted to the baseline, and later runs are
+compared with it. Identical digests need no decoding at all. Changed
+images get a block-averaged luma diff computed with NumPy, which ignores
+JPEG noise and antialiasing but catches layout and content changes.
+
+Usage:
+    python -m framework.artifact_store promote --run <run_id>
+    python -m framework.artifact_store check --run <run_id> --max-changed 0.01
+    python -m framework.artifact_store gc --keep-runs 10
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from config.settings import config
+from loguru import logger
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass
+class VisualDiff:
+    """How much a screenshot differs from its baseline."""
+    name: str
+    changed_ratio: float
+    max_delta: float
+    size_mismatch: bool = False
+    
+    def within(self, max_changed_ratio: float) -> bool:
+        """Whether the change is small enough to pass.
+        
+        Args:
+            max_changed_ratio: Largest allowed share of changed blocks
+        
+        Returns:
+            True if the images match closely enough
+        """
+        return not self.size_mismatch and self.changed_ratio <= max_changed_ratio
+
+
+def luma(data: bytes) -> "np.ndarray":
+    """Decode an image to a float32 luma array (needs Pillow).
+    
+    Args:
+        data: Encoded PNG/JPEG/WebP bytes
+    
+    Returns:
+        Array of shape (height, width)
+    """
+    import numpy as np
+    from PIL import Image
+    with Image.open(io.BytesIO(data)) as image:
+        return np.asarray(image.convert("L"), dtype=np.float32)
+
+
+def block_means(pixels: "np.ndarray", block: int) -> "np.ndarray":
+    """Average ``block`` x ``block`` tiles, dropping partial edge tiles.
+    
+    Args:
+        pixels: 2-D array
+        block: Tile size in pixels
+    
+    Returns:
+        Array of tile means
+    """
+    height = pixels.shape[0] // block * block
+    width = pixels.shape[1] // block * block
+    tiles = pixels[:height, :width].reshape(height // block, block, width // block, block)
+    return tiles.mean(axis=(1, 3))
+
+
+def perceptual_diff(baseline: "np.ndarray", current: "np.ndarray", name: str = "",
+                    block: int = 8, tolerance: float = 12.0) -> VisualDiff:
+    """Compare two luma arrays tile by tile.
+    
+    Args:
+        baseline: Baseline luma array
+        current: Current luma array
+        name: Screenshot name for the result
+        block: Tile size; larger tiles forgive more pixel noise
+        tolerance: Mean luma change (0-255) at which a tile counts as changed
+    
+    Returns:
+        VisualDiff with the share of changed tiles
+    """
+    import numpy as np
+    if baseline.shape != current.shape:
+        return VisualDiff(name, changed_ratio=1.0, max_delta=255.0, size_mismatch=True)
+    delta = np.abs(block_means(baseline, block) - block_means(current, block))
+    if not delta.size:
+        return VisualDiff(name, changed_ratio=0.0, max_delta=0.0)
+    return VisualDiff(name, changed_ratio=float((delta > tolerance).mean()), max_delta=float(delta.max()))
+
+
+class ArtifactStore:
+    """Deduplicating screenshot store rooted at one directory."""
+    
+    def __init__(self, root: str = "reports/artifacts", run_id: Optional[str] = None,
+                 worker: str = "main") -> None:
+        """Initialize ArtifactStore.
+        
+        Args:
+            root: Store directory
+            run_id: Run the manifest belongs to, default ARTIFACT_RUN_ID or a timestamp
+            worker: Manifest file name within the run (the xdist worker id)
+        """
+        self.root = Path(root)
+        self.run_id = run_id or os.environ.get("ARTIFACT_RUN_ID") or time.strftime("%Y%m%d-%H%M%S")
+        self.worker = worker
+        self.entries: Dict[str, str] = {}
+        self._lock = threading.Lock()
+    
+    def object_path(self, ref: str) -> Path:
+        """Path of a stored object.
+        
+        Args:
+            ref: "<sha256>.<ext>" as recorded in manifests
+        
+        Returns:
+            Object file path
+        """
+        return self.root / "objects" / ref[:2] / ref
+    
+    def add(self, name: str, digest: str, ext: str, write: Callable[[Path], None]) -> Path:
+        """Record a screenshot and store its content unless already present.
+        
+        Args:
+            name: Screenshot name in the run manifest
+            digest: sha256 hex digest of the content
+            ext: File extension
+            write: Writes the content to the given path, only called for new objects
+        
+        Returns:
+            Object path
+        """
+        ref = f"{digest}.{ext}"
+        path = self.object_path(ref)
+        with self._lock:
+            self.entries[name] = ref
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent workers never see half a file
+            temp = path.with_name(f".{ref}.{os.getpid()}.{threading.get_ident()}")
+            write(temp)
+            os.replace(temp, path)
+        return path
+    
+    def put(self, name: str, data: bytes, ext: str) -> Path:
+        """Store encoded image bytes.
+        
+        Args:
+            name: Screenshot name
+            data: Encoded image
+            ext: File extension
+        
+        Returns:
+            Object path
+        """
+        return self.add(name, hashlib.sha256(data).hexdigest(), ext, lambda path: path.write_bytes(data))
+    
+    def save_manifest(self) -> Optional[Path]:
+        """Write this process's share of the run manifest.
+        
+        Returns:
+            Manifest path, or None if nothing was stored
+        """
+        if not self.entries:
+            return None
+        path = self.root / "runs" / self.run_id / f"{self.worker}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            path.write_text(json.dumps(dict(sorted(self.entries.items())), indent=1), encoding="utf-8")
+        logger.info(f"Artifact manifest for {len(self.entries)} screenshots: {path}")
+        return path
+    
+    def runs(self) -> List[str]:
+        """Run ids with a manifest, oldest first."""
+        runs_dir = self.root / "runs"
+        return sorted(p.name for p in runs_dir.iterdir() if p.is_dir()) if runs_dir.exists() else []
+    
+    def manifest(self, run_id: str) -> Dict[str, str]:
+        """A run's full manifest, merged across workers.
+        
+        Args:
+            run_id: Run id
+        
+        Returns:
+            Screenshot name -> object ref
+        """
+        merged: Dict[str, str] = {}
+        for part in sorted((self.root / "runs" / run_id).glob("*.json")):
+            merged.update(json.loads(part.read_text(encoding="utf-8")))
+        return merged
+    
+    def baselines(self) -> Dict[str, str]:
+        """Screenshot name -> baseline object ref."""
+        path = self.root / "baselines.json"
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    
+    def promote(self, run_id: str) -> int:
+        """Make a run's screenshots the baseline (other baselines are kept).
+        
+        Args:
+            run_id: Run id
+        
+        Returns:
+            Number of screenshots promoted
+        """
+        baselines = self.baselines()
+        manifest = self.manifest(run_id)
+        baselines.update(manifest)
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / "baselines.json").write_text(json.dumps(dict(sorted(baselines.items())), indent=1),
+                                                  encoding="utf-8")
+        return len(manifest)
+    
+    def check(self, run_id: str, max_changed_ratio: float = 0.01, **diff_options) -> List[VisualDiff]:
+        """Compare a run's screenshots with the baselines.
+        
+        Args:
+            run_id: Run id
+            max_changed_ratio: Largest share of changed tiles that still passes
+            **diff_options: Passed to perceptual_diff (block, tolerance)
+        
+        Returns:
+            Diffs that exceed the threshold; screenshots without a baseline are skipped
+        """
+        baselines = self.baselines()
+        regressions = []
+        for name, ref in sorted(self.manifest(run_id).items()):
+            baseline_ref = baselines.get(name)
+            if baseline_ref is None or baseline_ref.split(".")[0] == ref.split(".")[0]:
+                continue
+            diff = perceptual_diff(luma(self.object_path(baseline_ref).read_bytes()),
+                                   luma(self.object_path(ref).read_bytes()), name, **diff_options)
+            if not diff.within(max_changed_ratio):
+                regressions.append(diff)
+        return regressions
+    
+    def gc(self, keep_runs: int = 10) -> int:
+        """Drop all but the newest runs and the objects nothing refers to.
+        
+        Args:
+            keep_runs: Run manifests to keep
+        
+        Returns:
+            Number of objects deleted
+        """
+        runs = self.runs()
+        for run_id in runs[:-keep_runs] if keep_runs else runs:
+            shutil.rmtree(self.root / "runs" / run_id)
+        live = set(self.baselines().values())
+        for run_id in self.runs():
+            live.update(self.manifest(run_id).values())
+        deleted = 0
+        for path in (self.root / "objects").glob("*/*"):
+            if path.name not in live:
+                path.unlink()
+                deleted += 1
+        return deleted
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: promote, check or gc."""
+    parser = argparse.ArgumentParser(description="Content-addressed screenshot store")
+    parser.add_argument("command", choices=["promote", "check", "gc"])
+    parser.add_argument("--root", default=config.artifact_store_dir)
+    parser.add_argument("--run", default=None, help="Run id (default: the latest run)")
+    parser.add_argument("--max-changed", type=float, default=0.01,
+                        help="Share of changed 8x8 tiles above which a screenshot is a regression")
+    parser.add_argument("--keep-runs", type=int, default=10)
+    args = parser.parse_args(argv)
+    
+    store = ArtifactStore(args.root)
+    if args.command == "gc":
+        print(f"Deleted {store.gc(args.keep_runs)} unreferenced screenshots")
+        return 0
+    
+    runs = store.runs()
+    run_id = args.run or (runs[-1] if runs else None)
+    if run_id is None:
+        print(f"No runs in {args.root}")
+        return 1
+    if args.command == "promote":
+        print(f"Promoted {store.promote(run_id)} screenshots from run {run_id} to baseline")
+        return 0
+    
+    regressions = store.check(run_id, args.max_changed)
+    for diff in regressions:
+        detail = "size changed" if diff.size_mismatch else f"{diff.changed_ratio:.1%} of tiles changed"
+        print(f"❌ {diff.name}: {detail}")
+    print(f"Run {run_id}: {len(regressions)} visual regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
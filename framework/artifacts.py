@@ -0,0 +1,166 @@
+"""Screenshot pipeline that keeps encoding and disk writes off the test's path.
+
+The page is still captured when ``capture`` is awaited (so the image shows
+the state the step asked for), but as JPEG by default, which the browser
+encodes far faster than PNG. Storing the file in the content-addressed
+ArtifactStore, and re-encoding to WebP when Pillow is installed, runs on
+a small thread pool; ``drain`` waits for the pending writes at the end of
+the session.
+
+Modes:
+    always: every screenshot is kept
+    on-failure: only screenshots taken while handling an exception, plus
+        one of the final page of every failing test
+    sampled: failure screenshots plus a random share of the others
+    off: nothing is captured
+"""
+
+import hashlib
+import io
+import random
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import List, Optional
+from playwright.async_api import Page
+from config.settings import config
+from framework.artifact_store import ArtifactStore
+from loguru import logger
+
+
+SCREENSHOT_MODES = ("always", "on-failure", "sampled", "off")
+SCREENSHOT_FORMATS = ("jpeg", "png", "webp")
+
+EXTENSIONS = {"jpeg": "jpg", "png": "png", "webp": "webp"}
+
+
+def _pillow_available() -> bool:
+    """Whether the optional Pillow package needed for WebP is installed."""
+    try:
+        import PIL  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _store_webp(store: ArtifactStore, name: str, data: bytes, quality: int) -> Path:
+    """Re-encode a PNG capture as WebP and store it; runs on the pool.
+    
+    The object is keyed by the WebP bytes actually written, like every
+    other stored screenshot.
+    """
+    from PIL import Image
+    buffer = io.BytesIO()
+    with Image.open(io.BytesIO(data)) as image:
+        image.save(buffer, "WEBP", quality=quality)
+    return store.put(name, buffer.getvalue(), EXTENSIONS["webp"])
+
+
+class ArtifactPipeline:
+    """Captures screenshots by mode and writes them in the background."""
+    
+    def __init__(self, mode: str = "always", image_format: str = "jpeg", quality: int = 80,
+                 sample_rate: float = 0.1, store: Optional[ArtifactStore] = None, workers: int = 2) -> None:
+        """Initialize ArtifactPipeline.
+        
+        Args:
+            mode: One of SCREENSHOT_MODES
+            image_format: One of SCREENSHOT_FORMATS; webp falls back to jpeg without Pillow
+            quality: JPEG/WebP quality (1-100), ignored for PNG
+            sample_rate: Share of non-failure screenshots kept in sampled mode
+            store: Where screenshots are stored, default a store at ARTIFACT_STORE_DIR
+            workers: Threads writing files
+        """
+        if mode not in SCREENSHOT_MODES:
+            raise ValueError(f"Unknown screenshot mode '{mode}', expected one of {SCREENSHOT_MODES}")
+        if image_format not in SCREENSHOT_FORMATS:
+            raise ValueError(f"Unknown screenshot format '{image_format}', expected one of {SCREENSHOT_FORMATS}")
+        if image_format == "webp" and not _pillow_available():
+            logger.warning("WebP screenshots need Pillow; writing JPEG instead")
+            image_format = "jpeg"
+        self.mode = mode
+        self.image_format = image_format
+        self.quality = quality
+        self.sample_rate = sample_rate
+        self.store = store or ArtifactStore(config.artifact_store_dir)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshots")
+        self._pending: List[Future] = []
+    
+    def should_capture(self, failure: bool) -> bool:
+        """Whether a screenshot is kept under the current mode.
+        
+        Args:
+            failure: The screenshot documents an error
+        
+        Returns:
+            True to capture
+        """
+        if self.mode == "off":
+            return False
+        if self.mode == "always" or failure:
+            return True
+        if self.mode == "sampled":
+            return random.random() < self.sample_rate
+        return False
+    
+    async def capture(self, page: Page, name: str, failure: Optional[bool] = None) -> Optional[str]:
+        """Capture the page now and write it in the background.
+        
+        Args:
+            page: Page to capture
+            name: File name without extension
+            failure: Whether this documents an error; by default true when
+                called while an exception is being handled
+        
+        Returns:
+            Path of the stored object, or None if the mode skipped it; for
+            WebP the path depends on the encoded bytes and is only known once
+            the background write finishes, so None as well
+        """
+        if failure is None:
+            failure = sys.exc_info()[0] is not None
+        if not self.should_capture(failure):
+            logger.debug("Screenshot {} skipped ({} mode)", name, self.mode)
+            return None
+        
+        self._reap([f for f in self._pending if f.done()])
+        if self.image_format == "webp":
+            # Re-encoded from a lossless capture, and keyed, on the pool
+            data = await page.screenshot(type="png")
+            self._pending.append(self._executor.submit(_store_webp, self.store, name, data, self.quality))
+            logger.info("Screenshot {} queued for WebP encoding", name)
+            return None
+        
+        if self.image_format == "jpeg":
+            data = await page.screenshot(type="jpeg", quality=self.quality)
+        else:
+            data = await page.screenshot(type="png")
+        # Keyed by the stored bytes, so unchanged pages are stored once
+        digest = hashlib.sha256(data).hexdigest()
+        ext = EXTENSIONS[self.image_format]
+        write = lambda path: path.write_bytes(data)
+        self._pending.append(self._executor.submit(self.store.add, name, digest, ext, write))
+        path = self.store.object_path(f"{digest}.{ext}")
+        logger.info("Screenshot {} queued: {}", name, path)
+        return str(path)
+    
+    def _reap(self, done: List[Future]) -> None:
+        """Forget finished writes, logging the ones that failed."""
+        for future in done:
+            if future.exception():
+                logger.error(f"Writing screenshot failed: {future.exception()}")
+            self._pending.remove(future)
+    
+    def drain(self) -> None:
+        """Block until every queued screenshot is on disk."""
+        done, _ = wait(self._pending)
+        self._reap(list(done))
+
+
+# Shared by every page object in this process (one per xdist worker)
+artifacts = ArtifactPipeline(
+    mode=config.screenshot_mode,
+    image_format=config.screenshot_format,
+    quality=config.screenshot_quality,
+    sample_rate=config.screenshot_sample_rate,
+)
@@ -0,0 +1,118 @@
+"""In-memory HTTP cache shared between browser contexts."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set
+from playwright.async_api import BrowserContext, Response, Route
+from loguru import logger
+
+
+# Headers that no longer describe the decoded body we replay
+HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+@dataclass
+class CachedResponse:
+    """A response body captured while priming the cache."""
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class AssetCache:
+    """Caches GET responses from one context and serves them to others.
+    
+    Playwright contexts never share the browser HTTP cache, so every new
+    context refetches the SPA bundle, fonts, posters and the first discover
+    page. The cache records those responses once per session and replays
+    them through ``context.route`` in later contexts.
+    """
+    
+    DEFAULT_RESOURCE_TYPES = {"document", "script", "stylesheet", "font", "image", "fetch", "xhr"}
+    
+    def __init__(self,
+                 resource_types: Optional[Set[str]] = None,
+                 max_bytes: int = 50 * 1024 * 1024) -> None:
+        """Initialize AssetCache.
+        
+        Args:
+            resource_types: Playwright resource types worth caching
+            max_bytes: Upper bound on the total cached body size
+        """
+        self.resource_types = resource_types or self.DEFAULT_RESOURCE_TYPES
+        self.max_bytes = max_bytes
+        self.entries: Dict[str, CachedResponse] = {}
+        self.size = 0
+        self.hits = 0
+        self._pending: Set[asyncio.Task] = set()
+    
+    def record(self, context: BrowserContext) -> None:
+        """Start recording cacheable responses from a context.
+        
+        Args:
+            context: Context used to prime the cache
+        """
+        context.on("response", self._on_response)
+    
+    def _on_response(self, response: Response) -> None:
+        """Schedule body capture for a cacheable response."""
+        request = response.request
+        if (request.method != "GET" or response.status != 200
+                or request.resource_type not in self.resource_types
+                or response.url in self.entries):
+            return
+        task = asyncio.ensure_future(self._capture(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+    
+    async def _capture(self, response: Response) -> None:
+        """Store the body of a response if it still fits in the cache."""
+        try:
+            body = await response.body()
+        except Exception as e:
+            logger.debug(f"Could not cache {response.url}: {e}")
+            return
+        if self.size + len(body) > self.max_bytes:
+            return
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in HOP_HEADERS}
+        self.entries[response.url] = CachedResponse(response.status, headers, body)
+        self.size += len(body)
+    
+    async def drain(self) -> None:
+        """Wait for in-flight body captures to finish."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+    
+    async def install(self, context: BrowserContext) -> None:
+        """Serve cached responses to a context, falling through on a miss.
+        
+        Args:
+            context: Context to serve from the cache
+        """
+        await context.route("**/*", self._handle_route)
+    
+    async def _handle_route(self, route: Route) -> None:
+        """Fulfil a request from the cache or let it continue."""
+        request = route.request
+        entry = self.entries.get(request.url) if request.method == "GET" else None
+        if entry is None:
+            await route.fallback()
+            return
+        self.hits += 1
+        await route.fulfill(status=entry.status, headers=entry.headers, body=entry.body)
+
+
+@dataclass
+class WarmSnapshot:
+    """Storage state and asset cache captured from a primed context."""
+    storage_state: Dict[str, Any]
+    asset_cache: AssetCache
+    url: str = ""
+    
+    def context_options(self) -> Dict[str, Any]:
+        """Options for ``PlaywrightManager.create_context`` to clone this snapshot.
+        
+        Returns:
+            Context options dictionary
+        """
+        return {"storage_state": self.storage_state, "asset_cache": self.asset_cache}
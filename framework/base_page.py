@@ -1,31 +1,234 @@
 """Base page class with common functionality."""
 
-from typing import Optional, List, Any
-from playwright.async_api import Page, Locator, expect
+from contextlib import asynccontextmanager
+from typing import Optional, List, Any, AsyncIterator, Awaitable, Callable, Dict, Pattern, Tuple, TypeVar, Union
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+from playwright.async_api import BrowserContext, Page, Locator, Request, Response, expect
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from loguru import logger
+from config.settings import config
+from framework.artifacts import artifacts
+from framework.timing import timed_action
 import asyncio
+import re
+import time
+
+
+# Installs (or re-installs) a MutationObserver on the results container and
+# reports how long the DOM has been quiet. The watched element count is folded
+# into the same "last change" timestamp so a grid whose size is still moving
+# never counts as settled. ``touch`` restarts the quiet period without
+# re-installing the observer.
+SETTLE_PROBE_SCRIPT = """
+({ container, countSelector, reset, touch }) => {
+    const now = performance.now();
+    let state = window.__rrSettle;
+    if (reset || !state) {
+        if (state && state.observer) state.observer.disconnect();
+        state = window.__rrSettle = { lastChange: now, mutations: 0, count: -1, observer: null };
+        const target = document.querySelector(container) || document.body;
+        if (target) {
+            state.observer = new MutationObserver((records) => {
+                state.mutations += records.length;
+                state.lastChange = performance.now();
+            });
+            state.observer.observe(target, { childList: true, subtree: true, attributes: true, attributeFilter: ['src', 'class'] });
+        }
+    }
+    if (touch) state.lastChange = now;
+    if (countSelector) {
+        const count = document.querySelectorAll(countSelector).length;
+        if (count !== state.count) {
+            state.count = count;
+            state.lastChange = now;
+        }
+    }
+    return { idleMs: now - state.lastChange, mutations: state.mutations, count: state.count };
+}
+"""
+
+SETTLE_TEARDOWN_SCRIPT = """
+() => {
+    const state = window.__rrSettle;
+    if (state && state.observer) state.observer.disconnect();
+    delete window.__rrSettle;
+}
+"""
+
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of waiting once too many selector waits in a row timed out."""
+
+
+class CircuitBreaker:
+    """Counts consecutive selector/navigation timeouts and trips at a threshold.
+    
+    While open every guarded wait fails at once with CircuitOpenError
+    instead of burning its full timeout. Once ``cooldown_s`` has passed
+    since the last timeout the circuit is half-open: a single trial wait
+    is let through, and its success closes the circuit again while another
+    timeout re-opens it for a new cooldown.
+    """
+    
+    def __init__(self, threshold: int, cooldown_s: float = 30.0) -> None:
+        """Initialize CircuitBreaker.
+        
+        Args:
+            threshold: Consecutive timeouts that open the circuit, 0 disables it
+            cooldown_s: Seconds after the last timeout before a trial wait is allowed
+        """
+        self.threshold = threshold
+        self.cooldown_s = cooldown_s
+        self.consecutive_timeouts = 0
+        self.last_timeout_at = 0.0
+        self._trial_running = False
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether the threshold was reached and no wait has succeeded since."""
+        return bool(self.threshold) and self.consecutive_timeouts >= self.threshold
+    
+    @property
+    def is_half_open(self) -> bool:
+        """Whether the next guarded wait may run as a trial."""
+        return (self.is_open and not self._trial_running
+                and time.monotonic() - self.last_timeout_at >= self.cooldown_s)
+    
+    def record_success(self) -> None:
+        """Close the circuit after a wait that succeeded."""
+        if self.consecutive_timeouts:
+            logger.debug("Circuit breaker reset")
+        self.consecutive_timeouts = 0
+    
+    def record_timeout(self) -> None:
+        """Count a timed-out wait, opening the circuit at the threshold."""
+        self.consecutive_timeouts += 1
+        self.last_timeout_at = time.monotonic()
+        if self.is_open:
+            logger.error(f"Circuit breaker open after {self.consecutive_timeouts} consecutive timeouts")
+    
+    async def call(self, action: Awaitable[T], description: str) -> T:
+        """Await a Playwright wait through the breaker.
+        
+        Args:
+            action: The wait (not yet awaited)
+            description: What is being waited for, used in the error
+        
+        Returns:
+            The action's result
+        """
+        trial = self.is_half_open
+        if self.is_open and not trial:
+            action.close()
+            raise CircuitOpenError(
+                f"Not waiting for {description}: {self.consecutive_timeouts} consecutive "
+                f"timeouts, the site looks unavailable"
+            )
+        if trial:
+            logger.info("Circuit breaker half-open, trying {}", description)
+            self._trial_running = True
+        try:
+            result = await action
+        except PlaywrightTimeoutError:
+            self.record_timeout()
+            raise
+        finally:
+            if trial:
+                self._trial_running = False
+        self.record_success()
+        return result
+
+
+# One breaker per browser context unless a caller attaches a shared one
+_context_breakers: "WeakKeyDictionary[BrowserContext, CircuitBreaker]" = WeakKeyDictionary()
+
+
+def breaker_for(context: BrowserContext) -> CircuitBreaker:
+    """The circuit breaker guarding a context's pages.
+    
+    Args:
+        context: Browser context
+    
+    Returns:
+        The attached breaker, or a new one from the config settings
+    """
+    breaker = _context_breakers.get(context)
+    if breaker is None:
+        breaker = CircuitBreaker(config.circuit_breaker_threshold, config.circuit_breaker_cooldown)
+        _context_breakers[context] = breaker
+    return breaker
+
+
+def attach_breaker(context: BrowserContext, breaker: CircuitBreaker) -> None:
+    """Make every page object on a context use the given breaker.
+    
+    Args:
+        context: Browser context
+        breaker: Breaker to share, e.g. one per pytest session
+    """
+    _context_breakers[context] = breaker
+
+
+class ResultsCapture:
+    """Response captured by BasePage.expect_results.
+    
+    Attributes are filled in when the ``async with`` block exits.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty capture."""
+        self.response: Optional[Response] = None
+        self.payload: Optional[Any] = None
+    
+    @property
+    def results(self) -> List[dict]:
+        """Result items from the captured payload (empty if nothing was captured)."""
+        if isinstance(self.payload, dict):
+            return self.payload.get("results") or []
+        return []
 
 
 class BasePage:
     """Base page class for all page objects."""
     
-    def __init__(self, page: Page) -> None:
+    # Winning selector per (layout, candidates), shared for the session (see resolve)
+    resolved_selectors: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+    # Bump in a subclass when the site's markup changes under the same URL
+    layout_version = ""
+    
+    def __init__(self, page: Page, breaker: Optional[CircuitBreaker] = None) -> None:
         """Initialize base page.
         
         Args:
             page: Playwright page instance
+            breaker: Circuit breaker for guarded waits, defaults to the one
+                of the page's context (see breaker_for)
         """
         self.page = page
+        self.breaker = breaker or breaker_for(page.context)
         self.timeout = 30000  # 30 seconds default timeout
+        
+        # Settle defaults - subclasses point these at their results grid
+        self.settle_container = "body"
+        self.settle_count_locator: Optional[str] = None
+        self.settle_url_pattern: Optional[Pattern[str]] = None
+        self.settle_quiet_ms = 150
+        self.settle_poll_ms = 50
     
-    async def navigate_to(self, url: str) -> None:
+    @timed_action("navigate")
+    async def navigate_to(self, url: str, wait_until: str = "networkidle") -> None:
         """Navigate to a specific URL.
         
         Args:
             url: URL to navigate to
+            wait_until: Load event to wait for
         """
-        logger.info(f"Navigating to: {url}")
-        await self.page.goto(url, wait_until="networkidle")
+        logger.info("Navigating to: {}", url)
+        await self.breaker.call(self.page.goto(url, wait_until=wait_until), url)
         await self.page.wait_for_load_state("domcontentloaded")
     
     async def click_element(self, locator: str, timeout: Optional[int] = None) -> None:
@@ -36,8 +239,8 @@ class BasePage:
             timeout: Optional timeout override
         """
         timeout = timeout or self.timeout
-        logger.info(f"Clicking element: {locator}")
-        await self.page.locator(locator).click(timeout=timeout)
+        logger.debug("Clicking element: {}", locator)
+        await self.breaker.call(self.page.locator(locator).click(timeout=timeout), locator)
     
     async def fill_input(self, locator: str, text: str, timeout: Optional[int] = None) -> None:
         """Fill input field.
@@ -48,8 +251,8 @@ class BasePage:
             timeout: Optional timeout override
         """
         timeout = timeout or self.timeout
-        logger.info(f"Filling input {locator} with: {text}")
-        await self.page.locator(locator).fill(text, timeout=timeout)
+        logger.debug("Filling input {} with: {}", locator, text)
+        await self.breaker.call(self.page.locator(locator).fill(text, timeout=timeout), locator)
     
     async def get_text(self, locator: str, timeout: Optional[int] = None) -> str:
         """Get text from element.
@@ -57,13 +260,13 @@ class BasePage:
         Args:
             locator: Element locator
             timeout: Optional timeout override
-            
+        
         Returns:
             Element text content
         """
         timeout = timeout or self.timeout
         element = self.page.locator(locator)
-        await element.wait_for(state="visible", timeout=timeout)
+        await self.breaker.call(element.wait_for(state="visible", timeout=timeout), locator)
         return await element.text_content()
     
     async def wait_for_element(self, locator: str, state: str = "visible", timeout: Optional[int] = None) -> Locator:
@@ -73,27 +276,49 @@ class BasePage:
             locator: Element locator
             state: Element state to wait for
             timeout: Optional timeout override
-            
+        
         Returns:
             Locator object
         """
         timeout = timeout or self.timeout
         element = self.page.locator(locator)
-        await element.wait_for(state=state, timeout=timeout)
+        await self.breaker.call(element.wait_for(state=state, timeout=timeout), locator)
         return element
     
+    async def wait_for_selector(self, selector: str, timeout: Optional[int] = None) -> None:
+        """Wait for the first element matching a selector to be visible.
+        
+        Unlike wait_for_element this is not strict, so selectors matching
+        several elements are fine.
+        
+        Args:
+            selector: Element selector
+            timeout: Optional timeout override
+        """
+        await self.breaker.call(self.page.wait_for_selector(selector, timeout=timeout or self.timeout), selector)
+    
+    async def click_selector(self, selector: str, timeout: Optional[int] = None) -> None:
+        """Click the first element matching a selector (not strict).
+        
+        Args:
+            selector: Element selector
+            timeout: Optional timeout override
+        """
+        await self.breaker.call(self.page.click(selector, timeout=timeout or self.timeout), selector)
+    
     async def is_visible(self, locator: str, timeout: Optional[int] = None) -> bool:
         """Check if element is visible.
         
         Args:
             locator: Element locator
             timeout: Optional timeout override
-            
+        
         Returns:
             True if visible, False otherwise
         """
+        # A missing element is an answer here, not a timeout for the breaker
         try:
-            await self.wait_for_element(locator, "visible", timeout or 5000)
+            await self.page.locator(locator).wait_for(state="visible", timeout=timeout or 5000)
             return True
         except Exception:
             return False
@@ -103,12 +328,52 @@ class BasePage:
         
         Args:
             locator: Element locator
-            
+        
         Returns:
             Number of matching elements
         """
         return await self.page.locator(locator).count()
     
+    def _layout_key(self) -> str:
+        """Origin and path of the current page plus the layout version."""
+        url = urlsplit(self.page.url)
+        return f"{url.scheme}://{url.netloc}{url.path}#{self.layout_version}"
+    
+    async def resolve(self, *candidates: str, verify: bool = False, refresh: bool = False) -> Optional[str]:
+        """Find which of several alternative selectors matches the page.
+        
+        All candidates are counted concurrently and the first one in the
+        given order with a match wins. The winner is remembered for this
+        URL and layout version for the rest of the session, so later calls
+        return it without probing.
+        
+        Args:
+            *candidates: Selectors in order of preference
+            verify: On a remembered winner, count it once and re-probe if it
+                no longer matches (for presence checks)
+            refresh: Ignore the remembered winner
+            
+        Returns:
+            The winning selector, or None if none matches
+        """
+        candidates = tuple(dict.fromkeys(candidates))
+        key = (self._layout_key(), candidates)
+        winner = None if refresh else self.resolved_selectors.get(key)
+        if winner is not None:
+            if not verify or await self.page.locator(winner).count() > 0:
+                return winner
+        
+        counts = await asyncio.gather(*(self.page.locator(c).count() for c in candidates),
+                                      return_exceptions=True)
+        for candidate, count in zip(candidates, counts):
+            if isinstance(count, int) and count > 0:
+                self.resolved_selectors[key] = candidate
+                logger.debug("Resolved {} for {}", candidate, key[0])
+                return candidate
+        # Misses are not remembered: the element may still appear
+        self.resolved_selectors.pop(key, None)
+        return None
+    
     async def scroll_to_element(self, locator: str) -> None:
         """Scroll element into view.
         
@@ -117,19 +382,20 @@ class BasePage:
         """
         await self.page.locator(locator).scroll_into_view_if_needed()
     
-    async def take_screenshot(self, name: str) -> str:
-        """Take screenshot and save it.
+    async def take_screenshot(self, name: str) -> Optional[str]:
+        """Take a screenshot through the artifact pipeline.
+        
+        Only the capture is awaited; the file is written in the background.
+        Whether it is kept depends on SCREENSHOT_MODE, and calls made while
+        handling an exception count as failure screenshots.
         
         Args:
             name: Screenshot name
-            
+        
         Returns:
-            Screenshot file path
+            Screenshot file path, or None if the mode skipped it
         """
-        screenshot_path = f"reports/screenshots/{name}.png"
-        await self.page.screenshot(path=screenshot_path)
-        logger.info(f"Screenshot saved: {screenshot_path}")
-        return screenshot_path
+        return await artifacts.capture(self.page, name)
     
     async def wait_for_network_idle(self, timeout: Optional[int] = None) -> None:
         """Wait for network to be idle.
@@ -139,6 +405,190 @@ class BasePage:
         """
         await self.page.wait_for_load_state("networkidle", timeout=timeout or self.timeout)
     
+    @asynccontextmanager
+    async def settle(self,
+                     timeout: Optional[int] = None,
+                     url_pattern: Optional[Union[str, Pattern[str]]] = None,
+                     container: Optional[str] = None,
+                     count_locator: Optional[str] = None,
+                     quiet_ms: Optional[int] = None) -> AsyncIterator[None]:
+        """Wait for the page to settle after the wrapped action.
+        
+        The page is considered settled once no matching request is in flight
+        and the results container has seen no DOM mutation (and the watched
+        element count has not changed) for ``quiet_ms``. The quiet period
+        counts from the end of the action and from the last tracked request
+        finishing, never from before the action, so a slow action whose
+        request has not started yet is not taken as settled. The wait is bounded
+        by ``timeout``; hitting the bound is logged, not raised, so callers
+        behave like the fixed sleeps this replaces.
+        
+        Usage:
+            async with self.settle(timeout=5000):
+                await self.page.click(locator)
+        
+        Args:
+            timeout: Upper bound in milliseconds for the settle wait after the action
+            url_pattern: Regex (or string) matched against request URLs to track
+            container: CSS selector of the element whose mutations are watched
+            count_locator: CSS selector whose match count must be stable
+            quiet_ms: Required quiet period in milliseconds
+        """
+        timeout = timeout or self.timeout
+        pattern = url_pattern or self.settle_url_pattern
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        probe_args = {
+            "container": container or self.settle_container,
+            "countSelector": count_locator or self.settle_count_locator,
+            "reset": True,
+            "touch": False,
+        }
+        quiet_ms = quiet_ms if quiet_ms is not None else self.settle_quiet_ms
+        
+        in_flight: set = set()
+        loop = asyncio.get_running_loop()
+        last_done = [0.0]
+        
+        def on_request(request: Request) -> None:
+            if pattern and pattern.search(request.url):
+                in_flight.add(request)
+        
+        def on_request_done(request: Request) -> None:
+            if request in in_flight:
+                in_flight.discard(request)
+                last_done[0] = loop.time()
+        
+        self.page.on("request", on_request)
+        self.page.on("requestfinished", on_request_done)
+        self.page.on("requestfailed", on_request_done)
+        
+        started = loop.time()
+        try:
+            await self._probe_settle(probe_args)
+            probe_args["reset"] = False
+            yield
+            
+            # Quiet time starts now, not at the probe taken before the action
+            await self._probe_settle({**probe_args, "touch": True})
+            deadline = loop.time() + timeout / 1000
+            while True:
+                state = await self._probe_settle(probe_args)
+                since_request_ms = (loop.time() - last_done[0]) * 1000
+                if not in_flight and state["idleMs"] >= quiet_ms and since_request_ms >= quiet_ms:
+                    logger.opt(lazy=True).debug("Settled in {:.0f} ms ({} mutations, count={})",
+                                                lambda: (loop.time() - started) * 1000,
+                                                lambda: state["mutations"], lambda: state["count"])
+                    break
+                if loop.time() >= deadline:
+                    logger.warning(f"Settle bound of {timeout} ms reached "
+                                   f"({len(in_flight)} requests in flight)")
+                    break
+                await asyncio.sleep(self.settle_poll_ms / 1000)
+        finally:
+            self.page.remove_listener("request", on_request)
+            self.page.remove_listener("requestfinished", on_request_done)
+            self.page.remove_listener("requestfailed", on_request_done)
+            try:
+                await self.page.evaluate(SETTLE_TEARDOWN_SCRIPT)
+            except Exception:
+                pass
+    
+    @asynccontextmanager
+    async def expect_results(self,
+                             url_pattern: Optional[Union[str, Pattern[str]]] = None,
+                             match: Optional[Callable[[Response], bool]] = None,
+                             timeout: Optional[int] = None,
+                             optional: bool = False) -> AsyncIterator[ResultsCapture]:
+        """Capture the results response triggered by the wrapped action.
+        
+        The ``page.expect_response`` predicate is registered before the block
+        runs, so a response fired by the action itself cannot be missed. On
+        exit the JSON body is parsed into ``capture.payload``. If no matching
+        response arrives within ``timeout`` the capture stays empty and a
+        warning is logged.
+        
+        With ``optional=True`` an action that issued no matching request by
+        the time the block exits (e.g. re-selecting the current filter)
+        returns an empty capture immediately. Only use it when the block
+        already waits for the page to settle.
+        
+        Usage:
+            async with self.expect_results() as capture:
+                await self.page.click(locator)
+            movies = capture.results
+        
+        Args:
+            url_pattern: Regex (or string) matched against response URLs
+            match: Optional extra predicate on the matching response
+            timeout: Optional timeout override in milliseconds
+            optional: Skip the wait when the action issued no matching request
+        """
+        pattern = url_pattern or self.settle_url_pattern
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        if pattern is None:
+            raise ValueError("expect_results() needs a url_pattern")
+        
+        def predicate(response: Response) -> bool:
+            return bool(pattern.search(response.url)) and (match is None or match(response))
+        
+        requested: List[str] = []
+        
+        def on_request(request: Request) -> None:
+            if pattern.search(request.url):
+                requested.append(request.url)
+        
+        capture = ResultsCapture()
+        manager = self.page.expect_response(predicate, timeout=timeout or self.timeout)
+        response_info = await manager.__aenter__()
+        self.page.on("request", on_request)
+        try:
+            yield capture
+        except BaseException as e:
+            await manager.__aexit__(type(e), e, e.__traceback__)
+            raise
+        finally:
+            self.page.remove_listener("request", on_request)
+        
+        if optional and not requested:
+            logger.debug("Action issued no results request - nothing to capture")
+            cancelled = asyncio.CancelledError()
+            await manager.__aexit__(type(cancelled), cancelled, None)
+            return
+        
+        try:
+            capture.response = await response_info.value
+        except PlaywrightTimeoutError:
+            logger.warning(f"No response matching {pattern.pattern} after action")
+            return
+        
+        try:
+            capture.payload = await capture.response.json()
+        except Exception as e:
+            logger.warning(f"Could not parse results payload from {capture.response.url}: {e}")
+        logger.debug("Captured {} results from {}", len(capture.results), capture.response.url)
+    
+    async def _probe_settle(self, probe_args: dict) -> dict:
+        """Run the settle probe, re-arming it if the document was replaced.
+        
+        Args:
+            probe_args: Arguments for SETTLE_PROBE_SCRIPT
+        
+        Returns:
+            Probe state with idleMs, mutations and count
+        """
+        try:
+            return await self.page.evaluate(SETTLE_PROBE_SCRIPT, probe_args)
+        except Exception as e:
+            # Execution context destroyed by a navigation - start a fresh window
+            logger.debug("Settle probe re-armed after: {}", e)
+            try:
+                return await self.page.evaluate(SETTLE_PROBE_SCRIPT, {**probe_args, "reset": True})
+            except Exception:
+                # Still navigating - report "just changed" and poll again
+                return {"idleMs": 0, "mutations": 0, "count": -1}
+    
     async def hover_element(self, locator: str) -> None:
         """Hover over element.
         
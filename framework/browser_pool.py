@@ -0,0 +1,175 @@
+"""Per-worker browser pool with reusable contexts."""
+
+import os
+from typing import Awaitable, Callable, Dict, List, Optional
+from playwright.async_api import Browser, BrowserContext, Page
+from config.settings import config
+from framework.asset_cache import AssetCache, WarmSnapshot
+from framework.playwright_manager import PlaywrightManager
+from loguru import logger
+
+
+# Clears web storage for whatever origin a page was left on
+CLEAR_STORAGE_SCRIPT = """
+() => {
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+}
+"""
+
+
+class BrowserPool:
+    """Keeps one browser per process and recycles contexts between tests.
+    
+    Under pytest-xdist every worker is its own process with its own session,
+    so a session-scoped pool gives exactly one browser per worker. Contexts
+    created without custom options are reset and parked on release, which
+    keeps their HTTP cache warm for the next test.
+    """
+    
+    def __init__(self,
+                 manager: Optional[PlaywrightManager] = None,
+                 max_idle_contexts: Optional[int] = None) -> None:
+        """Initialize BrowserPool.
+        
+        Args:
+            manager: PlaywrightManager to launch the browser with
+            max_idle_contexts: Number of released contexts kept for reuse
+        """
+        self.manager = manager or PlaywrightManager()
+        self.max_idle_contexts = (max_idle_contexts if max_idle_contexts is not None
+                                  else config.pool_max_idle_contexts)
+        self.worker_id = os.getenv("PYTEST_XDIST_WORKER", "master")
+        self._idle: List[BrowserContext] = []
+        self._reusable: Dict[BrowserContext, bool] = {}
+        self._snapshots: Dict[str, WarmSnapshot] = {}
+    
+    @property
+    def browser(self) -> Optional[Browser]:
+        """Browser owned by this pool."""
+        return self.manager.browser
+    
+    async def start(self,
+                    browser_name: Optional[str] = None,
+                    headless: Optional[bool] = None) -> Browser:
+        """Start Playwright and launch the worker's browser.
+        
+        Args:
+            browser_name: Browser to launch, defaults to config.browser
+            headless: Headless override, defaults to config.headless
+        
+        Returns:
+            Browser instance
+        """
+        if self.manager.browser:
+            return self.manager.browser
+        await self.manager.start_playwright()
+        browser = await self.manager.launch_browser(browser_name=browser_name, headless=headless)
+        logger.info(f"Browser pool ready on worker {self.worker_id}")
+        return browser
+    
+    async def acquire_context(self, fresh: bool = False, **options) -> BrowserContext:
+        """Get a context, reusing a warm one when no custom options are given.
+        
+        Args:
+            fresh: Always create a new context (empty HTTP cache), e.g. for
+                cold-load measurements; it is pooled afterwards like any other
+            **options: Context options; any option makes the context single-use
+        
+        Returns:
+            BrowserContext instance
+        """
+        if not fresh and not options and self._idle:
+            context = self._idle.pop()
+            logger.debug(f"Reusing warm context ({len(self._idle)} idle left)")
+            return context
+        
+        context = await self.manager.create_context(**options)
+        self._reusable[context] = not options
+        return context
+    
+    async def release_context(self, context: BrowserContext) -> None:
+        """Return a context to the pool, or close it if it cannot be reused.
+        
+        Args:
+            context: Context previously returned by acquire_context
+        """
+        reusable = self._reusable.get(context, False)
+        if reusable and len(self._idle) < self.max_idle_contexts:
+            try:
+                await self._reset_context(context)
+                self._idle.append(context)
+                return
+            except Exception as e:
+                logger.warning(f"Context reset failed, closing it instead: {e}")
+        
+        self._reusable.pop(context, None)
+        await context.close()
+    
+    async def snapshot(self,
+                       name: str,
+                       prime: Callable[[Page], Awaitable[None]]) -> WarmSnapshot:
+        """Get (priming on first use) a named warm snapshot.
+        
+        The first call opens a throwaway context, records every cacheable
+        response while ``prime`` drives the page, then keeps the resulting
+        storage state and asset cache for the rest of the session.
+        
+        Args:
+            name: Snapshot key, e.g. "home"
+            prime: Coroutine function that brings a page into the wanted state
+            
+        Returns:
+            WarmSnapshot for ``acquire_context(**snapshot.context_options())``
+        """
+        if name in self._snapshots:
+            return self._snapshots[name]
+        
+        asset_cache = AssetCache()
+        context = await self.manager.create_context()
+        try:
+            asset_cache.record(context)
+            page = await context.new_page()
+            await prime(page)
+            await asset_cache.drain()
+            snapshot = WarmSnapshot(
+                storage_state=await context.storage_state(),
+                asset_cache=asset_cache,
+                url=page.url
+            )
+        finally:
+            await context.close()
+        
+        logger.info(f"Primed '{name}' snapshot: {len(asset_cache.entries)} responses, "
+                    f"{asset_cache.size / 1024:.0f} KiB")
+        self._snapshots[name] = snapshot
+        return snapshot
+    
+    async def _reset_context(self, context: BrowserContext) -> None:
+        """Drop per-test state while keeping the HTTP cache.
+        
+        Args:
+            context: Context to reset
+        """
+        for page in context.pages:
+            try:
+                await page.evaluate(CLEAR_STORAGE_SCRIPT)
+            except Exception:
+                pass
+            await page.close()
+        await context.clear_cookies()
+        await context.clear_permissions()
+    
+    async def close(self) -> None:
+        """Close every pooled context and shut the browser down."""
+        for context in list(self._reusable):
+            try:
+                await context.close()
+            except Exception:
+                pass
+        self._idle.clear()
+        self._reusable.clear()
+        # Contexts are owned by the pool, not the manager
+        self.manager.context = None
+        await self.manager.cleanup()
+        logger.info(f"Browser pool closed on worker {self.worker_id}")
@@ -0,0 +1,340 @@
+"""Local stand-in for the TMDB v3 API used by the API tests."""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from loguru import logger
+
+
+CATALOG_PATH = Path(__file__).parent / "data" / "catalog.json"
+PAGE_SIZE = 20
+
+# TMDB-style error bodies
+NOT_FOUND = {"success": False, "status_code": 34,
+             "status_message": "The resource you requested could not be found."}
+INVALID_KEY = {"success": False, "status_code": 7,
+               "status_message": "Invalid API key: You must be granted a valid key."}
+INVALID_PARAMS = {"success": False, "status_code": 22,
+                  "status_message": "Invalid parameters: Your request parameters are incorrect."}
+INJECTED_ERRORS = {
+    429: {"success": False, "status_code": 25,
+          "status_message": "Your request count (#) is over the allowed limit of (40)."},
+    500: {"success": False, "status_code": 11, "status_message": "Internal error: Something went wrong."},
+    503: {"success": False, "status_code": 9,
+          "status_message": "Service offline: This service is temporarily offline."},
+}
+
+
+def load_catalog(path: Path = CATALOG_PATH) -> Dict[str, Any]:
+    """Load the bundled fixture catalog.
+    
+    Args:
+        path: Catalog JSON file
+    
+    Returns:
+        Catalog with "genres", "movies" and "tv" keys
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _first(params: Dict[str, List[str]], *keys: str) -> Optional[str]:
+    """First value of the first key present in the query parameters."""
+    for key in keys:
+        if params.get(key):
+            return params[key][0]
+    return None
+
+
+def _paged(items: List[dict], params: Dict[str, List[str]]) -> dict:
+    """Slice items into a TMDB paged response."""
+    page = max(int(_first(params, "page") or 1), 1)
+    start = (page - 1) * PAGE_SIZE
+    total_pages = (len(items) + PAGE_SIZE - 1) // PAGE_SIZE
+    return {
+        "page": page,
+        "results": items[start:start + PAGE_SIZE],
+        "total_pages": total_pages,
+        "total_results": len(items),
+    }
+
+
+class FakeTMDBServer:
+    """Threaded HTTP server answering a subset of the TMDB v3 API.
+    
+    Supported endpoints (all under ``/3``): ``/movie/popular``,
+    ``/discover/movie``, ``/discover/tv``, ``/search/multi`` and
+    ``/genre/{movie,tv}/list``.
+    
+    Latency and errors can be injected for the whole server through the
+    constructor attributes, or per request with the ``X-Fake-Latency-Ms``
+    and ``X-Fake-Status`` headers.
+    
+    Usage:
+        with FakeTMDBServer(latency_ms=20) as server:
+            requests.get(f"{server.base_url}/movie/popular")
+    """
+    
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency_ms: float = 0,
+                 jitter_ms: float = 0,
+                 error_rate: float = 0.0,
+                 error_status: int = 500,
+                 require_api_key: bool = False,
+                 seed: int = 0,
+                 catalog: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize FakeTMDBServer.
+        
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free one
+            latency_ms: Fixed delay added to every response
+            jitter_ms: Random extra delay up to this many milliseconds
+            error_rate: Probability (0-1) of answering with ``error_status``
+            error_status: Status code used for injected errors
+            require_api_key: Answer 401 when no api_key/Authorization is sent
+            seed: Seed for the latency/error random generator
+            catalog: Fixture data, defaults to the bundled catalog
+        """
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.require_api_key = require_api_key
+        self.catalog = catalog or load_catalog()
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        """Base URL equivalent to ``https://api.themoviedb.org/3``."""
+        return f"http://{self.host}:{self.port}/3"
+    
+    def start(self) -> "FakeTMDBServer":
+        """Start serving in a background thread.
+        
+        Returns:
+            The server itself
+        """
+        handler = type("FakeTMDBHandler", (_FakeTMDBHandler,), {"fake": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Fake TMDB API listening on {self.base_url}")
+        return self
+    
+    def stop(self) -> None:
+        """Stop the server and wait for the thread to exit."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            logger.info("Fake TMDB API stopped")
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+    
+    def __enter__(self) -> "FakeTMDBServer":
+        return self.start()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+    
+    def injected_delay(self, header_value: Optional[str]) -> float:
+        """Delay in seconds for one request.
+        
+        Args:
+            header_value: Value of X-Fake-Latency-Ms, if sent
+            
+        Returns:
+            Delay in seconds
+        """
+        if header_value is not None:
+            return float(header_value) / 1000
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        return (self.latency_ms + jitter) / 1000
+    
+    def injected_status(self, header_value: Optional[str]) -> Optional[int]:
+        """Error status to answer with for one request, or None.
+        
+        Args:
+            header_value: Value of X-Fake-Status, if sent
+            
+        Returns:
+            Status code or None
+        """
+        if header_value is not None:
+            return int(header_value)
+        if self.error_rate:
+            with self._lock:
+                if self._random.random() < self.error_rate:
+                    return self.error_status
+        return None
+    
+    def route(self, path: str, params: Dict[str, List[str]]) -> Tuple[int, dict]:
+        """Answer an API path.
+        
+        Args:
+            path: Request path, e.g. "/3/discover/movie"
+            params: Parsed query parameters
+        
+        Returns:
+            (status, body) tuple
+        """
+        path = path.rstrip("/")
+        if path.startswith("/3"):
+            path = path[2:]
+        
+        if path == "/movie/popular":
+            return 200, _paged(self._sorted(self.catalog["movies"], "popularity.desc"), params)
+        if path in ("/discover/movie", "/discover/tv"):
+            media = "movie" if path.endswith("movie") else "tv"
+            return 200, _paged(self.discover(media, params), params)
+        if path == "/search/multi":
+            return 200, _paged(self.search(_first(params, "query") or ""), params)
+        if path in ("/genre/movie/list", "/genre/tv/list"):
+            media = path.split("/")[2]
+            return 200, {"genres": self.catalog["genres"][media]}
+        return 404, NOT_FOUND
+    
+    def discover(self, media: str, params: Dict[str, List[str]]) -> List[dict]:
+        """Filter the catalog like TMDB's discover endpoints.
+        
+        Args:
+            media: "movie" or "tv"
+            params: Parsed query parameters
+        
+        Returns:
+            Matching items, sorted per ``sort_by``
+        """
+        items = self.catalog["movies"] if media == "movie" else self.catalog["tv"]
+        date_key = "release_date" if media == "movie" else "first_air_date"
+        date_prefix = "primary_release_date" if media == "movie" else "first_air_date"
+        
+        genres = _first(params, "with_genres")
+        wanted = {int(g) for g in genres.replace("|", ",").split(",") if g} if genres else set()
+        any_genre = genres is not None and "|" in genres
+        date_gte = _first(params, f"{date_prefix}.gte", "release_date.gte")
+        date_lte = _first(params, f"{date_prefix}.lte", "release_date.lte")
+        year = _first(params, "primary_release_year", "first_air_date_year", "year")
+        min_vote = _first(params, "vote_average.gte")
+        max_vote = _first(params, "vote_average.lte")
+        
+        results = []
+        for item in items:
+            item_genres = set(item["genre_ids"])
+            if wanted and not (item_genres & wanted if any_genre else wanted <= item_genres):
+                continue
+            date = item[date_key]
+            if date_gte and date < date_gte:
+                continue
+            if date_lte and date > date_lte:
+                continue
+            if year and not date.startswith(year):
+                continue
+            if min_vote and item["vote_average"] < float(min_vote):
+                continue
+            if max_vote and item["vote_average"] > float(max_vote):
+                continue
+            results.append(item)
+        return self._sorted(results, _first(params, "sort_by") or "popularity.desc")
+    
+    def search(self, query: str) -> List[dict]:
+        """Case-insensitive title search across movies and TV.
+        
+        Args:
+            query: Search term
+        
+        Returns:
+            Matching items tagged with ``media_type``
+        """
+        needle = query.strip().lower()
+        if not needle:
+            return []
+        results = [{**m, "media_type": "movie"} for m in self.catalog["movies"]
+                   if needle in m["title"].lower()]
+        results += [{**t, "media_type": "tv"} for t in self.catalog["tv"]
+                    if needle in t["name"].lower()]
+        return self._sorted(results, "popularity.desc")
+    
+    @staticmethod
+    def _sorted(items: List[dict], sort_by: str) -> List[dict]:
+        """Sort items by a TMDB ``field.direction`` spec."""
+        field, _, direction = sort_by.partition(".")
+        if field in ("primary_release_date", "release_date", "first_air_date"):
+            key = lambda item: item.get("release_date") or item.get("first_air_date") or ""
+        else:
+            key = lambda item: item.get(field, 0)
+        return sorted(items, key=key, reverse=direction != "asc")
+
+
+class _FakeTMDBHandler(BaseHTTPRequestHandler):
+    """Request handler bound to a FakeTMDBServer via the ``fake`` attribute."""
+    
+    fake: FakeTMDBServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY every
+    # keep-alive response waits on the client's delayed ACK (~40ms)
+    disable_nagle_algorithm = True
+    
+    def do_GET(self) -> None:
+        try:
+            self._handle_get()
+        except ValueError as e:
+            # Malformed page/genre/vote/header values: answer like TMDB
+            # instead of dropping the connection
+            logger.debug(f"Fake TMDB: invalid parameters in {self.path}: {e}")
+            self._send(422, INVALID_PARAMS)
+    
+    def _handle_get(self) -> None:
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+        fake = self.fake
+        with fake._lock:
+            fake.request_count += 1
+        
+        delay = fake.injected_delay(self.headers.get("X-Fake-Latency-Ms"))
+        if delay:
+            time.sleep(delay)
+        
+        status = fake.injected_status(self.headers.get("X-Fake-Status"))
+        if status:
+            body = INJECTED_ERRORS.get(status, {"success": False, "status_code": status,
+                                                "status_message": "Injected error"})
+            self._send(status, body, {"Retry-After": "1"} if status == 429 else None)
+            return
+        
+        if (fake.require_api_key and not params.get("api_key")
+                and not self.headers.get("Authorization")):
+            self._send(401, INVALID_KEY)
+            return
+        
+        self._send(*fake.route(parsed.path, params))
+    
+    def _send(self, status: int, body: dict, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"Fake TMDB: {format % args}")
@@ -0,0 +1,286 @@
+"""Data-driven filter combinations with n-wise (pairwise by default) reduction.
+
+The values to cross live in ``config/filter_matrix.yaml``. Instead of the
+full cartesian product, ``n_wise`` picks a small set of scenarios in which
+every combination of ``strength`` filter values still appears at least
+once (a greedy covering array). ``run_matrix`` opens each scenario through
+``HomePage.open_with_filters`` on pooled pages, checks the API results and
+every card against the filters (and against each other), and records
+per-scenario latency for the report.
+"""
+
+import itertools
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import yaml
+from loguru import logger
+from pages.models import GENRE_IDS, genre_id, normalize_content_type
+from pages.oracle import compare_results
+
+if TYPE_CHECKING:
+    from framework.page_pool import PagePool
+    from pages.home_page import HomePage
+
+
+DEFAULT_MATRIX_FILE = Path(__file__).resolve().parent.parent / "config" / "filter_matrix.yaml"
+
+
+@dataclass(frozen=True)
+class FilterScenario:
+    """One combination of sidebar filters; None means the filter is not set."""
+    content_type: Optional[str] = None
+    genre: Optional[str] = None
+    year_range: Optional[Tuple[int, int]] = None
+    rating: Optional[int] = None
+    
+    @property
+    def id(self) -> str:
+        """Readable id, e.g. "movie|Comedy|2020-2023|7+"."""
+        years = f"{self.year_range[0]}-{self.year_range[1]}" if self.year_range else None
+        rating = f"{self.rating}+" if self.rating else None
+        return "|".join(str(part) if part else "-" for part in (self.content_type, self.genre, years, rating))
+    
+    def open_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for HomePage.open_with_filters."""
+        year_from, year_to = self.year_range or (None, None)
+        return {"content_type": self.content_type, "genre": self.genre,
+                "year_from": year_from, "year_to": year_to, "rating": self.rating}
+
+
+@dataclass
+class ScenarioResult:
+    """Outcome and latency of one executed scenario."""
+    scenario: str
+    filters: Dict[str, Any]
+    passed: bool
+    latency_ms: float
+    result_count: int = 0
+    failures: List[str] = field(default_factory=list)
+
+
+def payload_failures(scenario: FilterScenario, payload: Dict[str, Any]) -> List[str]:
+    """Check the API results themselves against a scenario's filters.
+    
+    Args:
+        scenario: Filters the request was made with
+        payload: discover JSON answered for it
+    
+    Returns:
+        One message per violated filter
+    """
+    items = payload.get("results") or []
+    media = normalize_content_type(scenario.content_type) if scenario.content_type else None
+    failures = []
+    if media:
+        date_key = "release_date" if media == "movie" else "first_air_date"
+        wrong_type = [item.get("id") for item in items if date_key not in item]
+        if wrong_type:
+            failures.append(f"API returned {len(wrong_type)} results that are not {scenario.content_type}")
+    if scenario.genre:
+        wanted = genre_id(scenario.genre, media or "movie")
+        without = [item.get("id") for item in items if wanted not in (item.get("genre_ids") or [])]
+        if without:
+            failures.append(f"API returned {len(without)} results without {scenario.genre}")
+    if scenario.year_range:
+        year_from, year_to = scenario.year_range
+        years = [(item.get("release_date") or item.get("first_air_date") or "")[:4] for item in items]
+        outside = [year for year in years if not (year.isdigit() and year_from <= int(year) <= year_to)]
+        if outside:
+            failures.append(f"API returned {len(outside)} results outside {year_from}-{year_to}")
+    if scenario.rating:
+        below = [item.get("id") for item in items if (item.get("vote_average") or 0) < scenario.rating]
+        if below:
+            failures.append(f"API returned {len(below)} results rated below {scenario.rating}")
+    return failures
+
+
+def valid_filters(row: Dict[str, Any]) -> bool:
+    """Constraint: a genre must exist for the row's content type."""
+    genre, content_type = row.get("genre"), row.get("content_type")
+    if not genre or not content_type:
+        return True
+    return genre in GENRE_IDS[normalize_content_type(content_type)]
+
+
+def n_wise(dimensions: Dict[str, Sequence[Any]],
+           strength: int = 2,
+           allowed: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Dict[str, Any]]:
+    """Rows covering every combination of ``strength`` dimension values.
+    
+    Greedy and deterministic: each row starts from the first uncovered
+    combination and fills the other dimensions with the value covering the
+    most combinations still missing.
+    
+    Args:
+        dimensions: Dimension name -> values
+        strength: Dimensions combined per covered tuple (2 = pairwise);
+            at least the number of dimensions gives the full product
+        allowed: Constraint on (possibly partial) rows; disallowed
+            combinations are neither required nor generated
+    
+    Returns:
+        Rows as dimension name -> value
+    """
+    names = list(dimensions)
+    values = [list(dimensions[name]) for name in names]
+    allowed = allowed or (lambda row: True)
+    
+    def named(row: Dict[int, int]) -> Dict[str, Any]:
+        return {names[d]: values[d][v] for d, v in sorted(row.items())}
+    
+    if strength >= len(names):
+        rows = (dict(zip(names, combo)) for combo in itertools.product(*values))
+        return [row for row in rows if allowed(row)]
+    
+    uncovered = set()
+    for dims in itertools.combinations(range(len(names)), strength):
+        for picks in itertools.product(*(range(len(values[d])) for d in dims)):
+            combo = tuple(zip(dims, picks))
+            if allowed(named(dict(combo))):
+                uncovered.add(combo)
+    
+    def covers(row: Dict[int, int], combo: Tuple[Tuple[int, int], ...]) -> bool:
+        return all(row.get(d) == v for d, v in combo)
+    
+    rows = []
+    while uncovered:
+        row = dict(min(uncovered))
+        for d in range(len(names)):
+            if d in row:
+                continue
+            best, best_gain = None, -1
+            for v in range(len(values[d])):
+                candidate = {**row, d: v}
+                if not allowed(named(candidate)):
+                    continue
+                gain = sum(covers(candidate, combo) for combo in uncovered)
+                if gain > best_gain:
+                    best, best_gain = v, gain
+            if best is None:
+                raise ValueError(f"No allowed value for '{names[d]}' with {named(row)}")
+            row[d] = best
+        uncovered = {combo for combo in uncovered if not covers(row, combo)}
+        rows.append(named(row))
+    return rows
+
+
+def load_matrix(path: Optional[Union[str, Path]] = None, strength: Optional[int] = None) -> List[FilterScenario]:
+    """Scenarios for the filter matrix file.
+    
+    Args:
+        path: Matrix file, defaults to config/filter_matrix.yaml
+        strength: Override the file's strength
+    
+    Returns:
+        Reduced list of scenarios
+    """
+    path = Path(path) if path else DEFAULT_MATRIX_FILE
+    with open(path, encoding="utf-8") as f:
+        spec = yaml.safe_load(f) or {}
+    dimensions = spec["dimensions"]
+    strength = strength or spec.get("strength", 2)
+    rows = n_wise(dimensions, strength, valid_filters)
+    scenarios = [FilterScenario(
+        content_type=row.get("content_type"),
+        genre=row.get("genre"),
+        year_range=tuple(row["year_range"]) if row.get("year_range") else None,
+        rating=row.get("rating"),
+    ) for row in rows]
+    full = 1
+    for dimension_values in dimensions.values():
+        full *= len(dimension_values)
+    logger.info(f"Filter matrix {path.name}: {len(scenarios)} scenarios cover all "
+                f"{strength}-wise combinations ({full} in the full product)")
+    return scenarios
+
+
+async def check_scenario(home_page: "HomePage", scenario: FilterScenario) -> ScenarioResult:
+    """Open a scenario's results and check every card against its filters.
+    
+    Args:
+        home_page: Page object on its own page
+        scenario: Filters to apply
+    
+    Returns:
+        ScenarioResult
+    """
+    start = time.perf_counter()
+    payload = await home_page.open_with_filters(**scenario.open_kwargs())
+    latency_ms = (time.perf_counter() - start) * 1000
+    results = await home_page.get_results()
+    
+    # The card checks below skip cards lacking a field, so an empty grid or
+    # a request that was never rewritten must fail on its own
+    failures = []
+    if payload is None:
+        failures.append("filtered results response was not captured")
+    else:
+        failures += payload_failures(scenario, payload)
+        report = compare_results(payload, results)
+        if not report.ok:
+            failures.append(f"cards differ from the API results: {report.summary()}")
+    if not results:
+        failures.append("no cards rendered")
+    if scenario.content_type and results.not_of_type(scenario.content_type):
+        failures.append(f"{len(results.not_of_type(scenario.content_type))} cards not {scenario.content_type}")
+    if scenario.genre and results.not_matching_genre(scenario.genre):
+        failures.append(f"{len(results.not_matching_genre(scenario.genre))} cards without {scenario.genre}")
+    if scenario.year_range and results.outside_year_range(*scenario.year_range):
+        failures.append(f"{len(results.outside_year_range(*scenario.year_range))} cards outside "
+                        f"{scenario.year_range[0]}-{scenario.year_range[1]}")
+    if scenario.rating and results.below_rating(scenario.rating):
+        failures.append(f"{len(results.below_rating(scenario.rating))} cards rated below {scenario.rating}")
+    return ScenarioResult(scenario.id, scenario.open_kwargs(), passed=not failures,
+                          latency_ms=round(latency_ms, 1), result_count=len(results), failures=failures)
+
+
+async def run_matrix(home_page: "HomePage",
+                     scenarios: Sequence[FilterScenario],
+                     page_pool: Optional["PagePool"] = None) -> List[ScenarioResult]:
+    """Run scenarios concurrently on pooled pages.
+    
+    Args:
+        home_page: Page object whose context the scenarios run in
+        scenarios: Scenarios to run
+        page_pool: Pool to borrow pages from, see HomePage.fan_out
+    
+    Returns:
+        One result per scenario, in order; a scenario that raised fails with the error
+    """
+    outcomes = await home_page.fan_out(scenarios, check_scenario, page_pool=page_pool, wait_until=None)
+    results = []
+    for scenario, outcome in zip(scenarios, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = ScenarioResult(scenario.id, scenario.open_kwargs(), passed=False, latency_ms=0.0,
+                                     failures=[f"{type(outcome).__name__}: {outcome}"])
+        results.append(outcome)
+    return results
+
+
+def write_matrix_report(results: Sequence[ScenarioResult], path: Union[str, Path]) -> Path:
+    """Write executed scenarios, outcomes and latencies as JSON.
+    
+    Args:
+        results: Output of run_matrix
+        path: JSON file to write
+    
+    Returns:
+        Report path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    latencies = sorted(r.latency_ms for r in results if r.latency_ms)
+    path.write_text(json.dumps({
+        "scenarios": len(results),
+        "failed": sum(not r.passed for r in results),
+        "median_latency_ms": latencies[len(latencies) // 2] if latencies else None,
+        "results": [asdict(r) for r in results],
+    }, indent=2), encoding="utf-8")
+    for r in results:
+        logger.info(f"{'PASS' if r.passed else 'FAIL'} {r.scenario:<32} {r.latency_ms:>8.0f}ms "
+                    f"{r.result_count:>3} cards {'; '.join(r.failures)}")
+    logger.info(f"Filter matrix report written to {path}")
+    return path
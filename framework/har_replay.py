@@ -0,0 +1,79 @@
+"""HAR record/replay support for running UI tests without the live site."""
+
+import re
+from pathlib import Path
+from playwright.async_api import BrowserContext, Route
+from loguru import logger
+
+
+NETWORK_MODES = ("live", "record", "replay")
+
+# What happens to a request that is not in the HAR archive during replay:
+#   abort - fail the request like a network error
+#   live  - let it through to the real network
+#   stub  - answer with an empty 200 so the page keeps rendering
+HAR_FALLBACKS = ("abort", "live", "stub")
+
+
+def har_path_for(nodeid: str, har_dir: str) -> Path:
+    """Archive path for a test, grouped in one directory per test module.
+    
+    Args:
+        nodeid: Pytest node id, e.g. "tests/ui/test_search.py::TestSearch::test_x"
+        har_dir: Root directory holding the archives
+    
+    Returns:
+        Path of the test's HAR archive
+    """
+    module, _, name = nodeid.partition("::")
+    safe_name = re.sub(r"[^\w.-]+", "_", name) or "module"
+    return Path(har_dir) / Path(module).stem / f"{safe_name}.zip"
+
+
+async def _stub_route(route: Route) -> None:
+    """Answer an unmatched request with an empty 200."""
+    if route.request.resource_type in ("fetch", "xhr"):
+        await route.fulfill(status=200, content_type="application/json",
+                            body='{"page": 1, "results": [], "total_pages": 0, "total_results": 0}')
+    else:
+        await route.fulfill(status=200, body=b"")
+
+
+async def attach_har(context: BrowserContext,
+                     network_mode: str,
+                     har_path: Path,
+                     fallback: str = "abort") -> None:
+    """Record to or replay from a HAR archive in a context.
+    
+    Args:
+        context: Context to route
+        network_mode: One of NETWORK_MODES
+        har_path: Archive to write (record) or read (replay)
+        fallback: One of HAR_FALLBACKS, used for unmatched requests in replay
+    """
+    if network_mode not in NETWORK_MODES:
+        raise ValueError(f"Unsupported network mode: {network_mode}")
+    if fallback not in HAR_FALLBACKS:
+        raise ValueError(f"Unsupported HAR fallback: {fallback}")
+    
+    if network_mode == "live":
+        return
+    
+    if network_mode == "record":
+        har_path.parent.mkdir(parents=True, exist_ok=True)
+        # Written when the context closes; bodies are stored as zip entries
+        await context.route_from_har(har_path, update=True, update_content="attach")
+        logger.info(f"Recording HAR: {har_path}")
+        return
+    
+    if not har_path.exists():
+        raise FileNotFoundError(
+            f"No HAR archive at {har_path}; record it first with --network-mode=record"
+        )
+    
+    if fallback == "stub":
+        # Routes run newest first, so the HAR gets the first look
+        await context.route("**/*", _stub_route)
+    not_found = "abort" if fallback == "abort" else "fallback"
+    await context.route_from_har(har_path, not_found=not_found)
+    logger.info(f"Replaying HAR: {har_path} (fallback: {fallback})")
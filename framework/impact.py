@@ -0,0 +1,415 @@
+"""Test impact analysis: run only the tests a change can affect (pytest plugin).
+
+With ``--record-impact`` every test runs under a profiler hook that notes
+which functions in the tracked source trees (``pages/`` and
+``framework/``) it calls, fixtures included. Setup and teardown of
+class-, module- and session-scoped fixtures run only once, inside
+whichever test happens to need them first (or last), so their calls are
+recorded per fixture and charged to every test that uses the fixture.
+The result is merged into ``reports/impact_map.json``.
+
+With ``--changed-since <ref>`` the plugin diffs the working tree against
+``ref``, maps changed lines to the functions around them and keeps only
+the tests that called one of those functions. A changed locator
+assignment in an ``__init__`` counts as a change to every method reading
+that ``self.<locator>``. Changed test files select their own tests; tests
+missing from the map always run, and any change the map cannot see
+(conftest, config, requirements, ...) runs everything.
+"""
+
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import pytest
+from loguru import logger
+
+
+DEFAULT_IMPACT_MAP = "reports/impact_map.json"
+TRACKED_PATHS = ("pages/", "framework/")
+TEST_PATHS = ("tests/",)
+# Changes to these never affect test outcomes
+IGNORED_SUFFIXES = (".md",)
+
+HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class _Scope:
+    """A function's qualified name, line span and the self attributes it reads."""
+    
+    def __init__(self, qualname: str, start: int, end: int, reads: Set[str], assigns: Dict[int, str]) -> None:
+        self.qualname = qualname
+        self.start = start
+        self.end = end
+        self.reads = reads
+        self.assigns = assigns
+
+
+def _scopes(source: str) -> List[_Scope]:
+    """Every function in a module, named like ``code.co_qualname``.
+    
+    Args:
+        source: Module source
+    
+    Returns:
+        Scopes, outer functions before the functions nested in them
+    """
+    scopes: List[_Scope] = []
+    
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                visit(child, f"{prefix}{child.name}.")
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualname = f"{prefix}{child.name}"
+                start = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                reads, assigns = set(), {}
+                for sub in ast.walk(child):
+                    if (isinstance(sub, ast.Attribute) and isinstance(sub.value, ast.Name)
+                            and sub.value.id == "self"):
+                        if isinstance(sub.ctx, ast.Load):
+                            reads.add(sub.attr)
+                        else:
+                            for line in range(sub.lineno, (sub.end_lineno or sub.lineno) + 1):
+                                assigns[line] = sub.attr
+                scopes.append(_Scope(qualname, start, child.end_lineno or child.lineno, reads, assigns))
+                visit(child, f"{qualname}.<locals>.")
+    
+    visit(ast.parse(source), "")
+    return scopes
+
+
+def _changed_functions(path: str, source: Optional[str], lines: Iterable[int]) -> Tuple[Set[str], Set[str], bool]:
+    """Map changed lines of one file version to functions and locators.
+    
+    Args:
+        path: Repo-relative path, used as the function key prefix
+        source: File contents (None if the file does not exist on this side)
+        lines: Changed line numbers on this side
+    
+    Returns:
+        (changed function keys, changed self attributes, module-level change)
+    """
+    functions, attrs, module_level = set(), set(), False
+    if source is None:
+        return functions, attrs, False
+    try:
+        scopes = _scopes(source)
+    except SyntaxError:
+        return functions, attrs, True
+    for line in lines:
+        enclosing = [s for s in scopes if s.start <= line <= s.end]
+        if not enclosing:
+            module_level = True
+            continue
+        innermost = max(enclosing, key=lambda s: s.start)
+        if innermost.qualname.endswith("__init__") and line in innermost.assigns:
+            # A locator (re)definition: impact whoever reads it, not every user of __init__
+            attrs.add(innermost.assigns[line])
+        else:
+            functions.add(f"{path}::{innermost.qualname}")
+    return functions, attrs, module_level
+
+
+def _git(*args: str) -> str:
+    """Run git in the repository root and return stdout."""
+    return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def _show(ref: str, path: str) -> Optional[str]:
+    """File contents at a ref, or None if it did not exist there."""
+    try:
+        return _git("show", f"{ref}:{path}")
+    except subprocess.CalledProcessError:
+        return None
+
+
+def _read(path: str) -> Optional[str]:
+    """Working tree contents of a file, or None if it was deleted."""
+    full = ROOT / path
+    return full.read_text(encoding="utf-8") if full.exists() else None
+
+
+class ChangeSet:
+    """What changed between a git ref and the working tree."""
+    
+    def __init__(self, ref: str) -> None:
+        """Diff the working tree against a ref.
+        
+        Args:
+            ref: Any git revision, e.g. "origin/main" or "HEAD~1"
+        """
+        self.ref = ref
+        self.functions: Set[str] = set()
+        self.test_files: Set[str] = set()
+        self.unmapped_files: Set[str] = set()
+        
+        old_lines: Dict[str, List[int]] = {}
+        new_lines: Dict[str, List[int]] = {}
+        current = None
+        for line in _git("diff", "--unified=0", "--no-renames", ref, "--").splitlines():
+            if line.startswith("+++ ") or line.startswith("--- "):
+                name = line[4:].strip()
+                if name != "/dev/null":
+                    current = name[2:]
+                    old_lines.setdefault(current, [])
+                    new_lines.setdefault(current, [])
+                continue
+            match = HUNK_RE.match(line)
+            if match and current:
+                old_start, old_count, new_start, new_count = match.groups()
+                old_count = 1 if old_count is None else int(old_count)
+                new_count = 1 if new_count is None else int(new_count)
+                old_lines[current] += range(int(old_start), int(old_start) + old_count)
+                # A pure deletion still touches the scope it was cut from
+                new_lines[current] += (range(int(new_start), int(new_start) + new_count)
+                                       if new_count else [int(new_start)])
+        
+        locator_reads: Dict[str, Set[str]] = {}
+        for path in sorted(new_lines):
+            if path.endswith(IGNORED_SUFFIXES):
+                continue
+            if path.startswith(TEST_PATHS):
+                self.test_files.add(path)
+                continue
+            if not (path.startswith(TRACKED_PATHS) and path.endswith(".py")):
+                self.unmapped_files.add(path)
+                continue
+            old_source, new_source = _show(ref, path), _read(path)
+            for source, lines in ((old_source, old_lines.get(path, [])), (new_source, new_lines[path])):
+                functions, attrs, module_level = _changed_functions(path, source, lines)
+                self.functions |= functions
+                if module_level:
+                    # Imports, constants and class attributes: treat as the whole file
+                    self.functions.add(f"{path}::*")
+                if attrs and source is not None:
+                    locator_reads.setdefault(path, set()).update(attrs)
+            for attr in locator_reads.get(path, ()):
+                for scope in _scopes(new_source or old_source or ""):
+                    if attr in scope.reads:
+                        self.functions.add(f"{path}::{scope.qualname}")
+    
+    def affects(self, nodeid: str, called: Iterable[str]) -> bool:
+        """Whether a test could be affected by the change.
+        
+        Args:
+            nodeid: Pytest node id
+            called: Function keys recorded for the test
+        
+        Returns:
+            True if the test should run
+        """
+        if nodeid.split("::")[0] in self.test_files:
+            return True
+        for key in called:
+            if key in self.functions or f"{key.split('::')[0]}::*" in self.functions:
+                return True
+        return False
+
+
+class ImpactRecorder:
+    """Profiler hook collecting the tracked functions each test calls."""
+    
+    def __init__(self) -> None:
+        """Initialize ImpactRecorder."""
+        self.calls: Dict[str, Set[str]] = {}
+        self.fixture_calls: Dict[str, Set[str]] = {}
+        self._current: Optional[Set[str]] = None
+        self._stack: List[Tuple[str, Optional[Set[str]]]] = []
+        self._files: Dict[str, str] = {}
+    
+    def _relative(self, filename: str) -> str:
+        """Repo-relative path of a tracked file, "" for anything else."""
+        rel = self._files.get(filename)
+        if rel is None:
+            try:
+                rel = Path(filename).resolve().relative_to(ROOT).as_posix()
+            except ValueError:
+                rel = ""
+            if not rel.startswith(TRACKED_PATHS):
+                rel = ""
+            self._files[filename] = rel
+        return rel
+    
+    def _profile(self, frame, event, arg) -> None:
+        if event == "call" and self._current is not None:
+            rel = self._relative(frame.f_code.co_filename)
+            if rel:
+                self._current.add(f"{rel}::{frame.f_code.co_qualname}")
+    
+    def start(self, nodeid: str) -> None:
+        """Start recording calls for a test (setup, call and teardown)."""
+        self._current = self.calls.setdefault(nodeid, set())
+        sys.setprofile(self._profile)
+    
+    def stop(self) -> None:
+        """Stop recording."""
+        sys.setprofile(None)
+        self._current = None
+        self._stack.clear()
+    
+    def enter_fixture(self, name: str) -> None:
+        """Charge calls to a shared fixture until ``exit_fixture``.
+        
+        Args:
+            name: Fixture name
+        """
+        self._stack.append((name, self._current))
+        self._current = self.fixture_calls.setdefault(name, set())
+        sys.setprofile(self._profile)
+    
+    def exit_fixture(self, name: str) -> None:
+        """Go back to charging the enclosing test (or fixture).
+        
+        Args:
+            name: Fixture name passed to ``enter_fixture``
+        """
+        if self._stack and self._stack[-1][0] == name:
+            self._current = self._stack.pop()[1]
+            if self._current is None:
+                sys.setprofile(None)
+    
+    def merged(self, fixtures_by_test: Dict[str, Iterable[str]]) -> Dict[str, List[str]]:
+        """Per-test calls including the shared fixtures each test uses.
+        
+        Args:
+            fixtures_by_test: Node id -> names in the test's fixture closure
+        
+        Returns:
+            Node id -> sorted function keys
+        """
+        merged = {}
+        for nodeid, keys in self.calls.items():
+            keys = set(keys)
+            for name in fixtures_by_test.get(nodeid, ()):
+                keys |= self.fixture_calls.get(name, set())
+            merged[nodeid] = sorted(keys)
+        return merged
+
+
+def load_map(path: str) -> Dict[str, List[str]]:
+    """Read an impact map, empty if missing."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_map(path: str, impact_map: Dict[str, List[str]]) -> None:
+    """Write an impact map."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(impact_map.items())), f, indent=1)
+
+
+class ImpactPlugin:
+    """Pytest plugin object for recording the map and selecting tests."""
+    
+    def __init__(self, config, map_path: str, record: bool, changed_since: Optional[str]) -> None:
+        self.config = config
+        self.map_path = map_path
+        self.recorder = ImpactRecorder() if record else None
+        self.changed_since = changed_since
+        self.workerinput = getattr(config, "workerinput", None)
+        self.fixtures_by_test: Dict[str, List[str]] = {}
+    
+    def _partial_dir(self) -> Path:
+        return Path(self.map_path).parent / ".impact"
+    
+    def pytest_collection_modifyitems(self, config, items) -> None:
+        """Deselect tests the change cannot affect."""
+        if self.recorder:
+            self.fixtures_by_test = {item.nodeid: list(getattr(item, "fixturenames", ())) for item in items}
+        if not self.changed_since:
+            return
+        impact_map = load_map(self.map_path)
+        if not impact_map:
+            logger.warning(f"No impact map at {self.map_path}; running everything "
+                           f"(record one with --record-impact)")
+            return
+        changes = ChangeSet(self.changed_since)
+        if changes.unmapped_files:
+            logger.info(f"Changes outside the impact map ({sorted(changes.unmapped_files)}); running everything")
+            return
+        selected, deselected = [], []
+        for item in items:
+            called = impact_map.get(item.nodeid)
+            if called is None or changes.affects(item.nodeid, called):
+                selected.append(item)
+            else:
+                deselected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        logger.info(f"Impact analysis since {self.changed_since}: {len(selected)} tests selected, "
+                    f"{len(deselected)} unaffected")
+    
+    def pytest_runtest_logstart(self, nodeid, location) -> None:
+        if self.recorder:
+            self.recorder.start(nodeid)
+    
+    def pytest_runtest_logfinish(self, nodeid, location) -> None:
+        if self.recorder:
+            self.recorder.stop()
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        """Record shared fixtures' setup (and teardown) under the fixture."""
+        shared = self.recorder is not None and fixturedef.scope != "function"
+        if shared:
+            self.recorder.enter_fixture(fixturedef.argname)
+        try:
+            yield
+        finally:
+            if shared:
+                self.recorder.exit_fixture(fixturedef.argname)
+                # Finalizers run last-in first-out, so this one runs just
+                # before the fixture's own teardown
+                fixturedef.addfinalizer(lambda: self.recorder.enter_fixture(fixturedef.argname))
+    
+    def pytest_fixture_post_finalizer(self, fixturedef, request) -> None:
+        if self.recorder and fixturedef.scope != "function":
+            self.recorder.exit_fixture(fixturedef.argname)
+    
+    def pytest_sessionfinish(self, session) -> None:
+        """Merge this run's calls into the impact map."""
+        if not self.recorder:
+            return
+        calls = self.recorder.merged(self.fixtures_by_test)
+        if self.workerinput:
+            save_map(str(self._partial_dir() / f"{self.workerinput['workerid']}.json"), calls)
+            return
+        impact_map = load_map(self.map_path)
+        impact_map.update(calls)
+        for partial in sorted(self._partial_dir().glob("*.json")):
+            impact_map.update(load_map(str(partial)))
+            partial.unlink()
+        save_map(self.map_path, impact_map)
+        logger.info(f"Impact map updated for {len(impact_map)} tests: {self.map_path}")
+
+
+def pytest_addoption(parser):
+    """Register impact analysis options."""
+    group = parser.getgroup("impact", "test impact analysis")
+    group.addoption("--record-impact", action="store_true",
+                    help="Record which page-object/framework functions each test calls")
+    group.addoption("--changed-since", default=None, metavar="REF",
+                    help="Run only tests affected by changes since a git ref")
+    group.addoption("--impact-map", default=DEFAULT_IMPACT_MAP,
+                    help="JSON file holding the test -> function map")
+
+
+def pytest_configure(config):
+    """Install the impact plugin."""
+    config.pluginmanager.register(ImpactPlugin(
+        config,
+        map_path=config.getoption("--impact-map"),
+        record=config.getoption("--record-impact"),
+        changed_since=config.getoption("--changed-since"),
+    ), "impact-analysis")
@@ -0,0 +1,355 @@
+"""Load generation: HomePage flows replayed by many concurrent virtual users."""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from loguru import logger
+from config.settings import config
+from framework.timing import percentile
+
+
+CATEGORIES = ("popular", "trending", "newest", "top_rated")
+CONTENT_TYPES = ("movie", "tv_show")
+SEARCH_TERMS = ("Batman", "Spider", "Star Wars", "Avengers", "Matrix")
+GENRE_IDS = (28, 35, 18, 27, 10749)
+
+# UI scripts need a browser; api scripts drive the same flows through the
+# TMDB API client and run against the local fake server by default
+LOAD_TARGETS = ("ui", "api")
+
+
+class LoadStepError(Exception):
+    """Raised by a script when a step did not do what it should."""
+
+
+@dataclass
+class LoadSample:
+    """One timed step of one virtual user iteration."""
+    step: str
+    user: int
+    started_at: float
+    duration_ms: float
+    ok: bool
+    error: str = ""
+
+
+@dataclass
+class LoadPlan:
+    """How many users to run, how fast to start them and for how long."""
+    target: str = "api"
+    users: int = 10
+    ramp_up_s: float = 5.0
+    duration_s: float = 30.0
+    processes: int = 1
+    think_time_s: float = 0.0
+    base_url: str = ""
+    seed: int = 0
+    network_mode: str = "live"
+    har_path: Optional[str] = None
+    user_ids: List[int] = field(default_factory=list)
+    
+    def start_offset(self, user: int) -> float:
+        """Seconds after the run start at which a user begins (linear ramp).
+        
+        Args:
+            user: Zero-based user number
+        
+        Returns:
+            Start offset in seconds
+        """
+        return self.ramp_up_s * user / self.users if self.users else 0.0
+
+
+class VirtualUser:
+    """State of one simulated user, handed to the flow script."""
+    
+    def __init__(self, user: int, plan: LoadPlan, samples: List[LoadSample]) -> None:
+        """Initialize VirtualUser.
+        
+        Args:
+            user: User number
+            plan: Load plan the user runs in
+            samples: Shared list the user's steps are recorded in
+        """
+        self.user = user
+        self.plan = plan
+        self.random = random.Random(plan.seed * 100003 + user)
+        self.samples = samples
+        self.home_page = None
+        self.client = None
+    
+    @asynccontextmanager
+    async def step(self, name: str) -> AsyncIterator[None]:
+        """Time one step; a failure is recorded and ends the iteration.
+        
+        Args:
+            name: Step name in the report
+        """
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.samples.append(LoadSample(name, self.user, started_at,
+                                           (time.perf_counter() - start) * 1000, False, str(e)[:200]))
+            raise
+        self.samples.append(LoadSample(name, self.user, started_at,
+                                       (time.perf_counter() - start) * 1000, True))
+
+
+async def ui_browse(vu: VirtualUser) -> None:
+    """Browse the site like a visitor: load, category, filter, search, next page."""
+    home = vu.home_page
+    async with vu.step("navigate_home"):
+        await home.navigate_to_home()
+    async with vu.step("category"):
+        await home.select_category(vu.random.choice(CATEGORIES))
+    async with vu.step("filter"):
+        await home.apply_type_filter(vu.random.choice(CONTENT_TYPES))
+    async with vu.step("search"):
+        await home.search_movies(vu.random.choice(SEARCH_TERMS))
+    async with vu.step("paginate"):
+        if not await home.navigate_to_next_page():
+            raise LoadStepError("Next page not available")
+
+
+async def api_browse(vu: VirtualUser) -> None:
+    """The ui_browse flow expressed as the TMDB API calls behind it."""
+    client = vu.client
+    async with vu.step("category"):
+        await client.popular_movies()
+    async with vu.step("filter"):
+        media = "movie" if vu.random.choice(CONTENT_TYPES) == "movie" else "tv"
+        await client.discover(media, with_genres=vu.random.choice(GENRE_IDS))
+    async with vu.step("search"):
+        await client.search_multi(vu.random.choice(SEARCH_TERMS))
+    async with vu.step("paginate"):
+        await client.popular_movies(page=2)
+
+
+SCRIPTS: Dict[str, Callable[[VirtualUser], Awaitable[None]]] = {
+    "ui": ui_browse,
+    "api": api_browse,
+}
+
+
+async def _run_user(vu: VirtualUser, deadline: float, setup: Callable, teardown: Callable) -> None:
+    """Loop a user's script from its ramp slot until the deadline."""
+    script = SCRIPTS[vu.plan.target]
+    await asyncio.sleep(vu.plan.start_offset(vu.user))
+    try:
+        async with vu.step("setup"):
+            await setup(vu)
+    except Exception as e:
+        logger.warning(f"User {vu.user} could not start: {e}")
+        return
+    try:
+        while time.time() < deadline:
+            try:
+                await script(vu)
+            except Exception as e:
+                logger.debug(f"User {vu.user} iteration failed: {e}")
+            if vu.plan.think_time_s:
+                await asyncio.sleep(vu.plan.think_time_s)
+    finally:
+        await teardown(vu)
+
+
+async def run_users(plan: LoadPlan) -> List[LoadSample]:
+    """Run this process's share of the users until the plan's end.
+    
+    Args:
+        plan: Plan with ``user_ids`` set to the users this process runs
+    
+    Returns:
+        Recorded samples
+    """
+    samples: List[LoadSample] = []
+    deadline = time.time() + plan.ramp_up_s + plan.duration_s
+    
+    if plan.target == "api":
+        from framework.api_client import TMDBApiClient
+        async with TMDBApiClient(plan.base_url or config.api_base_url,
+                                 max_concurrency=max(len(plan.user_ids), 1),
+                                 retries=0) as client:
+            async def setup(vu: VirtualUser) -> None:
+                vu.client = client
+            
+            async def teardown(vu: VirtualUser) -> None:
+                pass
+            
+            users = [VirtualUser(u, plan, samples) for u in plan.user_ids]
+            await asyncio.gather(*(_run_user(vu, deadline, setup, teardown) for vu in users))
+        return samples
+    
+    from framework.playwright_manager import PlaywrightManager
+    from framework.base_page import CircuitBreaker
+    from pages.home_page import HomePage
+    manager = PlaywrightManager()
+    await manager.start_playwright()
+    await manager.launch_browser(headless=True)
+    try:
+        async def setup(vu: VirtualUser) -> None:
+            # One context per user, like separate visitors. Each context writes
+            # its HAR on close, so only the first user records; the others
+            # would overwrite the archive with their own traffic
+            network_mode = plan.network_mode
+            if network_mode == "record" and vu.user != 0:
+                network_mode = "live"
+            context = await manager.create_context(network_mode=network_mode,
+                                                   har_path=plan.har_path)
+            page = await context.new_page()
+            page.set_default_timeout(config.timeout)
+            # No circuit breaker: under load a slow site is the measurement
+            vu.home_page = HomePage(page, breaker=CircuitBreaker(0))
+        
+        async def teardown(vu: VirtualUser) -> None:
+            if vu.home_page:
+                await vu.home_page.page.context.close()
+        
+        users = [VirtualUser(u, plan, samples) for u in plan.user_ids]
+        await asyncio.gather(*(_run_user(vu, deadline, setup, teardown) for vu in users))
+    finally:
+        await manager.close_browser()
+        await manager.stop_playwright()
+    return samples
+
+
+def _run_process(plan: LoadPlan) -> List[Dict[str, Any]]:
+    """Process entry point: run a share of the users in a fresh event loop."""
+    return [asdict(s) for s in asyncio.run(run_users(plan))]
+
+
+def summarize(samples: List[LoadSample], wall_time_s: float) -> Dict[str, Dict[str, Any]]:
+    """Throughput, error rate and latency percentiles per step.
+    
+    Args:
+        samples: Samples from every process
+        wall_time_s: Length of the run
+    
+    Returns:
+        Step name -> statistics
+    """
+    by_step: Dict[str, List[LoadSample]] = {}
+    for sample in samples:
+        by_step.setdefault(sample.step, []).append(sample)
+    
+    summary = {}
+    for step, step_samples in by_step.items():
+        durations = [s.duration_ms for s in step_samples if s.ok]
+        errors = sum(not s.ok for s in step_samples)
+        summary[step] = {
+            "count": len(step_samples),
+            "errors": errors,
+            "error_rate": round(errors / len(step_samples), 4),
+            "throughput_per_s": round(len(step_samples) / wall_time_s, 2) if wall_time_s else 0.0,
+            "p50_ms": round(percentile(durations, 50), 1),
+            "p95_ms": round(percentile(durations, 95), 1),
+            "p99_ms": round(percentile(durations, 99), 1),
+            "max_ms": round(max(durations), 1) if durations else 0.0,
+        }
+    return summary
+
+
+def run_load(plan: LoadPlan, report_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Run a load plan, split across processes, and optionally write a report.
+    
+    Args:
+        plan: Load plan
+        report_path: JSON report to write
+    
+    Returns:
+        Report with the plan, per-step summary and wall time
+    """
+    if plan.target not in LOAD_TARGETS:
+        raise ValueError(f"Unsupported load target: {plan.target}")
+    
+    processes = max(1, min(plan.processes, plan.users))
+    shares = [LoadPlan(**{**asdict(plan), "user_ids": list(range(p, plan.users, processes))})
+              for p in range(processes)]
+    logger.info(f"Load: {plan.users} {plan.target} users over {processes} processes, "
+                f"ramp-up {plan.ramp_up_s}s, steady {plan.duration_s}s")
+    
+    start = time.time()
+    if processes == 1:
+        raw = _run_process(shares[0])
+    else:
+        with multiprocessing.get_context("spawn").Pool(processes) as pool:
+            raw = [s for share in pool.map(_run_process, shares) for s in share]
+    wall_time_s = time.time() - start
+    
+    samples = [LoadSample(**s) for s in raw]
+    report = {
+        "plan": {k: v for k, v in asdict(plan).items() if k != "user_ids"},
+        "wall_time_s": round(wall_time_s, 2),
+        "steps": summarize(samples, wall_time_s),
+    }
+    if report_path:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logger.info(f"Load report written to {report_path}")
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print the per-step summary as a table."""
+    print(f"\n📈 Load results ({report['wall_time_s']}s)")
+    print(f"{'step':<15}{'count':>8}{'err%':>8}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for step, s in report["steps"].items():
+        print(f"{step:<15}{s['count']:>8}{s['error_rate'] * 100:>7.1f}%{s['throughput_per_s']:>9}"
+              f"{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}{s['max_ms']:>9}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point used by ``run_tests.py --load``."""
+    parser = argparse.ArgumentParser(description="Replay HomePage flows with concurrent virtual users")
+    parser.add_argument("--target", choices=LOAD_TARGETS, default="api")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="Seconds to start all users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds at full load")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--think-time", type=float, default=0.0)
+    parser.add_argument("--base-url", default="", help="API base URL (api target); default is the local fake")
+    parser.add_argument("--network-mode", choices=["live", "record", "replay"], default="live")
+    parser.add_argument("--har", default=None, help="HAR archive for record/replay (ui target)")
+    parser.add_argument("--max-error-rate", type=float, default=0.05,
+                        help="Exit non-zero when any step fails more often than this")
+    parser.add_argument("--report", default="reports/load/load.json")
+    args = parser.parse_args(argv)
+    
+    plan = LoadPlan(target=args.target, users=args.users, ramp_up_s=args.ramp_up,
+                    duration_s=args.duration, processes=args.processes,
+                    think_time_s=args.think_time, base_url=args.base_url,
+                    network_mode=args.network_mode, har_path=args.har)
+    if plan.network_mode != "live" and not plan.har_path:
+        from framework.har_replay import har_path_for
+        plan.har_path = str(har_path_for(f"load::{plan.target}_browse", config.har_dir))
+    
+    fake = None
+    if plan.target == "api" and not plan.base_url and config.api_target != "live":
+        from framework.fake_tmdb.server import FakeTMDBServer
+        fake = FakeTMDBServer(latency_ms=config.fake_api_latency_ms,
+                              error_rate=config.fake_api_error_rate).start()
+        plan.base_url = fake.base_url
+    try:
+        report = run_load(plan, Path(args.report))
+    finally:
+        if fake:
+            fake.stop()
+    
+    print_report(report)
+    too_many_errors = [step for step, s in report["steps"].items() if s["error_rate"] > args.max_error_rate]
+    if too_many_errors:
+        print(f"❌ Error rate above {args.max_error_rate:.0%} for: {', '.join(too_many_errors)}")
+    return 0 if report["steps"] and not too_many_errors else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
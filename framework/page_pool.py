@@ -0,0 +1,84 @@
+"""Pool of pages sharing one browser context for concurrent checks."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+from playwright.async_api import BrowserContext, Page
+from config.settings import config
+from loguru import logger
+
+
+class PagePool:
+    """Up to ``size`` pages in one context, handed out to concurrent tasks.
+    
+    Pages share the context's cookies, storage and routes (asset cache,
+    HAR, resource policy), so independent read-only checks can run side by
+    side without paying for a new context each. Pages are kept open between
+    uses and closed with the pool.
+    
+    Usage:
+        async with pool.page() as page:
+            await HomePage(page).navigate_to_home()
+    """
+    
+    def __init__(self, context: BrowserContext, size: int = 4) -> None:
+        """Initialize PagePool.
+        
+        Args:
+            context: Context the pages are opened in
+            size: Maximum pages open at once
+        """
+        self.context = context
+        self.size = size
+        self._idle: List[Page] = []
+        self._pages: List[Page] = []
+        self._slots = asyncio.Semaphore(size)
+    
+    async def acquire(self) -> Page:
+        """Get an idle page, opening one while under ``size``.
+        
+        Returns:
+            Page instance
+        """
+        await self._slots.acquire()
+        if self._idle:
+            return self._idle.pop()
+        try:
+            page = await self.context.new_page()
+        except Exception:
+            self._slots.release()
+            raise
+        page.set_default_timeout(config.timeout)
+        self._pages.append(page)
+        logger.debug(f"Page pool opened page {len(self._pages)}/{self.size}")
+        return page
+    
+    def release(self, page: Page) -> None:
+        """Hand a page back to the pool.
+        
+        Args:
+            page: Page previously returned by acquire
+        """
+        if not page.is_closed():
+            self._idle.append(page)
+        else:
+            self._pages.remove(page)
+        self._slots.release()
+    
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Borrow a page for the duration of the block."""
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            self.release(page)
+    
+    async def close(self) -> None:
+        """Close every page the pool opened."""
+        for page in self._pages:
+            if not page.is_closed():
+                await page.close()
+        logger.debug(f"Page pool closed {len(self._pages)} pages")
+        self._pages.clear()
+        self._idle.clear()
@@ -0,0 +1,129 @@
+"""Browser performance metrics and budgets for the perf suite."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import yaml
+from loguru import logger
+
+
+# Registered before any page script runs (page.add_init_script) so LCP,
+# layout shifts and long tasks are observed from the first frame.
+PERF_OBSERVER_SCRIPT = """
+(() => {
+    if (window.__rrPerf) return;
+    const perf = window.__rrPerf = { lcp: null, shifts: [], longTasks: [] };
+    if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(2000);
+    const observe = (type, onEntry) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(onEntry))
+                .observe({ type: type, buffered: true });
+        } catch (e) { /* entry type not supported by this browser */ }
+    };
+    observe('largest-contentful-paint', (e) => { perf.lcp = e.renderTime || e.startTime; });
+    observe('layout-shift', (e) => { if (!e.hadRecentInput) perf.shifts.push({ t: e.startTime, v: e.value }); });
+    observe('longtask', (e) => { perf.longTasks.push({ t: e.startTime, d: e.duration }); });
+})();
+"""
+
+# Reads Navigation/Paint/Resource Timing plus the observer state. Counters
+# that can grow during the page's life (CLS, long tasks, requests) only
+# include entries from ``since`` (a performance.now() value) onwards.
+PERF_COLLECT_SCRIPT = """
+(since) => {
+    const perf = window.__rrPerf || { lcp: null, shifts: [], longTasks: [] };
+    const nav = performance.getEntriesByType('navigation')[0];
+    const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    const resources = performance.getEntriesByType('resource').filter((r) => r.startTime >= since);
+    const longTasks = perf.longTasks.filter((t) => t.t >= since);
+    return {
+        ttfb_ms: nav ? nav.responseStart : null,
+        dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd : null,
+        load_ms: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+        fcp_ms: fcp ? fcp.startTime : null,
+        lcp_ms: perf.lcp,
+        cls: perf.shifts.filter((s) => s.t >= since).reduce((sum, s) => sum + s.v, 0),
+        long_tasks: longTasks.length,
+        long_task_ms: longTasks.reduce((sum, t) => sum + Math.max(t.d - 50, 0), 0),
+        request_count: resources.length,
+        transfer_bytes: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+        js_heap_bytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+        duration_ms: performance.now() - since,
+        observed: !!window.__rrPerf,
+    };
+}
+"""
+
+DEFAULT_BUDGETS_FILE = Path(__file__).resolve().parent.parent / "config" / "perf_budgets.yaml"
+
+
+class PerformanceBudget:
+    """Upper bounds on performance metrics, per scenario.
+    
+    Budgets come from a YAML file mapping scenario names (home_load,
+    category_switch, ...) to ``metric: max`` pairs. A metric that the
+    browser could not measure (None) is never counted as over budget.
+    """
+    
+    def __init__(self, budgets: Dict[str, Dict[str, float]], tolerance: float = 0.0) -> None:
+        """Initialize PerformanceBudget.
+        
+        Args:
+            budgets: Scenario -> metric -> maximum allowed value
+            tolerance: Fraction a metric may exceed its budget by, e.g. 0.1 for 10%
+        """
+        self.budgets = budgets
+        self.tolerance = tolerance
+    
+    @classmethod
+    def load(cls,
+             path: Optional[Union[str, Path]] = None,
+             tolerance: float = 0.0) -> "PerformanceBudget":
+        """Load budgets from YAML.
+        
+        Args:
+            path: Budgets file, defaults to config/perf_budgets.yaml
+            tolerance: Fraction a metric may exceed its budget by
+        
+        Returns:
+            PerformanceBudget
+        """
+        path = Path(path) if path else DEFAULT_BUDGETS_FILE
+        with open(path, encoding="utf-8") as f:
+            budgets = yaml.safe_load(f) or {}
+        logger.info(f"Loaded performance budgets for {len(budgets)} scenarios from {path}")
+        return cls(budgets, tolerance)
+    
+    def violations(self, scenario: str, metrics: Dict[str, Any]) -> List[str]:
+        """Metrics of a scenario that exceed their budget.
+        
+        Args:
+            scenario: Key in the budgets file
+            metrics: Output of ``HomePage.collect_performance_metrics``
+        
+        Returns:
+            One message per metric over budget
+        """
+        if scenario not in self.budgets:
+            raise KeyError(f"No performance budget defined for scenario: {scenario}")
+        over = []
+        for metric, limit in self.budgets[scenario].items():
+            value = metrics.get(metric)
+            if value is None:
+                continue
+            if value > limit * (1 + self.tolerance):
+                over.append(f"{metric}={value:.3f} exceeds budget {limit}")
+        return over
+    
+    def assert_within(self, scenario: str, metrics: Dict[str, Any]) -> None:
+        """Fail with every over-budget metric of a scenario.
+        
+        Args:
+            scenario: Key in the budgets file
+            metrics: Output of ``HomePage.collect_performance_metrics``
+        """
+        over = self.violations(scenario, metrics)
+        if over:
+            logger.warning(f"Performance budget '{scenario}' exceeded: {over}")
+        else:
+            logger.info(f"Performance budget '{scenario}' met")
+        assert not over, f"Performance budget '{scenario}' exceeded: " + "; ".join(over)
@@ -1,8 +1,12 @@
 """Playwright browser and context management."""
 
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import Optional, Dict, Any, Union
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 from config.settings import config
+from framework.asset_cache import AssetCache
+from framework.har_replay import attach_har
+from framework.resource_policy import ResourceBlocker
 from loguru import logger
 
 
@@ -42,13 +46,16 @@ class PlaywrightManager:
         browser_args = {
             "headless": headless,
             "slow_mo": slow_mo,
-            "args": [
+        }
+        
+        # Chromium-only switches
+        if browser_name.lower() == "chromium":
+            browser_args["args"] = [
                 "--no-sandbox",
                 "--disable-dev-shm-usage",
                 "--disable-gpu",
                 "--disable-extensions"
             ]
-        }
         
         if browser_name.lower() == "chromium":
             self.browser = await self.playwright.chromium.launch(**browser_args)
@@ -62,9 +69,29 @@ class PlaywrightManager:
         logger.info(f"Browser {browser_name} launched (headless: {headless})")
         return self.browser
     
-    async def create_context(self, **kwargs) -> BrowserContext:
+    async def create_context(self,
+                             asset_cache: Optional[AssetCache] = None,
+                             network_mode: Optional[str] = None,
+                             har_path: Optional[Union[str, Path]] = None,
+                             har_fallback: Optional[str] = None,
+                             resource_policy: Optional[str] = None,
+                             **kwargs) -> BrowserContext:
         """Create browser context.
         
+        Pass ``storage_state`` (path or dict) to start from a snapshot and
+        ``asset_cache`` to serve previously primed responses from memory.
+        With ``network_mode`` "record" or "replay" the context records to, or
+        replays from, the HAR archive at ``har_path``. ``resource_policy``
+        keeps posters, fonts and analytics off the wire for functional tests.
+        
+        Args:
+            asset_cache: Optional primed cache to serve responses from
+            network_mode: live, record or replay (defaults to config.network_mode)
+            har_path: HAR archive for record/replay
+            har_fallback: Policy for requests missing from the HAR (abort, live, stub)
+            resource_policy: off, placeholder or block (defaults to config.resource_policy)
+            **kwargs: Options passed through to ``browser.new_context``
+            
         Returns:
             BrowserContext instance
         """
@@ -74,10 +101,11 @@ class PlaywrightManager:
         context_options = {
             "viewport": {"width": 1920, "height": 1080},
             "ignore_https_errors": True,
-            "record_video_dir": "reports/videos/",
-            "record_video_size": {"width": 1920, "height": 1080},
-            **kwargs
         }
+        if config.record_video:
+            context_options["record_video_dir"] = "reports/videos/"
+            context_options["record_video_size"] = {"width": 1920, "height": 1080}
+        context_options.update(kwargs)
         
         self.context = await self.browser.new_context(**context_options)
         logger.info("Browser context created")
@@ -86,6 +114,20 @@ class PlaywrightManager:
         self.context.on("request", self._log_request)
         self.context.on("response", self._log_response)
         
+        network_mode = network_mode or config.network_mode
+        if network_mode != "live":
+            if har_path is None:
+                raise ValueError(f"har_path is required in {network_mode} mode")
+            await attach_har(self.context, network_mode, Path(har_path),
+                             har_fallback or config.har_fallback)
+        
+        # Installed last so cached assets are served before the HAR is consulted
+        if asset_cache:
+            await asset_cache.install(self.context)
+        
+        # Routes run newest first, so blocked assets never reach the cache or HAR
+        await ResourceBlocker(resource_policy or config.resource_policy).install(self.context)
+        
         return self.context
     
     async def create_page(self) -> Page:
@@ -0,0 +1,72 @@
+"""Component object for react-select dropdowns."""
+
+import re
+from typing import Optional
+from playwright.async_api import Locator, Page
+from loguru import logger
+
+
+class ReactSelect:
+    """Drives one react-select through its ``#react-select-N-input``.
+    
+    Typing into the input opens the menu filtered to matching options;
+    the option whose label matches exactly is then clicked. Every step
+    waits on a concrete element (the input, the option, the menu closing),
+    so no fixed pauses are needed and a partial match such as "Action &
+    Adventure" for "Action" is never picked by accident.
+    
+    Usage:
+        genre = ReactSelect(page, "react-select-3-input")
+        await genre.select("Comedy")
+    """
+    
+    def __init__(self, page: Page, input_id: str, timeout: int = 5000) -> None:
+        """Initialize ReactSelect.
+        
+        Args:
+            page: Page the dropdown is on
+            input_id: Id of the react-select input, e.g. "react-select-3-input"
+            timeout: Milliseconds to wait for each step
+        """
+        self.page = page
+        self.input_id = input_id
+        self.timeout = timeout
+        # Options are rendered as #react-select-N-option-<index>
+        self.option_prefix = input_id.removesuffix("-input") + "-option-"
+    
+    @property
+    def input(self) -> Locator:
+        """The search input of the dropdown."""
+        return self.page.locator(f"#{self.input_id}")
+    
+    def option(self, label: str) -> Locator:
+        """The menu option with exactly this label.
+        
+        Args:
+            label: Option text
+        
+        Returns:
+            Option locator
+        """
+        return self.page.locator(f"[id^='{self.option_prefix}']").filter(
+            has_text=re.compile(rf"^\s*{re.escape(label)}\s*$")
+        ).first
+    
+    async def wait_ready(self, timeout: Optional[int] = None) -> None:
+        """Wait until the dropdown's input is attached."""
+        await self.input.wait_for(state="attached", timeout=timeout or self.timeout)
+    
+    async def select(self, label: str, timeout: Optional[int] = None) -> None:
+        """Type a label and click its option.
+        
+        Args:
+            label: Option text to select
+            timeout: Optional timeout override per step
+        """
+        timeout = timeout or self.timeout
+        await self.input.fill(str(label), timeout=timeout)
+        option = self.option(str(label))
+        await option.click(timeout=timeout)
+        # The menu closes once react-select has committed the value
+        await option.wait_for(state="detached", timeout=timeout)
+        logger.debug("Selected {} in {}", label, self.input_id)
@@ -0,0 +1,95 @@
+"""Request blocking policies that keep functional tests off heavy assets."""
+
+import base64
+from typing import Dict, Set
+from urllib.parse import urlparse
+from playwright.async_api import BrowserContext, Route
+from loguru import logger
+
+
+# What a context does with assets no functional assertion looks at:
+#   off         - load everything
+#   placeholder - answer poster images with a 1x1 PNG (the <img> tags stay, so
+#                 poster counts still work), abort fonts, media and analytics
+#   block       - abort images, fonts, media and analytics outright
+RESOURCE_POLICIES = ("off", "placeholder", "block")
+
+# Transparent 1x1 PNG
+PLACEHOLDER_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+# Third-party hosts that only serve tracking, ads and web fonts
+THIRD_PARTY_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+)
+
+ABORTED_RESOURCE_TYPES = {"font", "media"}
+
+
+def _is_third_party(url: str) -> bool:
+    """Whether a URL points at one of THIRD_PARTY_HOSTS."""
+    host = urlparse(url).hostname or ""
+    return any(host == h or host.endswith(f".{h}") for h in THIRD_PARTY_HOSTS)
+
+
+class ResourceBlocker:
+    """Route handler applying one of RESOURCE_POLICIES to a context.
+    
+    Requests the policy does not care about fall through to the next route
+    handler (HAR, asset cache) or the network.
+    """
+    
+    def __init__(self, policy: str) -> None:
+        """Initialize ResourceBlocker.
+        
+        Args:
+            policy: One of RESOURCE_POLICIES
+        """
+        if policy not in RESOURCE_POLICIES:
+            raise ValueError(f"Unsupported resource policy: {policy}")
+        self.policy = policy
+        self.counts: Dict[str, int] = {"aborted": 0, "placeholder": 0}
+    
+    @property
+    def aborted_types(self) -> Set[str]:
+        """Resource types aborted under this policy."""
+        if self.policy == "block":
+            return ABORTED_RESOURCE_TYPES | {"image"}
+        return ABORTED_RESOURCE_TYPES
+    
+    async def install(self, context: BrowserContext) -> None:
+        """Route a context through the policy.
+        
+        Args:
+            context: Context to route
+        """
+        if self.policy == "off":
+            return
+        await context.route("**/*", self._handle_route)
+        logger.info(f"Resource policy '{self.policy}' installed")
+    
+    async def _handle_route(self, route: Route) -> None:
+        """Abort, stub or pass on one request."""
+        request = route.request
+        resource_type = request.resource_type
+        
+        if resource_type in self.aborted_types or _is_third_party(request.url):
+            self.counts["aborted"] += 1
+            await route.abort("blockedbyclient")
+            return
+        
+        if resource_type == "image":
+            self.counts["placeholder"] += 1
+            await route.fulfill(status=200, content_type="image/png", body=PLACEHOLDER_PNG)
+            return
+        
+        await route.fallback()
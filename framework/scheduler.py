@@ -0,0 +1,212 @@
+"""Duration-aware test ordering and sharding (pytest plugin).
+
+Test durations are kept in a small JSON database under ``reports/`` and
+updated after every full run (subset runs such as ``-k``, ``-m``, a
+shard or single files only read it). Before a run the collected tests are ordered
+longest first, so xdist hands the slow UI tests out early and the short
+ones fill the gaps (longest-processing-time-first). With ``--shard i/N``
+the tests are split into N shards of roughly equal estimated time and
+only shard i runs.
+"""
+
+import heapq
+import json
+import statistics
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import pytest
+from loguru import logger
+
+
+DEFAULT_DURATIONS_DB = "reports/durations.json"
+
+# Weight of the latest run in the stored duration (exponential moving average)
+SMOOTHING = 0.5
+
+# Estimate for a test with no history when the database is empty
+UNKNOWN_DURATION = 5.0
+
+
+def is_subset_run(config) -> bool:
+    """Whether the run selects only part of the suite.
+    
+    Args:
+        config: Pytest config
+    
+    Returns:
+        True for -k/-m/--lf/--shard/--changed-since runs and for runs of
+        specific files, directories other than tests/ or node ids
+    """
+    for option in ("keyword", "markexpr", "lf", "shard", "changed_since"):
+        if getattr(config.option, option, None):
+            return True
+    suite = {Path(config.rootpath), Path(config.rootpath) / "tests"}
+    return any(Path(config.invocation_params.dir, arg).resolve() not in suite for arg in config.args)
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse "i/N" into (i, N) with 1 <= i <= N.
+    
+    Args:
+        value: Shard spec, e.g. "2/4"
+    
+    Returns:
+        (index, total) tuple
+    """
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected i/N like 1/4")
+    if not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{value}', i must be between 1 and N")
+    return index, total
+
+
+class DurationDB:
+    """Smoothed per-test durations persisted as JSON."""
+    
+    def __init__(self, path: str = DEFAULT_DURATIONS_DB) -> None:
+        """Initialize DurationDB, loading existing data.
+        
+        Args:
+            path: JSON file holding {nodeid: seconds}
+        """
+        self.path = Path(path)
+        self.durations: Dict[str, float] = {}
+        if self.path.exists():
+            try:
+                self.durations = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable durations database {self.path}: {e}")
+    
+    def estimate(self, nodeid: str) -> float:
+        """Expected duration of a test.
+        
+        Args:
+            nodeid: Pytest node id
+        
+        Returns:
+            Seconds; unknown tests get the median of the known ones
+        """
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return UNKNOWN_DURATION
+    
+    def update(self, nodeid: str, seconds: float) -> None:
+        """Fold a measured duration into the stored value.
+        
+        Args:
+            nodeid: Pytest node id
+            seconds: Measured setup + call + teardown time
+        """
+        previous = self.durations.get(nodeid)
+        self.durations[nodeid] = (seconds if previous is None
+                                  else SMOOTHING * seconds + (1 - SMOOTHING) * previous)
+    
+    def save(self) -> None:
+        """Write the database."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(dict(sorted(self.durations.items())), indent=2), encoding="utf-8")
+        logger.info(f"Saved {len(self.durations)} test durations to {self.path}")
+
+
+def lpt_shards(nodeids: List[str], estimate, shards: int) -> List[List[str]]:
+    """Split tests into shards with longest-processing-time-first.
+    
+    Args:
+        nodeids: Tests to split
+        estimate: Callable giving a test's expected seconds
+        shards: Number of shards
+    
+    Returns:
+        One list of node ids per shard, each longest first
+    """
+    bins: List[Tuple[float, int]] = [(0.0, i) for i in range(shards)]
+    result: List[List[str]] = [[] for _ in range(shards)]
+    # Ties broken by node id so every machine computes the same split
+    for nodeid in sorted(nodeids, key=lambda n: (-estimate(n), n)):
+        load, index = heapq.heappop(bins)
+        result[index].append(nodeid)
+        heapq.heappush(bins, (load + estimate(nodeid), index))
+    return result
+
+
+class DurationScheduler:
+    """Pytest plugin object: orders, shards and records test durations."""
+    
+    def __init__(self, db: DurationDB, shard: Optional[Tuple[int, int]], reorder: bool, record: bool) -> None:
+        """Initialize DurationScheduler.
+        
+        Args:
+            db: Duration database
+            shard: (index, total) to run a single shard, or None
+            reorder: Order tests longest first
+            record: Update and save the database after the run
+        """
+        self.db = db
+        self.shard = shard
+        self.reorder = reorder
+        self.record = record
+        self._measured: Dict[str, float] = {}
+    
+    def pytest_deselected(self, items) -> None:
+        """A deselected test makes this a subset run, which is not recorded."""
+        self.record = False
+    
+    def pytest_collection_modifyitems(self, config, items) -> None:
+        """Keep this shard's tests and put the longest first."""
+        if self.shard:
+            index, total = self.shard
+            shards = lpt_shards([item.nodeid for item in items], self.db.estimate, total)
+            keep = set(shards[index - 1])
+            deselected = [item for item in items if item.nodeid not in keep]
+            items[:] = [item for item in items if item.nodeid in keep]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+            estimated = sum(self.db.estimate(n) for n in keep)
+            logger.info(f"Shard {index}/{total}: {len(items)} tests, ~{estimated:.0f}s estimated")
+        
+        if self.reorder:
+            position = {item.nodeid: i for i, item in enumerate(items)}
+            items.sort(key=lambda item: (-self.db.estimate(item.nodeid), position[item.nodeid]))
+    
+    def pytest_runtest_logreport(self, report) -> None:
+        """Add up setup, call and teardown time per test."""
+        self._measured[report.nodeid] = self._measured.get(report.nodeid, 0.0) + report.duration
+    
+    def pytest_sessionfinish(self, session) -> None:
+        """Persist the durations measured in this run."""
+        if not self.record or not self._measured:
+            return
+        for nodeid, seconds in self._measured.items():
+            self.db.update(nodeid, seconds)
+        self.db.save()
+
+
+def pytest_addoption(parser):
+    """Register scheduling options."""
+    group = parser.getgroup("scheduler", "duration-aware scheduling")
+    group.addoption("--shard", default=None,
+                    help="Run only shard i of N (i/N), split by historical duration")
+    group.addoption("--durations-db", default=DEFAULT_DURATIONS_DB,
+                    help="JSON file holding historical test durations")
+    group.addoption("--no-reorder", action="store_true",
+                    help="Keep collection order instead of longest-first")
+
+
+def pytest_configure(config):
+    """Install the scheduler; xdist workers only order, the controller records."""
+    try:
+        shard = parse_shard(config.getoption("--shard")) if config.getoption("--shard") else None
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    is_worker = hasattr(config, "workerinput")
+    scheduler = DurationScheduler(
+        DurationDB(config.getoption("--durations-db")),
+        shard=shard,
+        reorder=not config.getoption("--no-reorder"),
+        record=not is_worker and not config.getoption("collectonly") and not is_subset_run(config),
+    )
+    config.pluginmanager.register(scheduler, "duration-scheduler")
@@ -0,0 +1,27 @@
+"""Site-health preflight run once before the first UI test."""
+
+from typing import Optional
+import httpx
+from loguru import logger
+
+
+def check_site(base_url: str, timeout: float = 10.0) -> Optional[str]:
+    """Check that the site under test answers with a page.
+    
+    Args:
+        base_url: Site root URL
+        timeout: Seconds to wait for the response
+    
+    Returns:
+        A description of the problem, or None if the site is healthy
+    """
+    try:
+        response = httpx.get(base_url, timeout=timeout, follow_redirects=True)
+    except httpx.HTTPError as e:
+        return f"Site {base_url} is unreachable: {type(e).__name__}: {e}"
+    if response.status_code >= 400:
+        return f"Site {base_url} answered HTTP {response.status_code}"
+    if "html" not in response.headers.get("content-type", ""):
+        return f"Site {base_url} did not return an HTML page ({response.headers.get('content-type')})"
+    logger.info(f"Site preflight OK: {base_url} answered in {response.elapsed.total_seconds():.2f}s")
+    return None
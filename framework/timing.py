@@ -0,0 +1,265 @@
+"""Per-action latency instrumentation for page objects."""
+
+import functools
+import html
+import json
+import math
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+from playwright.async_api import Page, Response
+from loguru import logger
+from utils.logger import log_cost
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class ActionSample:
+    """One timed page-object action."""
+    action: str
+    test: str
+    duration_ms: float
+    round_trips: Optional[int]
+    bytes: int
+    ok: bool
+    log_ms: float = 0.0
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile.
+    
+    Args:
+        values: Samples
+        pct: Percentile between 0 and 100
+    
+    Returns:
+        The percentile, 0 for no samples
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _round_trips(page: Page) -> Optional[int]:
+    """Messages sent to the Playwright driver so far, if the client exposes it.
+    
+    The counter belongs to the driver connection and is shared by every
+    page and context, so a difference is only attributable to one action
+    while no other action is running (see ``_Overlap``).
+    """
+    connection = getattr(getattr(page, "_impl_obj", None), "_connection", None)
+    return getattr(connection, "_last_id", None)
+
+
+class _Overlap:
+    """Tracks whether a timed action ran alongside another one.
+    
+    Actions nested inside each other (one timed method awaiting another)
+    do not count as overlapping.
+    """
+    
+    active: List["_Overlap"] = []
+    enclosing: ContextVar[Tuple["_Overlap", ...]] = ContextVar("enclosing_actions", default=())
+    
+    def __init__(self) -> None:
+        """Register a starting action, marking every unrelated running one as overlapped."""
+        ancestors = self.enclosing.get()
+        self.overlapped = False
+        for other in self.active:
+            if other not in ancestors:
+                other.overlapped = self.overlapped = True
+        self.active.append(self)
+        self._token = self.enclosing.set(ancestors + (self,))
+    
+    def finish(self) -> bool:
+        """Unregister the action.
+        
+        Returns:
+            True if an unrelated action ran at any point during this one
+        """
+        self.enclosing.reset(self._token)
+        self.active.remove(self)
+        return self.overlapped
+
+
+class TimingRecorder:
+    """Collects ActionSamples for the run and writes the timing report."""
+    
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.samples: List[ActionSample] = []
+        self.current_test = ""
+    
+    def record(self, sample: ActionSample) -> None:
+        """Add a sample.
+        
+        Args:
+            sample: Timed action
+        """
+        self.samples.append(sample)
+    
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregate samples per action.
+        
+        Returns:
+            Action name -> count, failures, p50/p95/max ms, mean round-trips
+            (over non-overlapping samples), bytes and milliseconds spent logging
+        """
+        by_action: Dict[str, List[ActionSample]] = {}
+        for sample in self.samples:
+            by_action.setdefault(sample.action, []).append(sample)
+        
+        summary = {}
+        for action, samples in sorted(by_action.items()):
+            durations = [s.duration_ms for s in samples]
+            trips = [s.round_trips for s in samples if s.round_trips is not None]
+            summary[action] = {
+                "count": len(samples),
+                "failures": sum(not s.ok for s in samples),
+                "p50_ms": round(percentile(durations, 50), 1),
+                "p95_ms": round(percentile(durations, 95), 1),
+                "max_ms": round(max(durations), 1),
+                "mean_round_trips": round(sum(trips) / len(trips), 1) if trips else None,
+                "mean_bytes": round(sum(s.bytes for s in samples) / len(samples)),
+                "mean_log_ms": round(sum(s.log_ms for s in samples) / len(samples), 2),
+            }
+        return summary
+    
+    def dump(self, path: Path) -> None:
+        """Write the raw samples (one worker's share of the run).
+        
+        Args:
+            path: JSON file to write
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps([asdict(s) for s in self.samples]), encoding="utf-8")
+    
+    def load(self, paths: Iterable[Path]) -> None:
+        """Merge raw samples written by ``dump``, e.g. by xdist workers.
+        
+        Args:
+            paths: JSON files to read
+        """
+        for path in paths:
+            self.samples.extend(ActionSample(**s) for s in json.loads(path.read_text(encoding="utf-8")))
+    
+    def write_report(self, json_path: Path, html_path: Path) -> None:
+        """Write the aggregated timing report as JSON and HTML.
+        
+        Args:
+            json_path: Summary plus raw samples
+            html_path: Human readable summary table
+        """
+        summary = self.summary()
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps({
+            "summary": summary,
+            "samples": [asdict(s) for s in self.samples],
+        }, indent=2), encoding="utf-8")
+        
+        columns = ["count", "failures", "p50_ms", "p95_ms", "max_ms", "mean_round_trips", "mean_bytes",
+                   "mean_log_ms"]
+        rows = "\n".join(
+            "<tr><td>{}</td>{}</tr>".format(
+                html.escape(action),
+                "".join(f"<td>{'-' if stats[c] is None else stats[c]}</td>" for c in columns)
+            )
+            for action, stats in summary.items()
+        )
+        html_path.write_text(f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Action timing report</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 10px; text-align: right; }}
+th:first-child, td:first-child {{ text-align: left; }}
+</style>
+</head>
+<body>
+<h1>Action timing report</h1>
+<p>{len(self.samples)} actions timed. Round-trips are messages sent on the shared Playwright driver
+connection, counted only for actions that ran while no other action was running;
+log ms is time spent emitting log records inside the action.</p>
+<table>
+<tr><th>action</th>{"".join(f"<th>{c}</th>" for c in columns)}</tr>
+{rows}
+</table>
+</body>
+</html>
+""", encoding="utf-8")
+        logger.info(f"Timing report written to {html_path}")
+
+
+# Shared by every page object in this process (one per xdist worker)
+recorder = TimingRecorder()
+
+
+def timed_action(name: Optional[str] = None) -> Callable[[F], F]:
+    """Time a page-object coroutine method and record it on ``recorder``.
+    
+    Records wall time, driver round-trips, response bytes (from
+    Content-Length) seen on the page and time spent logging while the
+    action ran. Round-trips are left out (None) for actions that
+    overlapped another timed action, since the driver counter is
+    connection-wide.
+    
+    Args:
+        name: Action name in the report, defaults to the method name
+    
+    Returns:
+        Decorator
+    """
+    def decorator(func: F) -> F:
+        action = name or func.__name__
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            page: Page = self.page
+            received = [0]
+            
+            def on_response(response: Response) -> None:
+                length = response.headers.get("content-length")
+                if length and length.isdigit():
+                    received[0] += int(length)
+            
+            page.on("response", on_response)
+            overlap = _Overlap()
+            trips_before = _round_trips(page)
+            start = time.perf_counter()
+            ok = False
+            try:
+                with log_cost.measure() as log_seconds:
+                    result = await func(self, *args, **kwargs)
+                ok = True
+                return result
+            finally:
+                duration_ms = (time.perf_counter() - start) * 1000
+                trips_after = _round_trips(page)
+                if overlap.finish():
+                    # Concurrent actions (fan_out, page pools, load users) share the counter
+                    trips_before = None
+                page.remove_listener("response", on_response)
+                recorder.record(ActionSample(
+                    action=action,
+                    test=recorder.current_test,
+                    duration_ms=round(duration_ms, 1),
+                    round_trips=(trips_after - trips_before
+                                 if trips_before is not None and trips_after is not None else None),
+                    bytes=received[0],
+                    ok=ok,
+                    log_ms=round(log_seconds[0] * 1000, 3),
+                ))
+                logger.debug("{} took {:.0f}ms", action, duration_ms)
+        
+        return wrapper  # type: ignore[return-value]
+    
+    return decorator
@@ -1,22 +1,97 @@
 """Home page object for TMDB demo site."""
 
-from typing import List, Optional
-from playwright.async_api import Page, expect
-from framework.base_page import BasePage
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+from urllib.parse import parse_qs, urlencode, urlparse
+from playwright.async_api import Locator, Page, Request, Response, Route, expect
+from framework.base_page import BasePage, CircuitBreaker, ResultsCapture
+from framework.page_pool import PagePool
+from framework.performance import PERF_COLLECT_SCRIPT, PERF_OBSERVER_SCRIPT
+from framework.react_select import ReactSelect
+from framework.timing import timed_action
+from pages.models import ResultSet, genre_id, normalize_content_type
+from pages.oracle import OracleReport, compare_results, payload_titles, payload_years
 from loguru import logger
 import asyncio
+import re
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Walks from every visible poster up to its card and reads the card fields in
+# the browser, so a whole results page costs one CDP round-trip.
+EXTRACT_CARDS_SCRIPT = r"""
+({ posterSelector, titleSelector, ratingSelector, genreSelector }) => {
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        if (!rect.width || !rect.height) return false;
+        const style = window.getComputedStyle(el);
+        return style.visibility !== 'hidden' && style.display !== 'none';
+    };
+    const textOf = (el) => (el && (el.innerText || el.textContent) || '').trim();
+    const posters = Array.from(document.querySelectorAll(posterSelector)).filter(isVisible);
+    const seen = new Set();
+    const cards = [];
+    for (const img of posters) {
+        // Climb to the largest ancestor that still holds only this poster,
+        // without swallowing page chrome when the grid has a single card
+        let card = img;
+        while (card.parentElement && !card.parentElement.matches('main, body')
+               && card.parentElement.querySelectorAll(posterSelector).length === 1
+               && !card.parentElement.querySelector('aside, nav, header, input')) {
+            card = card.parentElement;
+        }
+        if (seen.has(card)) continue;
+        seen.add(card);
+        
+        const text = textOf(card);
+        const heading = card.querySelector(titleSelector);
+        const alt = (img.getAttribute('alt') || '').replace(/^poster( of)?[:\s-]*/i, '').trim();
+        const title = textOf(heading) || alt || text.split('\n')[0] || null;
+        
+        const yearMatch = text.match(/\b(19|20)\d{2}\b/);
+        const ratingEl = card.querySelector(ratingSelector);
+        const ratingMatch = (textOf(ratingEl) || text.replace(/\b(19|20)\d{2}\b/g, ''))
+            .match(/\b(10(?:\.0)?|\d\.\d)\b/);
+        const typeMatch = text.match(/\b(tv( show)?|series|movie)\b/i);
+        const genres = Array.from(card.querySelectorAll(genreSelector))
+            .flatMap((el) => textOf(el).split(/[,•|]/))
+            .map((g) => g.trim())
+            .filter(Boolean);
+        // Only the id segment of a detail link (/movie/550-fight-club?page=2)
+        // or a bare numeric data-id; anything else leaves the id null so the
+        // title is used to identify the card
+        const link = card.closest('a') || card.querySelector('a');
+        const idMatch = ((link && link.getAttribute('href')) || '').match(/\/(?:movie|tv)\/(\d+)/)
+            || (card.getAttribute('data-id') || '').trim().match(/^(\d+)$/);
+        
+        cards.push({
+            id: idMatch ? Number(idMatch[1]) : null,
+            title: title,
+            year: yearMatch ? Number(yearMatch[0]) : null,
+            type: typeMatch ? (/movie/i.test(typeMatch[1]) ? 'movie' : 'tv') : null,
+            rating: ratingMatch ? Number(ratingMatch[1]) : null,
+            poster_url: img.currentSrc || img.getAttribute('src') || null,
+            genres: genres,
+        });
+    }
+    return cards;
+}
+"""
 
 
 class HomePage(BasePage):
     """Home page object for TMDB movie discovery platform."""
     
-    def __init__(self, page: Page) -> None:
+    def __init__(self, page: Page, breaker: Optional[CircuitBreaker] = None) -> None:
         """Initialize HomePage.
         
         Args:
             page: Playwright page instance
+            breaker: Circuit breaker for guarded waits, defaults to the context's
         """
-        super().__init__(page)
+        super().__init__(page, breaker)
         
         # Updated locators based on actual website inspection
         # Category buttons (top navigation bar)
@@ -31,6 +106,9 @@ class HomePage(BasePage):
         # Movie content
         self.movie_images = "img[alt*='Poster'], img[src*='image']"
         self.movie_cards = "div[class*='cursor-pointer'], a[class*='cursor-pointer']"
+        self.card_title = "h1, h2, h3, h4, [class*='title']"
+        self.card_rating = "[class*='rating'], [class*='vote'], [class*='score']"
+        self.card_genres = "[class*='genre']"
         
         # Main content area
         self.results_container = "main, body"
@@ -38,48 +116,200 @@ class HomePage(BasePage):
         # Sidebar filters
         self.sidebar = "aside"
         
-        # Type filtering (Movie/TV Show) - React Select
-        self.type_dropdown = "div:has(#react-select-2-input) .css-yk16xz-control"
-        self.movie_option = "text=Movie"
-        self.tv_show_option = "text=TV Show"
-        
-        # Genre filtering - React Select
-        self.genre_dropdown = "div:has(#react-select-3-input) .css-yk16xz-control"
-        self.genre_select_text = "text=Select..."
-        
-        # Year filtering - React Select dropdowns
-        # Use the control containers instead of input elements
-        self.year_from_dropdown = "div:has(#react-select-4-input) .css-yk16xz-control"
-        self.year_to_dropdown = "div:has(#react-select-5-input) .css-yk16xz-control"
+        # Type, genre and year filters - React Select dropdowns driven
+        # through their inputs (type, pick option)
+        self.type_select = ReactSelect(page, "react-select-2-input")
+        self.genre_select = ReactSelect(page, "react-select-3-input")
+        self.year_from_select = ReactSelect(page, "react-select-4-input")
+        self.year_to_select = ReactSelect(page, "react-select-5-input")
         
         # Rating filtering (Star rating)
         self.rating_section = "aside div:has-text('Ratings')"
         self.rating_stars = "aside div:has-text('Ratings') + div [class*='star']"
+        self.star_selectors = (
+            self.rating_stars,
+            "aside div:has-text('Ratings') + div [class*='rate']",
+            "aside div:has-text('Ratings') + div [class*='rating']",
+            "aside div:has-text('Ratings') + div [class*='★']",
+        )
         self.rating_and_up = "text=& up"
         
+        # Pagination - any of these means the results are paged
+        self.pagination_selectors = (
+            "button:has-text('Next')",
+            "button:has-text('Previous')",
+            "[class*='pagination']",
+            "[class*='page']",
+        )
+        
         # Loading and states
         self.loading_indicator = "[class*='loading'], [class*='spinner']"
         self.page_title = "h1, title"
+        
+        # TMDB endpoints the results grid is rendered from
+        self.results_api_pattern = re.compile(r"/3/(discover|search|trending|movie|tv)/")
+        
+        # Settle signals: results XHR, grid mutations and a stable poster count
+        self.settle_container = "main"
+        self.settle_count_locator = self.movie_images
+        self.settle_url_pattern = self.results_api_pattern
+        
+        # Upper bound (ms) for each action to settle
+        self.action_timeouts = {
+            "page_load": 10000,
+            "category": 5000,
+            "search": 5000,
+            "filter": 5000,
+            "paginate": 5000,
+        }
+        
+        # Last results payload captured from the TMDB API by an action
+        self.last_results: Optional[dict] = None
     
-    async def navigate_to_home(self) -> None:
-        """Navigate to home page."""
+    @asynccontextmanager
+    async def results_action(self,
+                             action: str,
+                             match: Optional[Callable[[Response], bool]] = None) -> AsyncIterator[ResultsCapture]:
+        """Wrap a UI action that refreshes the results grid.
+        
+        Captures the TMDB response the action triggers and waits for the grid
+        to settle, both bounded by the action's entry in ``action_timeouts``.
+        The parsed payload is kept in ``last_results``; it is cleared first,
+        so a payload from an earlier action is never taken for this one's.
+        Every action that changes the grid goes through here (or, for
+        navigations, clears ``last_results`` itself).
+        
+        Args:
+            action: Key into ``action_timeouts``
+            match: Optional extra predicate on the results response
+        """
+        timeout = self.action_timeouts[action]
+        self.last_results = None
+        async with self.expect_results(match=match, timeout=timeout, optional=True) as capture:
+            async with self.settle(timeout=timeout):
+                yield capture
+        if capture.payload is not None:
+            self.last_results = capture.payload
+    
+    async def fan_out(self,
+                      inputs: Sequence[T],
+                      check: Callable[["HomePage", T], Awaitable[R]],
+                      page_pool: Optional[PagePool] = None,
+                      wait_until: Optional[str] = "domcontentloaded") -> List[Union[R, BaseException]]:
+        """Run a read-only check for each input on its own page, concurrently.
+        
+        Every input gets a page from ``page_pool`` (or a temporary pool in
+        this page's context), loaded on the home view unless ``wait_until``
+        is None, and ``check`` is awaited with a HomePage for it. Checks must
+        not depend on each other.
+        
+        Args:
+            inputs: Values to check, e.g. category names or search terms
+            check: Coroutine function taking (home_page, input)
+            page_pool: Pool to borrow pages from, defaults to one page per input
+            wait_until: Load event for each page's home navigation, None for
+                checks that open their own view (e.g. open_with_filters)
+            
+        Returns:
+            One result per input, in order; a check that raised yields its exception
+        """
+        pool = page_pool or PagePool(self.page.context, size=max(len(inputs), 1))
+        
+        async def run(item: T) -> R:
+            async with pool.page() as page:
+                home = type(self)(page)
+                if wait_until:
+                    await home.navigate_to_home(wait_until=wait_until)
+                return await check(home, item)
+        
+        logger.info("Fanning out {} checks over up to {} pages", len(inputs), pool.size)
+        try:
+            return await asyncio.gather(*(run(item) for item in inputs), return_exceptions=True)
+        finally:
+            if page_pool is None:
+                await pool.close()
+    
+    @staticmethod
+    def _query_params(response: Response) -> Dict[str, List[str]]:
+        """Parse the query string of a response URL."""
+        return parse_qs(urlparse(response.url).query)
+    
+    @staticmethod
+    def _type_option(content_type: str) -> Tuple[str, str]:
+        """Dropdown label and API path segment for a content type."""
+        if content_type.lower() in ['movie', 'movies']:
+            return "Movie", "/movie"
+        if content_type.lower() in ['tv_show', 'tv', 'tv shows']:
+            return "TV Show", "/tv"
+        raise ValueError(f"Invalid content type: {content_type}")
+    
+    @staticmethod
+    def _media_type_matcher(media_path: str) -> Callable[[Response], bool]:
+        """Match results responses for a media type."""
+        def is_media_type(response: Response) -> bool:
+            return media_path in urlparse(response.url).path
+        return is_media_type
+    
+    def _final_range_matcher(self, year_to: int) -> Callable[[Response], bool]:
+        """Match the results response that already carries the upper year.
+        
+        The "from" selection fires its own request first.
+        """
+        def is_final_range(response: Response) -> bool:
+            return any(value.startswith(str(year_to))
+                       for key, values in self._query_params(response).items()
+                       if key.endswith(".lte") or "year" in key
+                       for value in values)
+        return is_final_range
+    
+    def _params_matcher(self, *keys: str) -> Callable[[Response], bool]:
+        """Match results responses whose query carries every given parameter."""
+        def has_params(response: Response) -> bool:
+            params = self._query_params(response)
+            return all(key in params for key in keys)
+        return has_params
+    
+    async def _select(self, dropdown: ReactSelect, label: Any) -> None:
+        """Pick a dropdown option through the circuit breaker."""
+        await self.breaker.call(dropdown.select(str(label)), f"{dropdown.input_id} option {label}")
+    
+    async def _star_elements(self) -> List[Locator]:
+        """Star elements of the rating filter, whichever markup this layout uses."""
+        selector = await self.resolve(*self.star_selectors)
+        if selector:
+            star_elements = await self.page.locator(selector).all()
+            logger.debug("Found {} star elements with selector: {}", len(star_elements), selector)
+            return star_elements
+        # Try to find any clickable elements in the rating section
+        star_elements = await self.page.locator("aside div:has-text('Ratings') + div").locator("*").all()
+        logger.debug("Found {} elements in rating section", len(star_elements))
+        return star_elements
+    
+    @timed_action("navigate_home")
+    async def navigate_to_home(self, wait_until: str = "networkidle") -> None:
+        """Navigate to home page.
+        
+        Args:
+            wait_until: Load event to wait for before the page-load settle;
+                "domcontentloaded" is enough when assets come from a warm cache
+        """
         from config.settings import config
-        await self.navigate_to(config.base_url)
+        # A fresh load shows a different grid than any captured payload
+        self.last_results = None
+        await self.navigate_to(config.base_url, wait_until=wait_until)
         await self.wait_for_page_load()
     
     async def wait_for_page_load(self) -> None:
         """Wait for page to fully load."""
         try:
             # Wait for the main navigation to be visible
-            await self.page.wait_for_selector("text=Popular", timeout=15000)
-            logger.info("Navigation loaded")
+            await self.wait_for_selector("text=Popular", timeout=15000)
+            logger.debug("Navigation loaded")
             
-            # Wait for movie images to load
-            await self.page.wait_for_selector("img", timeout=10000)
-            logger.info("Images loaded")
-            
-            # Small delay for any dynamic content
-            await self.page.wait_for_timeout(1000)
+            # Wait for movie images to load and the grid to stop changing
+            async with self.settle(timeout=self.action_timeouts["page_load"]):
+                await self.wait_for_selector("img", timeout=10000)
+            logger.debug("Images loaded")
             
             logger.info("Home page loaded successfully")
             
@@ -88,6 +318,98 @@ class HomePage(BasePage):
             await self.take_screenshot("page_load_error")
             raise
     
+    @staticmethod
+    def discover_query(content_type: Optional[str] = None,
+                       genre: Optional[str] = None,
+                       year_from: Optional[int] = None,
+                       year_to: Optional[int] = None,
+                       rating: Optional[int] = None,
+                       page: Optional[int] = None) -> Tuple[str, Dict[str, str]]:
+        """TMDB discover request equivalent to a set of sidebar filters.
+        
+        Args:
+            content_type: 'movie' or 'tv_show', default movie
+            genre: Genre name
+            year_from: Starting year
+            year_to: Ending year
+            rating: Minimum rating (1-10)
+            page: Results page
+            
+        Returns:
+            (API path, query parameters) tuple
+        """
+        media = normalize_content_type(content_type) if content_type else "movie"
+        date_prefix = "primary_release_date" if media == "movie" else "first_air_date"
+        params = {}
+        if genre:
+            params["with_genres"] = str(genre_id(genre, media))
+        if year_from is not None:
+            params[f"{date_prefix}.gte"] = f"{year_from}-01-01"
+        if year_to is not None:
+            params[f"{date_prefix}.lte"] = f"{year_to}-12-31"
+        if rating:
+            params["vote_average.gte"] = str(rating)
+        if page:
+            params["page"] = str(page)
+        return f"/3/discover/{media}", params
+    
+    @timed_action("open_with_filters")
+    async def open_with_filters(self,
+                                content_type: Optional[str] = None,
+                                genre: Optional[str] = None,
+                                year_from: Optional[int] = None,
+                                year_to: Optional[int] = None,
+                                rating: Optional[int] = None,
+                                page: Optional[int] = None) -> Optional[dict]:
+        """Open the home page with results already filtered, without using the sidebar.
+        
+        The site has no deep links (see TC027) and keeps its store private,
+        so the first results request the home page makes is rewritten into
+        the equivalent discover query (the app's own api key and language
+        are kept). The grid renders the filtered results; the sidebar
+        widgets still show their defaults, so use this for result
+        correctness and the apply_* methods for widget behaviour.
+        
+        Args:
+            content_type: 'movie' or 'tv_show', default movie
+            genre: Genre name
+            year_from: Starting year
+            year_to: Ending year
+            rating: Minimum rating (1-10)
+            page: Results page
+            
+        Returns:
+            Results payload returned by the API for the filters, if captured
+        """
+        path, params = self.discover_query(content_type, genre, year_from, year_to, rating, page)
+        rewritten: List[Request] = []
+        
+        async def rewrite(route: Route) -> None:
+            if rewritten:
+                await route.fallback()
+                return
+            rewritten.append(route.request)
+            url = urlparse(route.request.url)
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()
+                     if key in ("api_key", "language")}
+            query.update(params)
+            # fallback() keeps the context's HAR, cache and resource routes in play
+            await route.fallback(url=url._replace(path=path, query=urlencode(query)).geturl())
+        
+        logger.info("Opening home with filters: {} {}", path, params)
+        await self.page.route(self.results_api_pattern, rewrite)
+        try:
+            # Matched by request: the response may still report the original URL
+            async with self.expect_results(match=lambda r: r.request in rewritten,
+                                           timeout=self.action_timeouts["page_load"]) as capture:
+                await self.navigate_to_home(wait_until="domcontentloaded")
+        finally:
+            await self.page.unroute(self.results_api_pattern, rewrite)
+        if capture.payload is not None:
+            self.last_results = capture.payload
+        return capture.payload
+    
+    @timed_action("category")
     async def select_category(self, category: str) -> None:
         """Select movie category.
         
@@ -110,24 +432,24 @@ class HomePage(BasePage):
         else:
             locator = category_mapping[category_lower]
         
-        logger.info(f"Selecting category: {category}")
+        logger.info("Selecting category: {}", category)
         
         try:
-            await self.page.click(locator, timeout=10000)
-            # Wait for any page changes
-            await self.page.wait_for_timeout(2000)
-            logger.info(f"Successfully clicked {category} category")
+            async with self.results_action("category"):
+                await self.click_selector(locator, timeout=10000)
+            logger.debug("Successfully clicked {} category", category)
         except Exception as e:
             logger.error(f"Failed to click category {category}: {e}")
             await self.take_screenshot(f"category_click_failed_{category}")
             raise
     
+    @timed_action()
     async def click_search(self) -> None:
         """Click the search button."""
         try:
-            await self.page.click(self.search_button, timeout=10000)
-            logger.info("Clicked search button")
-            await self.page.wait_for_timeout(1000)
+            async with self.results_action("search"):
+                await self.click_selector(self.search_button, timeout=10000)
+            logger.debug("Clicked search button")
         except Exception as e:
             logger.warning(f"Search button click failed: {e}")
     
@@ -140,34 +462,72 @@ class HomePage(BasePage):
         try:
             # Count movie images
             count = await self.page.locator(self.movie_images).count()
-            logger.info(f"Found {count} movie images")
+            logger.debug("Found {} movie images", count)
             return count
         except Exception as e:
             logger.error(f"Error counting movies: {e}")
             return 0
     
-    async def get_movie_titles(self) -> List[str]:
-        """Get list of visible text that could be movie titles.
+    @timed_action()
+    async def extract_cards(self) -> List[Dict[str, Any]]:
+        """Snapshot every visible movie card in a single round-trip.
         
         Returns:
-            List of potential movie titles
+            One dict per card with id, title, year, type, rating,
+            poster_url and genres (None/empty when not shown on the card)
         """
-        titles = []
         try:
-            # Look for text elements that could be titles
-            text_elements = await self.page.locator("h3, h2, h4, [class*='title']").all()
-            
-            for element in text_elements:
-                try:
-                    if await element.is_visible():
-                        text = await element.text_content()
-                        if text and len(text.strip()) > 0:
-                            titles.append(text.strip())
-                except:
-                    continue
+            cards = await self.page.evaluate(EXTRACT_CARDS_SCRIPT, {
+                "posterSelector": self.movie_images,
+                "titleSelector": self.card_title,
+                "ratingSelector": self.card_rating,
+                "genreSelector": self.card_genres,
+            })
+            logger.info("Extracted {} movie cards", len(cards))
+            return cards
+        except Exception as e:
+            logger.error(f"Error extracting movie cards: {e}")
+            return []
+    
+    async def get_results(self) -> ResultSet:
+        """Get every visible movie card as a typed result set.
+        
+        Returns:
+            ResultSet of MovieCard
+        """
+        return ResultSet.from_dicts(await self.extract_cards())
+    
+    async def verify_against_api(self, payload: Optional[dict] = None) -> Optional[OracleReport]:
+        """Compare every visible card with the API results behind the grid.
+        
+        Args:
+            payload: Results JSON, defaults to ``last_results``
             
-            logger.info(f"Found {len(titles)} potential movie titles")
-            return titles[:10]  # Return first 10 to avoid too much data
+        Returns:
+            OracleReport listing missing, extra, out-of-order and wrong-year
+            cards, or None if no payload was captured
+        """
+        payload = payload if payload is not None else self.last_results
+        if payload is None:
+            logger.debug("No results payload captured; skipping the API oracle")
+            return None
+        report = compare_results(payload, await self.get_results())
+        if report.ok:
+            logger.info("Oracle: {}", report.summary())
+        else:
+            logger.warning(f"Oracle: {report.summary()}")
+        return report
+    
+    async def get_movie_titles(self) -> List[str]:
+        """Get the titles of the visible movie cards.
+        
+        Returns:
+            List of movie titles
+        """
+        try:
+            titles = (await self.get_results()).titles
+            logger.info("Found {} movie titles", len(titles))
+            return titles
             
         except Exception as e:
             logger.error(f"Error getting movie titles: {e}")
@@ -198,24 +558,24 @@ class HomePage(BasePage):
     async def wait_for_images_to_load(self) -> None:
         """Wait for movie images to load."""
         try:
-            await self.page.wait_for_selector("img", timeout=10000)
+            await self.wait_for_selector("img", timeout=10000)
             # Wait for at least one image to actually load
             await self.page.wait_for_function(
                 "document.querySelector('img') && document.querySelector('img').complete",
                 timeout=10000
             )
-            logger.info("Images finished loading")
+            logger.debug("Images finished loading")
         except Exception as e:
             logger.warning(f"Images may not have fully loaded: {e}")
     
-    async def take_screenshot_with_timestamp(self, name: str) -> str:
+    async def take_screenshot_with_timestamp(self, name: str) -> Optional[str]:
         """Take screenshot with timestamp.
         
         Args:
             name: Base name for screenshot
             
         Returns:
-            Screenshot file path
+            Screenshot file path, or None if the screenshot mode skipped it
         """
         import time
         timestamp = int(time.time())
@@ -235,7 +595,7 @@ class HomePage(BasePage):
             has_images = await self.page.locator("img").count() > 0
             has_title = len(await self.get_page_title()) > 0
             
-            logger.info(f"Page verification - Nav: {has_navigation}, Images: {has_images}, Title: {has_title}")
+            logger.info("Page verification - Nav: {}, Images: {}, Title: {}", has_navigation, has_images, has_title)
             
             return has_navigation and (has_images or has_title)
             
@@ -253,49 +613,36 @@ class HomePage(BasePage):
     
     async def refresh_page(self) -> None:
         """Refresh the current page."""
+        self.last_results = None
         await self.page.reload(wait_until="networkidle")
         await self.wait_for_page_load()
     
-    async def apply_year_filter(self, year_from: int, year_to: int) -> None:
+    @timed_action()
+    async def apply_year_filter(self, year_from: int, year_to: int) -> Optional[dict]:
         """Apply year range filter.
         
         Args:
             year_from: Starting year
             year_to: Ending year
+            
+        Returns:
+            Results payload returned by the API for the new range, if captured
         """
         try:
-            logger.info(f"Applying year filter: {year_from}-{year_to}")
+            logger.info("Applying year filter: {}-{}", year_from, year_to)
             
             # Wait for sidebar to be visible
-            await self.page.wait_for_selector(self.sidebar, timeout=10000)
+            await self.wait_for_selector(self.sidebar, timeout=10000)
             
             # Wait for year dropdowns to be available
-            await self.page.wait_for_selector(self.year_from_dropdown, timeout=10000)
-            await self.page.wait_for_selector(self.year_to_dropdown, timeout=10000)
-            
-            # Click on year from dropdown control
-            await self.page.click(self.year_from_dropdown, timeout=5000)
-            await self.page.wait_for_timeout(500)
-            
-            # Type the year in the input field
-            await self.page.fill("#react-select-4-input", str(year_from))
-            await self.page.press("#react-select-4-input", "Enter")
-            logger.info(f"Selected year from: {year_from}")
+            await self.breaker.call(self.year_from_select.wait_ready(10000), "year from dropdown")
+            await self.breaker.call(self.year_to_select.wait_ready(10000), "year to dropdown")
             
-            # Wait a bit for the first dropdown to process
-            await self.page.wait_for_timeout(1000)
-            
-            # Click on year to dropdown control
-            await self.page.click(self.year_to_dropdown, timeout=5000)
-            await self.page.wait_for_timeout(500)
-            
-            # Type the year in the input field
-            await self.page.fill("#react-select-5-input", str(year_to))
-            await self.page.press("#react-select-5-input", "Enter")
-            logger.info(f"Selected year to: {year_to}")
-            
-            # Wait for filter to apply
-            await self.page.wait_for_timeout(3000)
+            # Both selections share one settle cycle
+            async with self.results_action("filter", match=self._final_range_matcher(year_to)) as capture:
+                await self._select(self.year_from_select, year_from)
+                await self._select(self.year_to_select, year_to)
+            return capture.payload
             
         except Exception as e:
             logger.error(f"Error applying year filter: {e}")
@@ -308,45 +655,10 @@ class HomePage(BasePage):
         Returns:
             List of years found in movie cards
         """
-        years = []
         try:
-            # Look for year information in movie cards
-            # This is a simplified approach - in a real scenario, you'd need to inspect
-            # the actual DOM structure to find where years are displayed
-            year_elements = await self.page.locator("[class*='year'], [class*='date'], [class*='release']").all()
-            
-            for element in year_elements:
-                try:
-                    if await element.is_visible():
-                        text = await element.text_content()
-                        if text:
-                            # Extract 4-digit years from text
-                            import re
-                            year_matches = re.findall(r'\b(19|20)\d{2}\b', text)
-                            for year_match in year_matches:
-                                years.append(int(year_match))
-                except:
-                    continue
-            
-            # If no specific year elements found, try to extract from any text
-            if not years:
-                all_text_elements = await self.page.locator("div, span, p").all()
-                for element in all_text_elements[:20]:  # Limit to first 20 elements
-                    try:
-                        if await element.is_visible():
-                            text = await element.text_content()
-                            if text:
-                                import re
-                                year_matches = re.findall(r'\b(19|20)\d{2}\b', text)
-                                for year_match in year_matches:
-                                    year_val = int(year_match)
-                                    if 1900 <= year_val <= 2024:  # Reasonable year range
-                                        years.append(year_val)
-                    except:
-                        continue
-            
-            logger.info(f"Found years: {years[:10]}")  # Log first 10 years
-            return years[:20]  # Return first 20 years to avoid too much data
+            years = (await self.get_results()).years
+            logger.info("Found {} years", len(years))
+            return years
             
         except Exception as e:
             logger.error(f"Error extracting movie years: {e}")
@@ -355,6 +667,10 @@ class HomePage(BasePage):
     async def verify_year_range(self, year_from: int, year_to: int) -> bool:
         """Verify that all visible movies are within the specified year range.
         
+        When the last action captured its results payload, every result's
+        API date is checked and the cards are verified against the payload;
+        otherwise the years shown on the cards are checked.
+        
         Args:
             year_from: Starting year
             year_to: Ending year
@@ -363,173 +679,292 @@ class HomePage(BasePage):
             True if all movies are within range
         """
         try:
-            years = await self.get_movie_years()
+            if self.last_results is not None:
+                # The API dates cover every result, not just cards showing a year
+                report = await self.verify_against_api()
+                out_of_range = [(title, year) for title, year in payload_years(self.last_results)
+                                if year is not None and not year_from <= year <= year_to]
+                if out_of_range:
+                    logger.warning(f"API returned years out of range: {out_of_range}")
+                return report.ok and not out_of_range
+            
+            results = await self.get_results()
             
-            if not years:
+            if not results.years:
                 logger.warning("No years found to verify")
                 return True  # If no years found, consider it passed
             
-            # Check if all years are within range
-            out_of_range = [year for year in years if not (year_from <= year <= year_to)]
+            # Check every card in one pass
+            out_of_range = results.outside_year_range(year_from, year_to)
             
             if out_of_range:
-                logger.warning(f"Found years out of range: {out_of_range}")
+                logger.warning(f"Found years out of range: {[(c.title, c.year) for c in out_of_range]}")
                 return False
             
-            logger.info(f"All {len(years)} years are within range {year_from}-{year_to}")
+            logger.info("All {} years are within range {}-{}", len(results.years), year_from, year_to)
             return True
             
         except Exception as e:
             logger.error(f"Error verifying year range: {e}")
             return False
     
-    async def apply_type_filter(self, content_type: str) -> None:
+    async def verify_content_type(self, content_type: str) -> bool:
+        """Verify that all visible cards showing a type are of the given type.
+        
+        Args:
+            content_type: 'movie' or 'tv_show'
+            
+        Returns:
+            True if no card shows a different type
+        """
+        try:
+            results = await self.get_results()
+            wrong_type = results.not_of_type(content_type)
+            
+            if wrong_type:
+                logger.warning(f"Found {len(wrong_type)} cards of another type: {[c.title for c in wrong_type]}")
+                return False
+            
+            logger.info("All {} cards match type {}", len(results), content_type)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error verifying content type: {e}")
+            return False
+    
+    async def verify_min_rating(self, min_rating: float) -> bool:
+        """Verify that all visible rated cards meet a minimum rating.
+        
+        Args:
+            min_rating: Minimum rating on the cards' 0-10 scale
+            
+        Returns:
+            True if no card is rated below the minimum
+        """
+        try:
+            results = await self.get_results()
+            below = results.below_rating(min_rating)
+            
+            if below:
+                logger.warning(f"Found ratings below {min_rating}: {[(c.title, c.rating) for c in below]}")
+                return False
+            
+            logger.info("All {} ratings are at least {}", len(results.ratings), min_rating)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error verifying ratings: {e}")
+            return False
+    
+    async def verify_genre(self, genre: str) -> bool:
+        """Verify that all visible cards listing genres include the given genre.
+        
+        Args:
+            genre: Genre name
+            
+        Returns:
+            True if no card lists genres without it
+        """
+        try:
+            results = await self.get_results()
+            mismatched = results.not_matching_genre(genre)
+            
+            if mismatched:
+                logger.warning(f"Found {len(mismatched)} cards without genre {genre}: {[c.title for c in mismatched]}")
+                return False
+            
+            logger.info("All cards listing genres include {}", genre)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error verifying genre: {e}")
+            return False
+    
+    @timed_action()
+    async def apply_type_filter(self, content_type: str) -> Optional[dict]:
         """Apply type filter (Movie or TV Show).
         
         Args:
             content_type: 'movie' or 'tv_show'
+            
+        Returns:
+            Results payload returned by the API for the new type, if captured
         """
         try:
-            logger.info(f"Applying type filter: {content_type}")
+            logger.info("Applying type filter: {}", content_type)
             
             # Wait for sidebar to be visible
-            await self.page.wait_for_selector(self.sidebar, timeout=10000)
-            
-            # Click on type dropdown control
-            await self.page.click(self.type_dropdown, timeout=5000)
-            await self.page.wait_for_timeout(500)
-            
-            # Type the content type in the input field
-            if content_type.lower() in ['movie', 'movies']:
-                await self.page.fill("#react-select-2-input", "Movie")
-                await self.page.press("#react-select-2-input", "Enter")
-                logger.info("Selected Movie type")
-            elif content_type.lower() in ['tv_show', 'tv', 'tv shows']:
-                await self.page.fill("#react-select-2-input", "TV Show")
-                await self.page.press("#react-select-2-input", "Enter")
-                logger.info("Selected TV Show type")
-            else:
-                raise ValueError(f"Invalid content type: {content_type}")
+            await self.wait_for_selector(self.sidebar, timeout=10000)
+            
+            option, media_path = self._type_option(content_type)
             
-            # Wait for filter to apply
-            await self.page.wait_for_timeout(2000)
+            async with self.results_action("filter", match=self._media_type_matcher(media_path)) as capture:
+                await self._select(self.type_select, option)
+            return capture.payload
             
         except Exception as e:
             logger.error(f"Error applying type filter: {e}")
             await self.take_screenshot("type_filter_error")
             raise
     
-    async def apply_genre_filter(self, genre: str) -> None:
+    @timed_action()
+    async def apply_genre_filter(self, genre: str) -> Optional[dict]:
         """Apply genre filter.
         
         Args:
             genre: Genre name to filter by
+            
+        Returns:
+            Results payload returned by the API for the genre, if captured
         """
         try:
-            logger.info(f"Applying genre filter: {genre}")
+            logger.info("Applying genre filter: {}", genre)
             
             # Wait for sidebar to be visible
-            await self.page.wait_for_selector(self.sidebar, timeout=10000)
-            
-            # Click on genre dropdown control
-            await self.page.click(self.genre_dropdown, timeout=5000)
-            await self.page.wait_for_timeout(500)
-            
-            # Type the genre in the input field
-            await self.page.fill("#react-select-3-input", genre)
-            await self.page.press("#react-select-3-input", "Enter")
-            logger.info(f"Selected genre: {genre}")
+            await self.wait_for_selector(self.sidebar, timeout=10000)
             
-            # Wait for filter to apply
-            await self.page.wait_for_timeout(2000)
+            async with self.results_action("filter") as capture:
+                await self._select(self.genre_select, genre)
+            return capture.payload
             
         except Exception as e:
             logger.error(f"Error applying genre filter: {e}")
             await self.take_screenshot("genre_filter_error")
             raise
     
-    async def apply_rating_filter(self, min_rating: int) -> None:
+    @timed_action()
+    async def apply_rating_filter(self, min_rating: int) -> Optional[dict]:
         """Apply rating filter.
         
         Args:
             min_rating: Minimum star rating (1-10)
+            
+        Returns:
+            Results payload returned by the API for the rating, if captured
         """
         try:
-            logger.info(f"Applying rating filter: {min_rating} stars")
+            logger.info("Applying rating filter: {} stars", min_rating)
             
             # Wait for sidebar to be visible
-            await self.page.wait_for_selector(self.sidebar, timeout=10000)
+            await self.wait_for_selector(self.sidebar, timeout=10000)
             
             # Find the rating section
             rating_section = self.page.locator(self.rating_section)
             await rating_section.wait_for(state="visible", timeout=5000)
             
-            # Look for star elements - try different approaches
-            star_selectors = [
-                "aside div:has-text('Ratings') + div [class*='star']",
-                "aside div:has-text('Ratings') + div [class*='rate']",
-                "aside div:has-text('Ratings') + div [class*='rating']",
-                "aside div:has-text('Ratings') + div [class*='★']",
-                "aside div:has-text('Ratings') + div [class*='star']"
-            ]
-            
-            star_elements = []
-            for selector in star_selectors:
-                try:
-                    elements = await self.page.locator(selector).all()
-                    if elements:
-                        star_elements = elements
-                        logger.info(f"Found {len(star_elements)} star elements with selector: {selector}")
-                        break
-                except:
-                    continue
-            
-            if not star_elements:
-                # Try to find any clickable elements in the rating section
-                rating_div = self.page.locator("aside div:has-text('Ratings') + div")
-                star_elements = await rating_div.locator("*").all()
-                logger.info(f"Found {len(star_elements)} elements in rating section")
+            star_elements = await self._star_elements()
             
             if len(star_elements) >= min_rating:
                 # Click on the star at the desired rating position
-                await star_elements[min_rating - 1].click(timeout=5000)
-                logger.info(f"Selected {min_rating} star rating")
+                async with self.results_action("filter") as capture:
+                    await star_elements[min_rating - 1].click(timeout=5000)
+                logger.info("Selected {} star rating", min_rating)
+                return capture.payload
             else:
                 logger.warning(f"Not enough star elements found for rating {min_rating}")
-                return
-            
-            # Wait for filter to apply
-            await self.page.wait_for_timeout(2000)
+                return None
             
         except Exception as e:
             logger.error(f"Error applying rating filter: {e}")
             await self.take_screenshot("rating_filter_error")
             raise
     
-    async def search_movies(self, search_term: str) -> None:
+    @timed_action("apply_filters")
+    async def apply_filters(self,
+                            content_type: Optional[str] = None,
+                            genre: Optional[str] = None,
+                            year_from: Optional[int] = None,
+                            year_to: Optional[int] = None,
+                            min_rating: Optional[int] = None) -> Optional[dict]:
+        """Apply several filters in one settle cycle.
+        
+        Each selection still fires its own request, but the grid is only
+        waited on once, for the response that reflects every selection
+        (so a genre or rating picked after the type or years is not lost).
+        
+        Args:
+            content_type: 'movie' or 'tv_show'
+            genre: Genre name
+            year_from: Starting year
+            year_to: Ending year
+            min_rating: Minimum star rating (1-10)
+        
+        Returns:
+            Results payload returned by the API for the combined filters, if captured
+        """
+        try:
+            logger.info("Applying filters: type={}, genre={}, years={}-{}, rating={}",
+                        content_type, genre, year_from, year_to, min_rating)
+            await self.wait_for_selector(self.sidebar, timeout=10000)
+            
+            matchers = []
+            if content_type:
+                option, media_path = self._type_option(content_type)
+                matchers.append(self._media_type_matcher(media_path))
+            if year_to is not None:
+                matchers.append(self._final_range_matcher(year_to))
+            if genre:
+                matchers.append(self._params_matcher("with_genres"))
+            if min_rating:
+                matchers.append(self._params_matcher("vote_average.gte"))
+            
+            def is_final(response: Response) -> bool:
+                return all(match(response) for match in matchers)
+            
+            async with self.results_action("filter", match=is_final if matchers else None) as capture:
+                if content_type:
+                    await self._select(self.type_select, option)
+                if genre:
+                    await self._select(self.genre_select, genre)
+                if year_from is not None:
+                    await self._select(self.year_from_select, year_from)
+                if year_to is not None:
+                    await self._select(self.year_to_select, year_to)
+                if min_rating:
+                    star_elements = await self._star_elements()
+                    if len(star_elements) < min_rating:
+                        raise ValueError(f"Not enough star elements found for rating {min_rating}")
+                    await star_elements[min_rating - 1].click(timeout=5000)
+            return capture.payload
+        
+        except Exception as e:
+            logger.error(f"Error applying filters: {e}")
+            await self.take_screenshot("combined_filters_error")
+            raise
+    
+    @timed_action("search")
+    async def search_movies(self, search_term: str) -> Optional[dict]:
         """Search for movies by title.
         
         Args:
             search_term: Search term to look for
+            
+        Returns:
+            Search payload returned by the API for the term, if captured
         """
         try:
-            logger.info(f"Searching for: {search_term}")
+            logger.info("Searching for: {}", search_term)
             
             # Look for search input field directly (based on the image showing input with placeholder="SEARCH")
             search_input = self.page.locator("input[placeholder='SEARCH'], input[name='search']")
             
+            def is_this_search(response: Response) -> bool:
+                # Typing may fire requests for partial terms - keep the final one
+                query = self._query_params(response).get("query")
+                return query is None or query == [search_term]
+            
             if await search_input.count() > 0:
                 # Clear any existing text and enter new search term
-                await search_input.first.click()
-                await search_input.first.fill("")  # Clear existing text
-                await search_input.first.fill(search_term)
-                await search_input.first.press("Enter")
-                logger.info(f"Entered search term: {search_term}")
-                
-                # Wait for search results to load
-                await self.page.wait_for_timeout(3000)
+                async with self.results_action("search", match=is_this_search) as capture:
+                    await search_input.first.click()
+                    await search_input.first.fill("")  # Clear existing text
+                    await search_input.first.fill(search_term)
+                    await search_input.first.press("Enter")
+                logger.debug("Entered search term: {}", search_term)
+                return capture.payload
             else:
                 logger.warning("Search input field not found")
+                return None
                 
         except Exception as e:
             logger.error(f"Error searching movies: {e}")
@@ -541,11 +976,11 @@ class HomePage(BasePage):
         try:
             search_input = self.page.locator("input[placeholder='SEARCH'], input[name='search']")
             if await search_input.count() > 0:
-                await search_input.first.click()
-                await search_input.first.fill("")
-                await search_input.first.press("Enter")
-                logger.info("Cleared search field")
-                await self.page.wait_for_timeout(2000)
+                async with self.results_action("search"):
+                    await search_input.first.click()
+                    await search_input.first.fill("")
+                    await search_input.first.press("Enter")
+                logger.debug("Cleared search field")
         except Exception as e:
             logger.warning(f"Error clearing search: {e}")
     
@@ -558,7 +993,7 @@ class HomePage(BasePage):
         try:
             # Count movie images in search results
             count = await self.page.locator(self.movie_images).count()
-            logger.info(f"Found {count} search results")
+            logger.info("Found {} search results", count)
             return count
         except Exception as e:
             logger.error(f"Error counting search results: {e}")
@@ -567,6 +1002,10 @@ class HomePage(BasePage):
     async def verify_search_results_contain(self, search_term: str) -> bool:
         """Verify that search results contain the search term.
         
+        With a captured search payload the cards must match it exactly and
+        one of its titles must contain the term; otherwise card titles (or,
+        failing that, the page text) are scanned.
+        
         Args:
             search_term: The term that was searched for
             
@@ -574,14 +1013,26 @@ class HomePage(BasePage):
             True if search results contain the term
         """
         try:
-            # Get all visible text on the page
-            page_text = await self.page.text_content("body")
             search_term_lower = search_term.lower()
-            page_text_lower = page_text.lower()
+            if self.last_results is not None:
+                # The page must show exactly what the search returned, and the
+                # term must be in one of the API titles (original titles included)
+                report = await self.verify_against_api()
+                contains_term = report.ok and any(search_term_lower in title.lower()
+                                                  for title in payload_titles(self.last_results))
+                logger.info("Search term '{}' found in API-verified results: {}", search_term, contains_term)
+                return contains_term
+            
+            titles = [title.lower() for title in (await self.get_results()).titles]
             
-            # Check if search term appears in the page content
-            contains_term = search_term_lower in page_text_lower
-            logger.info(f"Search term '{search_term}' found in results: {contains_term}")
+            if titles:
+                # Check if search term appears in any result card title
+                contains_term = any(search_term_lower in title for title in titles)
+            else:
+                # No cards recognised - fall back to the page text
+                page_text = await self.page.text_content("body")
+                contains_term = search_term_lower in page_text.lower()
+            logger.info("Search term '{}' found in results: {}", search_term, contains_term)
             return contains_term
             
         except Exception as e:
@@ -608,7 +1059,7 @@ class HomePage(BasePage):
                 except:
                     continue
             
-            logger.info(f"Found {len(suggestions)} search suggestions")
+            logger.info("Found {} search suggestions", len(suggestions))
             return suggestions
             
         except Exception as e:
@@ -622,18 +1073,10 @@ class HomePage(BasePage):
             True if pagination is visible
         """
         try:
-            # Look for pagination elements
-            pagination_selectors = [
-                "button:has-text('Next')",
-                "button:has-text('Previous')",
-                "[class*='pagination']",
-                "[class*='page']"
-            ]
-            
-            for selector in pagination_selectors:
-                if await self.page.locator(selector).count() > 0:
-                    logger.info(f"Pagination found with selector: {selector}")
-                    return True
+            selector = await self.resolve(*self.pagination_selectors, verify=True)
+            if selector:
+                logger.debug("Pagination found with selector: {}", selector)
+                return True
             
             logger.info("No pagination found")
             return False
@@ -642,6 +1085,7 @@ class HomePage(BasePage):
             logger.error(f"Error checking pagination: {e}")
             return False
     
+    @timed_action("paginate")
     async def navigate_to_next_page(self) -> bool:
         """Navigate to the next page.
         
@@ -653,11 +1097,9 @@ class HomePage(BasePage):
             next_button = self.page.locator("button:has-text('Next')")
             
             if await next_button.count() > 0 and await next_button.is_enabled():
-                await next_button.click(timeout=5000)
-                logger.info("Clicked next page button")
-                
-                # Wait for page to load
-                await self.page.wait_for_timeout(3000)
+                async with self.results_action("paginate"):
+                    await next_button.click(timeout=5000)
+                logger.debug("Clicked next page button")
                 return True
             else:
                 logger.info("Next page button not available")
@@ -665,4 +1107,59 @@ class HomePage(BasePage):
                 
         except Exception as e:
             logger.error(f"Error navigating to next page: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    async def enable_performance_observers(self) -> None:
+        """Observe LCP, layout shifts and long tasks from the next navigation on.
+        
+        Must be called before navigating for load metrics to be complete.
+        """
+        await self.page.add_init_script(PERF_OBSERVER_SCRIPT)
+        logger.debug("Performance observers registered")
+    
+    async def performance_now(self) -> float:
+        """Current ``performance.now()`` of the page, to mark an action start.
+        
+        Returns:
+            Milliseconds since navigation start
+        """
+        return await self.page.evaluate("() => performance.now()")
+    
+    async def collect_performance_metrics(self, since: float = 0) -> Dict[str, Any]:
+        """Collect Navigation Timing, Web Vitals and heap metrics.
+        
+        Load metrics (TTFB, FCP, LCP) describe the last navigation. CLS, long
+        tasks, request count and transfer bytes cover everything from
+        ``since`` on, so an action can be measured by passing the value of
+        ``performance_now()`` taken just before it.
+        
+        Args:
+            since: performance.now() value to count from, 0 for the whole page
+            
+        Returns:
+            Metric name -> value (None when the browser cannot measure it)
+        """
+        try:
+            metrics = await self.page.evaluate(PERF_COLLECT_SCRIPT, since)
+            if not metrics.pop("observed"):
+                logger.warning("Performance observers not registered - LCP, CLS and long tasks unavailable")
+            
+            # Chromium reports the JS heap through CDP; other browsers keep the
+            # performance.memory value (or None)
+            try:
+                cdp = await self.page.context.new_cdp_session(self.page)
+                await cdp.send("Performance.enable")
+                cdp_metrics = (await cdp.send("Performance.getMetrics"))["metrics"]
+                await cdp.detach()
+                heap = next((m["value"] for m in cdp_metrics if m["name"] == "JSHeapUsedSize"), None)
+                if heap is not None:
+                    metrics["js_heap_bytes"] = heap
+            except Exception as e:
+                logger.debug("CDP metrics unavailable: {}", e)
+            
+            logger.info("Performance metrics: {}", metrics)
+            return metrics
+            
+        except Exception as e:
+            logger.error(f"Error collecting performance metrics: {e}")
+            raise
@@ -0,0 +1,225 @@
+"""Typed result models read from the TMDB demo site pages."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Spellings of the two content types used by the site, the API and the tests
+CONTENT_TYPES = {
+    "movie": "movie",
+    "movies": "movie",
+    "tv": "tv",
+    "tv_show": "tv",
+    "tv show": "tv",
+    "tv shows": "tv",
+}
+
+
+# TMDB genre ids per content type (the ids TMDB's /genre/<type>/list returns)
+GENRE_IDS = {
+    "movie": {
+        "Action": 28, "Adventure": 12, "Animation": 16, "Comedy": 35, "Crime": 80,
+        "Documentary": 99, "Drama": 18, "Family": 10751, "Fantasy": 14, "History": 36,
+        "Horror": 27, "Music": 10402, "Mystery": 9648, "Romance": 10749,
+        "Science Fiction": 878, "TV Movie": 10770, "Thriller": 53, "War": 10752, "Western": 37,
+    },
+    "tv": {
+        "Action & Adventure": 10759, "Animation": 16, "Comedy": 35, "Crime": 80,
+        "Documentary": 99, "Drama": 18, "Family": 10751, "Kids": 10762, "Mystery": 9648,
+        "News": 10763, "Reality": 10764, "Sci-Fi & Fantasy": 10765, "Soap": 10766,
+        "Talk": 10767, "War & Politics": 10768, "Western": 37,
+    },
+}
+
+
+def genre_id(genre: str, content_type: str = "movie") -> int:
+    """TMDB id of a genre name.
+    
+    Args:
+        genre: Genre name as shown in the genre dropdown (case-insensitive)
+        content_type: Any spelling accepted by normalize_content_type
+    
+    Returns:
+        Genre id
+    """
+    genres = GENRE_IDS[normalize_content_type(content_type)]
+    for name, id_ in genres.items():
+        if name.lower() == genre.strip().lower():
+            return id_
+    raise ValueError(f"Unknown {content_type} genre: {genre}")
+
+
+def normalize_content_type(content_type: str) -> str:
+    """Map a content type spelling to "movie" or "tv".
+    
+    Args:
+        content_type: e.g. "Movie", "tv_show", "TV Shows"
+    
+    Returns:
+        "movie" or "tv"
+    """
+    try:
+        return CONTENT_TYPES[content_type.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Invalid content type: {content_type}")
+
+
+@dataclass(frozen=True, slots=True)
+class MovieCard:
+    """One movie or TV show card in the results grid.
+    
+    Fields the card does not show are None (or an empty tuple for genres).
+    """
+    id: Optional[int] = None
+    title: Optional[str] = None
+    year: Optional[int] = None
+    type: Optional[str] = None
+    rating: Optional[float] = None
+    poster_url: Optional[str] = None
+    genres: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MovieCard":
+        """Build a card from the dict returned by ``HomePage.extract_cards``.
+        
+        Args:
+            data: Card fields, unknown keys are ignored
+        
+        Returns:
+            MovieCard
+        """
+        return cls(
+            id=data.get("id"),
+            title=data.get("title") or None,
+            year=data.get("year"),
+            type=data.get("type"),
+            rating=data.get("rating"),
+            poster_url=data.get("poster_url"),
+            genres=tuple(data.get("genres") or ()),
+        )
+
+
+class ResultSet:
+    """Every card of a results page, with whole-set checks.
+    
+    The ``outside_*``/``not_*`` methods return the offending cards so a
+    failure can be logged; the ``all_*`` predicates are their boolean form.
+    Cards that do not show the field being checked are skipped.
+    """
+    
+    __slots__ = ("cards",)
+    
+    def __init__(self, cards: Iterable[MovieCard] = ()) -> None:
+        """Initialize ResultSet.
+        
+        Args:
+            cards: Cards in page order
+        """
+        self.cards: Tuple[MovieCard, ...] = tuple(cards)
+    
+    @classmethod
+    def from_dicts(cls, data: Iterable[Dict[str, Any]]) -> "ResultSet":
+        """Build a result set from ``HomePage.extract_cards`` output.
+        
+        Args:
+            data: Card dicts
+        
+        Returns:
+            ResultSet
+        """
+        return cls(MovieCard.from_dict(item) for item in data)
+    
+    def __len__(self) -> int:
+        return len(self.cards)
+    
+    def __iter__(self) -> Iterator[MovieCard]:
+        return iter(self.cards)
+    
+    def __getitem__(self, index: int) -> MovieCard:
+        return self.cards[index]
+    
+    def __bool__(self) -> bool:
+        return bool(self.cards)
+    
+    def __repr__(self) -> str:
+        return f"ResultSet({len(self.cards)} cards)"
+    
+    @property
+    def titles(self) -> List[str]:
+        """Titles of the cards that show one."""
+        return [card.title for card in self.cards if card.title]
+    
+    @property
+    def years(self) -> List[int]:
+        """Years of the cards that show one."""
+        return [card.year for card in self.cards if card.year is not None]
+    
+    @property
+    def ratings(self) -> List[float]:
+        """Ratings of the cards that show one."""
+        return [card.rating for card in self.cards if card.rating is not None]
+    
+    def outside_year_range(self, year_from: int, year_to: int) -> List[MovieCard]:
+        """Cards whose year falls outside an inclusive range.
+        
+        Args:
+            year_from: First allowed year
+            year_to: Last allowed year
+        
+        Returns:
+            Offending cards
+        """
+        return [card for card in self.cards
+                if card.year is not None and not year_from <= card.year <= year_to]
+    
+    def not_of_type(self, content_type: str) -> List[MovieCard]:
+        """Cards of a different content type.
+        
+        Args:
+            content_type: Any spelling accepted by ``normalize_content_type``
+        
+        Returns:
+            Offending cards
+        """
+        wanted = normalize_content_type(content_type)
+        return [card for card in self.cards if card.type is not None and card.type != wanted]
+    
+    def below_rating(self, min_rating: float) -> List[MovieCard]:
+        """Cards rated below a minimum.
+        
+        Args:
+            min_rating: Minimum rating on the card's scale
+        
+        Returns:
+            Offending cards
+        """
+        return [card for card in self.cards if card.rating is not None and card.rating < min_rating]
+    
+    def not_matching_genre(self, genre: str) -> List[MovieCard]:
+        """Cards whose listed genres do not include a genre.
+        
+        Args:
+            genre: Genre name, compared case-insensitively
+        
+        Returns:
+            Offending cards
+        """
+        wanted = genre.strip().lower()
+        return [card for card in self.cards
+                if card.genres and wanted not in (g.lower() for g in card.genres)]
+    
+    def all_in_year_range(self, year_from: int, year_to: int) -> bool:
+        """Whether every dated card falls within an inclusive year range."""
+        return not self.outside_year_range(year_from, year_to)
+    
+    def all_of_type(self, content_type: str) -> bool:
+        """Whether every typed card is of the given content type."""
+        return not self.not_of_type(content_type)
+    
+    def all_min_rating(self, min_rating: float) -> bool:
+        """Whether every rated card meets a minimum rating."""
+        return not self.below_rating(min_rating)
+    
+    def all_match_genre(self, genre: str) -> bool:
+        """Whether every card listing genres includes the given genre."""
+        return not self.not_matching_genre(genre)
@@ -0,0 +1,126 @@
+"""Result-set oracle: the rendered cards checked against the API payload."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from pages.models import MovieCard, ResultSet
+
+
+def _title_key(title: Optional[str]) -> str:
+    """Normalized title used to join cards without an id."""
+    return " ".join((title or "").casefold().split())
+
+
+def _item_title(item: Dict[str, Any]) -> Optional[str]:
+    """Display title of a TMDB result (movies have title, TV shows name)."""
+    return item.get("title") or item.get("name")
+
+
+def _item_year(item: Dict[str, Any]) -> Optional[int]:
+    """Release or first-air year of a TMDB result."""
+    date = item.get("release_date") or item.get("first_air_date") or ""
+    return int(date[:4]) if date[:4].isdigit() else None
+
+
+@dataclass
+class OracleReport:
+    """Differences between a results payload and the cards on the page."""
+    expected: int
+    rendered: int
+    matched: int = 0
+    missing: List[Dict[str, Any]] = field(default_factory=list)
+    extra: List[MovieCard] = field(default_factory=list)
+    wrong_order: List[MovieCard] = field(default_factory=list)
+    wrong_year: List[Tuple[MovieCard, Optional[int]]] = field(default_factory=list)
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the page shows exactly the payload, in order, with the right years."""
+        return not (self.missing or self.extra or self.wrong_order or self.wrong_year)
+    
+    def summary(self) -> str:
+        """One-line description of the mismatches."""
+        if self.ok:
+            return f"all {self.matched} cards match the API results"
+        parts = []
+        if self.missing:
+            parts.append(f"missing {[_item_title(item) for item in self.missing]}")
+        if self.extra:
+            parts.append(f"extra {[card.title for card in self.extra]}")
+        if self.wrong_order:
+            parts.append(f"out of order {[card.title for card in self.wrong_order]}")
+        if self.wrong_year:
+            parts.append(f"wrong year {[(card.title, card.year, year) for card, year in self.wrong_year]}")
+        return f"{self.matched}/{self.expected} matched; " + "; ".join(parts)
+
+
+def compare_results(payload: Dict[str, Any], results: ResultSet) -> OracleReport:
+    """Join the rendered cards to the payload's results in one pass.
+    
+    Cards are matched by TMDB id where the card shows one, otherwise by
+    normalized title (first unmatched result with that title).
+    
+    Args:
+        payload: discover/search JSON captured from the API
+        results: Cards extracted from the page, in page order
+    
+    Returns:
+        OracleReport
+    """
+    items = payload.get("results") or []
+    by_id: Dict[int, int] = {}
+    by_title: Dict[str, List[int]] = {}
+    for position, item in enumerate(items):
+        if item.get("id") is not None:
+            by_id[item["id"]] = position
+        by_title.setdefault(_title_key(_item_title(item)), []).append(position)
+    
+    report = OracleReport(expected=len(items), rendered=len(results))
+    used = set()
+    last_position = -1
+    for card in results:
+        position = by_id.get(card.id) if card.id is not None else None
+        if position is None or position in used:
+            candidates = by_title.get(_title_key(card.title), [])
+            position = next((p for p in candidates if p not in used), None)
+        if position is None:
+            report.extra.append(card)
+            continue
+        used.add(position)
+        report.matched += 1
+        if position < last_position:
+            report.wrong_order.append(card)
+        last_position = max(last_position, position)
+        year = _item_year(items[position])
+        if card.year is not None and year is not None and card.year != year:
+            report.wrong_year.append((card, year))
+    report.missing = [item for position, item in enumerate(items) if position not in used]
+    return report
+
+
+def payload_years(payload: Dict[str, Any]) -> List[Tuple[Optional[str], Optional[int]]]:
+    """(title, year) of every result in a payload.
+    
+    Args:
+        payload: discover/search JSON
+    
+    Returns:
+        List of (title, year) tuples in payload order
+    """
+    return [(_item_title(item), _item_year(item)) for item in payload.get("results") or []]
+
+
+def payload_titles(payload: Dict[str, Any]) -> List[str]:
+    """Every title a payload's results are known by (display and original).
+    
+    Args:
+        payload: discover/search JSON
+    
+    Returns:
+        Titles in payload order
+    """
+    titles = []
+    for item in payload.get("results") or []:
+        for key in ("title", "name", "original_title", "original_name"):
+            if item.get(key):
+                titles.append(item[key])
+    return titles
@@ -3,12 +3,13 @@
 
 import subprocess
 import sys
+import os
 import argparse
 from pathlib import Path
 import time
 
 
-def run_pytest(command, description):
+def run_pytest(command, description, env=None):
     """Run pytest command and show results."""
     print(f"\n🧪 {description}")
     print("=" * 60)
@@ -16,7 +17,7 @@ def run_pytest(command, description):
     start_time = time.time()
     
     try:
-        result = subprocess.run(command, shell=True)
+        result = subprocess.run(command, shell=True, env=env)
         duration = time.time() - start_time
         
         if result.returncode == 0:
@@ -34,12 +35,32 @@ def run_pytest(command, description):
 def main():
     """Main test runner function."""
     parser = argparse.ArgumentParser(description="RR QA Automation Test Runner")
-    parser.add_argument("--suite", choices=["smoke", "regression", "api", "ui", "all"], 
+    parser.add_argument("--suite", choices=["smoke", "regression", "api", "ui", "perf", "all"], 
                        default="smoke", help="Test suite to run")
     parser.add_argument("--browser", choices=["chromium", "firefox", "webkit"], 
                        default="chromium", help="Browser to use")
     parser.add_argument("--headed", action="store_true", help="Run in headed mode")
     parser.add_argument("--parallel", type=int, default=1, help="Number of parallel workers")
+    parser.add_argument("--network-mode", choices=["live", "record", "replay"],
+                       default="live", help="Hit the live site or record/replay HAR archives")
+    parser.add_argument("--shard", default=None,
+                       help="Run shard i of N (i/N), balanced by historical test durations")
+    parser.add_argument("--changed-since", default=None, metavar="REF",
+                       help="Run only tests affected by changes since a git ref (needs an impact map)")
+    parser.add_argument("--record-impact", action="store_true",
+                       help="Record the test -> page-object function map used by --changed-since")
+    parser.add_argument("--screenshot-mode", choices=["always", "on-failure", "sampled", "off"], default=None,
+                       help="Which screenshots to keep (default: SCREENSHOT_MODE or always)")
+    parser.add_argument("--fast-logging", action="store_true",
+                       help="Lean logging profile; logging cost per action shows in the timing report")
+    parser.add_argument("--load", action="store_true",
+                       help="Replay HomePage flows with concurrent virtual users instead of running tests")
+    parser.add_argument("--load-target", choices=["api", "ui"], default="api",
+                       help="api: flows as TMDB API calls (local fake server); ui: flows in browsers")
+    parser.add_argument("--users", type=int, default=10, help="Virtual users for --load")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="Seconds to start all virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds at full load")
+    parser.add_argument("--processes", type=int, default=1, help="Processes to spread virtual users over")
     
     args = parser.parse_args()
     
@@ -49,10 +70,26 @@ def main():
     print(f"Browser: {args.browser}")
     print(f"Mode: {'Headed' if args.headed else 'Headless'}")
     print(f"Workers: {args.parallel}")
+    print(f"Network: {args.network_mode}")
     
     # Ensure reports directory exists
     Path("reports/html").mkdir(parents=True, exist_ok=True)
     
+    if args.load:
+        command = " ".join([
+            sys.executable, "-m", "framework.load",
+            f"--target={args.load_target}",
+            f"--users={args.users}",
+            f"--ramp-up={args.ramp_up}",
+            f"--duration={args.duration}",
+            f"--processes={args.processes}",
+            f"--network-mode={args.network_mode}",
+            "--report=reports/load/load.json"
+        ])
+        success = run_pytest(command, f"Load test: {args.users} {args.load_target} users")
+        print(f"\n📊 Load report available at: reports/load/load.json")
+        sys.exit(0 if success else 1)
+    
     # Base pytest command
     base_cmd = [
         "pytest",
@@ -65,8 +102,28 @@ def main():
     if args.headed:
         base_cmd.append("--headed")
     
+    if args.network_mode != "live":
+        base_cmd.append(f"--network-mode={args.network_mode}")
+    
     if args.parallel > 1:
-        base_cmd.extend(["-n", str(args.parallel)])
+        # Tests arrive longest first (durations in reports/durations.json),
+        # so the load scheduler hands the slow UI tests out early
+        base_cmd.extend(["-n", str(args.parallel), "--dist", "load"])
+    
+    if args.shard:
+        base_cmd.append(f"--shard={args.shard}")
+    
+    if args.changed_since:
+        base_cmd.append(f"--changed-since={args.changed_since}")
+    
+    if args.record_impact:
+        base_cmd.append("--record-impact")
+    
+    if args.screenshot_mode:
+        base_cmd.append(f"--screenshot-mode={args.screenshot_mode}")
+    
+    if args.fast_logging:
+        base_cmd.append("--fast-logging")
     
     # Define test commands based on suite
     test_commands = {
@@ -74,17 +131,24 @@ def main():
         "regression": base_cmd + ["-m", "regression"],
         "api": base_cmd + ["tests/api/"],
         "ui": base_cmd + ["tests/ui/"],
+        "perf": base_cmd + ["tests/perf/"],
         "all": base_cmd + ["tests/"]
     }
     
+    # The browser pool reads these, one browser per worker
+    env = dict(os.environ,
+               BROWSER=args.browser,
+               HEADLESS="false" if args.headed else "true")
+    
     # Run the selected test suite
     command = " ".join(test_commands[args.suite])
-    success = run_pytest(command, f"Running {args.suite.upper()} tests")
+    success = run_pytest(command, f"Running {args.suite.upper()} tests", env=env)
     
     # Show results location
     print(f"\n📊 Test reports available at:")
     print(f"   HTML Report: reports/html/report.html")
-    print(f"   Screenshots: reports/screenshots/")
+    print(f"   Action Timing: reports/html/timing.html")
+    print(f"   Screenshots: reports/artifacts/ (per-run manifests in runs/)")
     print(f"   Logs: logs/")
     
     if not success:
@@ -0,0 +1,42 @@
+"""Load generation tests against the local fake TMDB API."""
+
+import pytest
+from loguru import logger
+from framework.fake_tmdb.server import FakeTMDBServer
+from framework.load import LoadPlan, run_users, summarize
+
+
+@pytest.mark.api
+@pytest.mark.asyncio
+class TestLoad:
+    """Test class for the load generation mode."""
+    
+    async def test_api_load_against_fake_server(self):
+        """
+        Test Case: TC040 - Virtual Users Against the Local API
+        Priority: Medium
+        
+        Runs the api_browse flow with ramped-up virtual users against the
+        fake server and checks every step is measured without errors.
+        """
+        # A dedicated server, so FAKE_API_ERROR_RATE cannot inject errors here
+        with FakeTMDBServer(error_rate=0) as fake_tmdb:
+            plan = LoadPlan(target="api", users=8, ramp_up_s=0.2, duration_s=0.5,
+                            base_url=fake_tmdb.base_url, user_ids=list(range(8)))
+            
+            samples = await run_users(plan)
+        summary = summarize(samples, plan.ramp_up_s + plan.duration_s)
+        logger.info(f"Load summary: {summary}")
+        
+        assert {"category", "filter", "search", "paginate"} <= set(summary), "Missing load steps"
+        for step, stats in summary.items():
+            assert stats["count"] > 0, f"No samples for step {step}"
+            assert stats["error_rate"] == 0, f"Step {step} had {stats['errors']} errors"
+            assert stats["p95_ms"] >= stats["p50_ms"], f"Inconsistent percentiles for {step}"
+        
+        # Users start one after another over the ramp-up window
+        first_start = {}
+        for sample in samples:
+            first_start.setdefault(sample.user, sample.started_at)
+        starts = [first_start[u] for u in sorted(first_start)]
+        assert starts == sorted(starts), "Users did not start in ramp-up order"
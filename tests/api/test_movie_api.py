@@ -1,113 +1,209 @@
 """API tests for movie data validation."""
 
 import pytest
-import requests
 import asyncio
-from typing import Dict, Any
+import time
 from loguru import logger
 from config.settings import config
+from framework.api_client import TMDBApiClient, TMDBApiError, PagedResults
 
 
 @pytest.mark.api
 @pytest.mark.smoke
+@pytest.mark.asyncio
 class TestMovieAPI:
     """Test class for Movie API functionality."""
     
-    def setup_method(self):
-        """Setup for each test method."""
-        self.base_url = "https://api.themoviedb.org/3"
-        self.session = requests.Session()
-        # Note: TMDB API requires API key, but we'll test what we can
+    async def _call(self, coro):
+        """Await a typed client call, skipping if the API needs a key."""
+        try:
+            return await coro
+        except TMDBApiError as e:
+            if e.status == 401:
+                pytest.skip("API key required for this endpoint")
+            raise
     
-    def test_api_connectivity(self):
+    async def test_api_connectivity(self, api_client: TMDBApiClient):
         """
         Test Case: TC024 - API Connectivity Test
         Priority: High
         
         Basic connectivity test to movie API endpoints.
         """
-        # Test basic connectivity to TMDB API with retry logic
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # Add headers to avoid potential blocking
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                    'Accept': 'application/json'
-                }
-                response = self.session.get(
-                    f"{self.base_url}/movie/popular", 
-                    timeout=10, 
-                    headers=headers
-                )
-                logger.info(f"API Response Status: {response.status_code}")
-                
-                # Even without API key, we should get a structured error response
-                assert response.status_code in [200, 401], f"Unexpected status code: {response.status_code}"
-                
-                # Check response is JSON
-                response_data = response.json()
-                assert isinstance(response_data, dict), "Response should be JSON object"
-                
-                # Validate error response structure (expected without API key)
-                if response.status_code == 401:
-                    assert "status_code" in response_data, "Error response should contain status_code"
-                    assert "status_message" in response_data, "Error response should contain status_message"
-                    logger.info(f"API error response validated: {response_data.get('status_message')}")
-                
-                logger.info("API connectivity test passed")
-                return  # Success, exit retry loop
-                
-            except requests.exceptions.ConnectionError as e:
-                logger.warning(f"Connection attempt {attempt + 1} failed: {e}")
-                if attempt == max_retries - 1:
-                    pytest.skip(f"API connectivity failed after {max_retries} attempts: {e}")
-                continue
-            except requests.exceptions.RequestException as e:
-                logger.error(f"API connectivity failed: {e}")
-                pytest.fail(f"Could not connect to API: {e}")
+        # Retries with backoff are handled by the client
+        response = await api_client.get("/movie/popular")
+        logger.info(f"API Response Status: {response.status_code}")
+        
+        # Even without API key, we should get a structured error response
+        assert response.status_code in [200, 401], f"Unexpected status code: {response.status_code}"
+        
+        # Check response is JSON
+        response_data = response.json()
+        assert isinstance(response_data, dict), "Response should be JSON object"
+        
+        # Validate error response structure (expected without API key)
+        if response.status_code == 401:
+            assert "status_code" in response_data, "Error response should contain status_code"
+            assert "status_message" in response_data, "Error response should contain status_message"
+            logger.info(f"API error response validated: {response_data.get('status_message')}")
+        
+        logger.info("API connectivity test passed")
     
-    def test_api_response_structure(self):
+    async def test_api_response_structure(self, api_client: TMDBApiClient):
         """
         Test Case: TC025 - API Response Structure
         Priority: Medium
         
         Validate API response structure.
         """
-        try:
-            response = self.session.get(f"{self.base_url}/movie/popular", timeout=10)
-            response_data = response.json()
+        popular = await self._call(api_client.popular_movies())
+        
+        # The typed model already enforces the paging keys and item shape
+        assert isinstance(popular, PagedResults)
+        assert popular.page == 1
+        assert len(popular.results) <= popular.total_results
+        for movie in popular.results:
+            assert movie.id > 0 and movie.display_title, f"Malformed movie: {movie}"
+        logger.info(f"Popular page 1 of {popular.total_pages}: {len(popular.results)} movies")
+    
+    async def test_discover_movies_by_year_range(self, api_client: TMDBApiClient):
+        """
+        Test Case: TC029 - Discover Movies by Year Range
+        Priority: High
+        
+        Every discover result must fall inside the requested release window.
+        """
+        data = await self._call(api_client.discover("movie", **{
+            "primary_release_date.gte": "2020-01-01",
+            "primary_release_date.lte": "2023-12-31",
+        }))
+        
+        assert data.results, "Discover should return movies for 2020-2023"
+        for movie in data.results:
+            assert 2020 <= movie.year <= 2023, f"{movie.display_title} released in {movie.year}"
+        logger.info(f"{data.total_results} movies released 2020-2023")
+    
+    async def test_discover_tv_by_genre_and_rating(self, api_client: TMDBApiClient):
+        """
+        Test Case: TC030 - Discover TV by Genre and Rating
+        Priority: Medium
+        
+        Genre and minimum rating filters combine on the TV endpoint.
+        """
+        data = await self._call(api_client.discover("tv", with_genres="10765", **{"vote_average.gte": "8.5"}))
+        
+        assert data.results, "Discover should return Sci-Fi & Fantasy shows rated 8.5+"
+        for show in data.results:
+            assert 10765 in show.genre_ids, f"{show.display_title} is not Sci-Fi & Fantasy"
+            assert show.vote_average >= 8.5, f"{show.display_title} rated {show.vote_average}"
+    
+    async def test_search_multi_is_case_insensitive(self, api_client: TMDBApiClient):
+        """
+        Test Case: TC031 - Multi Search Case Insensitivity
+        Priority: Medium
+        
+        "POOL" and "pool" return the same titles, all containing the term.
+        """
+        upper, lower = await asyncio.gather(
+            self._call(api_client.search_multi("POOL")),
+            self._call(api_client.search_multi("pool"))
+        )
+        
+        assert upper.results, "Search for POOL should return results"
+        assert [r.id for r in upper.results] == [r.id for r in lower.results]
+        for item in upper.results:
+            assert "pool" in item.display_title.lower(), f"Result '{item.display_title}' does not contain the term"
+    
+    async def test_genre_lists(self, api_client: TMDBApiClient):
+        """
+        Test Case: TC032 - Genre Lists
+        Priority: Low
+        
+        Movie and TV genre lists expose id/name pairs.
+        """
+        movie_genres, tv_genres = await asyncio.gather(
+            self._call(api_client.genres("movie")),
+            self._call(api_client.genres("tv"))
+        )
+        assert movie_genres.genres, "No movie genres returned"
+        assert tv_genres.genres, "No tv genres returned"
+    
+    async def test_injected_errors_keep_error_structure(self, api_client: TMDBApiClient):
+        """
+        Test Case: TC033 - Error Injection
+        Priority: Medium
+        
+        Injected 429/500/503 responses and malformed parameters carry the
+        TMDB error structure.
+        """
+        if config.api_target == "live":
+            pytest.skip("Error injection needs the local fake TMDB server")
+        
+        # A dedicated client without retries sees the injected status directly
+        async with TMDBApiClient(api_client.base_url, retries=0) as client:
+            for status in (429, 500, 503):
+                response = await client.get("/movie/popular", headers={"X-Fake-Status": str(status)})
+                assert response.status_code == status
+                body = response.json()
+                assert "status_code" in body and "status_message" in body
             
-            # Even error responses should have expected structure
-            if response.status_code == 401:
-                # Check error response structure
-                assert "status_code" in response_data or "success" in response_data
-                logger.info("API error response structure validated")
-            else:
-                # Check success response structure
-                expected_keys = ["results", "page", "total_pages", "total_results"]
-                for key in expected_keys:
-                    if key in response_data:
-                        logger.info(f"Found expected key: {key}")
-                
-        except Exception as e:
-            logger.warning(f"API structure test failed: {e}")
+            unknown = await client.get("/movie/does-not-exist")
+            assert unknown.status_code == 404
+            
+            for path, params in (("/movie/popular", {"page": "abc"}),
+                                 ("/discover/movie", {"with_genres": "abc"}),
+                                 ("/discover/tv", {"vote_average.gte": "x"})):
+                invalid = await client.get(path, **params)
+                assert invalid.status_code == 422, f"{path} {params} answered {invalid.status_code}"
+                assert invalid.json()["status_code"] == 22
+            invalid = await client.get("/movie/popular", headers={"X-Fake-Status": "oops"})
+            assert invalid.status_code == 422
     
-    def test_network_monitoring_during_ui_interaction(self, home_page):
+    async def test_concurrent_fan_out(self, api_client: TMDBApiClient):
+        """
+        Test Case: TC034 - Concurrent Request Fan-out
+        Priority: Medium
+        
+        Hundreds of discover/search calls share the pooled client concurrently.
+        """
+        calls = []
+        for page in range(1, 4):
+            for year in range(2015, 2025):
+                calls.append(("/discover/movie", {"primary_release_year": year, "page": page}))
+            calls.append(("/search/multi", {"query": "star", "page": page}))
+            calls.append(("/discover/tv", {"page": page}))
+        calls = calls * 5
+        
+        start = time.perf_counter()
+        responses = await api_client.get_many(calls)
+        elapsed = time.perf_counter() - start
+        
+        statuses = {r.status_code for r in responses}
+        if statuses == {401}:
+            pytest.skip("API key required for this endpoint")
+        assert statuses == {200}, f"Unexpected statuses: {statuses}"
+        logger.info(f"{len(responses)} concurrent requests in {elapsed:.2f}s")
+    
+    async def test_network_monitoring_during_ui_interaction(self, home_page):
         """
         Test Case: TC026 - Network Monitoring
         Priority: Medium
         
         Monitor network requests during UI interactions.
         """
-        # This test would be implemented with Playwright's network monitoring
-        # For now, just document the approach
-        logger.info("Network monitoring test - to be implemented with Playwright")
+        await home_page.navigate_to_home()
+        
+        # The type filter captures the discover response it triggers
+        payload = await home_page.apply_type_filter("tv_show")
+        
+        assert payload is not None, "Type filter did not capture a results response"
+        
+        assert "results" in payload, "Discover response should contain results"
+        logger.info(f"Captured {len(payload['results'])} results from the API")
         
-        # Example of how this would work:
-        # 1. Set up network request monitoring
-        # 2. Perform UI action (like filtering)
-        # 3. Capture and validate network requests
-        # 4. Ensure API calls match UI actions
+        # Every API result should be a TV show record
+        for item in payload["results"]:
+            assert "name" in item and "first_air_date" in item and "title" not in item, \
+                f"Result is not a TV show record: {item}"
         
-        assert True  # Placeholder for actual implementation
\ No newline at end of file
+        assert home_page.last_results is payload, "Captured payload should be kept on the page object"
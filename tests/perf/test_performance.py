@@ -0,0 +1,91 @@
+"""Frontend performance budget tests."""
+
+import pytest
+from framework.performance import PerformanceBudget
+from pages.home_page import HomePage
+from loguru import logger
+
+
+@pytest.mark.asyncio
+@pytest.mark.perf
+class TestPerformance:
+    """Test class for frontend performance budgets."""
+    
+    async def _load_home(self, home_page: HomePage) -> None:
+        """Load the home page with the performance observers registered."""
+        await home_page.enable_performance_observers()
+        await home_page.navigate_to_home()
+    
+    @pytest.mark.cold_context
+    async def test_home_load_performance(self, home_page: HomePage, perf_budget: PerformanceBudget):
+        """
+        Test Case: TC035 - Home Page Load Performance
+        Priority: High
+        
+        Checks TTFB, FCP, LCP, CLS, blocking time, request count and JS heap
+        of a cold home page load against the home_load budget. The context
+        is brand new, so no pooled HTTP cache serves the assets.
+        """
+        await self._load_home(home_page)
+        
+        metrics = await home_page.collect_performance_metrics()
+        
+        perf_budget.assert_within("home_load", metrics)
+    
+    async def test_category_switch_performance(self, home_page: HomePage, perf_budget: PerformanceBudget):
+        """
+        Test Case: TC036 - Category Switch Performance
+        Priority: Medium
+        """
+        await self._load_home(home_page)
+        
+        since = await home_page.performance_now()
+        await home_page.select_category("top_rated")
+        metrics = await home_page.collect_performance_metrics(since=since)
+        
+        perf_budget.assert_within("category_switch", metrics)
+    
+    async def test_filter_apply_performance(self, home_page: HomePage, perf_budget: PerformanceBudget):
+        """
+        Test Case: TC037 - Filter Apply Performance
+        Priority: Medium
+        """
+        await self._load_home(home_page)
+        
+        since = await home_page.performance_now()
+        await home_page.apply_type_filter("tv_show")
+        metrics = await home_page.collect_performance_metrics(since=since)
+        
+        perf_budget.assert_within("filter_apply", metrics)
+    
+    async def test_search_performance(self, home_page: HomePage, perf_budget: PerformanceBudget):
+        """
+        Test Case: TC038 - Search Performance
+        Priority: Medium
+        """
+        await self._load_home(home_page)
+        
+        since = await home_page.performance_now()
+        await home_page.search_movies("Avengers")
+        metrics = await home_page.collect_performance_metrics(since=since)
+        
+        perf_budget.assert_within("search", metrics)
+    
+    async def test_pagination_performance(self, home_page: HomePage, perf_budget: PerformanceBudget):
+        """
+        Test Case: TC039 - Pagination Performance
+        Priority: Low
+        """
+        await self._load_home(home_page)
+        
+        if not await home_page.is_pagination_available():
+            pytest.skip("Pagination not available")
+        
+        since = await home_page.performance_now()
+        navigated = await home_page.navigate_to_next_page()
+        if not navigated:
+            pytest.skip("Next page button not available")
+        metrics = await home_page.collect_performance_metrics(since=since)
+        logger.info(f"Pagination took {metrics['duration_ms']:.0f}ms")
+        
+        perf_budget.assert_within("pagination", metrics)
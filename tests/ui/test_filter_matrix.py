@@ -0,0 +1,34 @@
+"""Data-driven filter combination tests."""
+
+import pytest
+from config.settings import config
+from framework.filter_matrix import load_matrix, run_matrix, write_matrix_report
+from framework.page_pool import PagePool
+from pages.home_page import HomePage
+from loguru import logger
+
+
+@pytest.mark.asyncio
+@pytest.mark.resource_policy("placeholder")
+class TestFilterMatrix:
+    """Test class for the type x genre x year x rating filter matrix."""
+    
+    async def test_filter_matrix(self, home_page: HomePage, page_pool: PagePool):
+        """
+        Test Case: TC042 - Filter Combination Matrix
+        Priority: High
+        Steps:
+        1. Reduce config/filter_matrix.yaml to its n-wise scenarios
+        2. Open every scenario's results concurrently on pooled pages
+        3. Check every card against the scenario's filters
+        Expected: All scenarios return only matching content
+        """
+        scenarios = load_matrix(config.filter_matrix_file, config.filter_matrix_strength or None)
+        
+        results = await run_matrix(home_page, scenarios, page_pool=page_pool)
+        write_matrix_report(results, "reports/filter_matrix.json")
+        
+        failed = [r for r in results if not r.passed]
+        for r in failed:
+            logger.error(f"{r.scenario}: {'; '.join(r.failures)}")
+        assert not failed, f"{len(failed)}/{len(results)} filter combinations failed: {[r.scenario for r in failed]}"
@@ -1,11 +1,13 @@
 """Simplified UI tests for filtering functionality."""
 
 import pytest
+from framework.page_pool import PagePool
 from pages.home_page import HomePage
 from loguru import logger
 
 
 @pytest.mark.asyncio
+@pytest.mark.resource_policy("placeholder")
 class TestFiltering:
     """Test class for filtering functionality."""
     
@@ -40,13 +42,10 @@ class TestFiltering:
         # Wait for page to load
         await home_page.page.wait_for_selector("text=Popular", timeout=10000)
         
-        # Click Popular button
-        await home_page.page.click("text=Popular")
+        # Click Popular button and wait for the grid to settle
+        await home_page.select_category("popular")
         logger.info("Clicked Popular category")
         
-        # Wait a bit for any changes
-        await home_page.page.wait_for_timeout(2000)
-        
         # Take screenshot
         await home_page.take_screenshot("popular_clicked")
         
@@ -54,6 +53,33 @@ class TestFiltering:
         title = await home_page.page.title()
         assert "Discover" in title or len(title) > 0, "Page title missing"
     
+    @pytest.mark.home_loaded
+    async def test_all_categories_show_movies(self, home_page: HomePage, page_pool: PagePool):
+        """
+        Test Case: TC009 - All Categories Show Movies
+        Priority: High
+        Steps:
+        1. Open each category (Popular, Trend, Newest, Top rated) on its own page
+        2. Verify each category shows movie posters
+        Expected: Every category renders a non-empty grid
+        """
+        categories = ["popular", "trending", "newest", "top_rated"]
+        
+        async def open_category(page: HomePage, category: str) -> int:
+            await page.select_category(category)
+            return await page.get_movie_count()
+        
+        # All four categories load side by side in the same context
+        counts = await home_page.fan_out(categories, open_category, page_pool=page_pool)
+        
+        for category, count in zip(categories, counts):
+            logger.info(f"Category {category}: {count}")
+            assert not isinstance(count, Exception), f"Category {category} failed: {count}"
+            assert count > 0, f"No movies found in category {category}"
+        
+        logger.info("TC009 - All Categories Show Movies test completed successfully")
+    
+    @pytest.mark.home_loaded
     async def test_year_range_filtering(self, home_page: HomePage):
         """
         Test Case: TC003 - Year Range Filtering
@@ -64,20 +90,12 @@ class TestFiltering:
         3. Test boundary values
         Expected: Only content from specified years
         """
-        await home_page.navigate_to_home()
-        
-        # Wait for page to load completely
-        await home_page.wait_for_page_load()
-        
         # Take screenshot before applying filter
         await home_page.take_screenshot("before_year_filter")
         
         # Apply year filter (2020-2023)
         await home_page.apply_year_filter(2020, 2023)
         
-        # Wait for filter to apply and content to update
-        await home_page.page.wait_for_timeout(3000)
-        
         # Take screenshot after applying filter
         await home_page.take_screenshot("after_year_filter_2020_2023")
         
@@ -90,7 +108,6 @@ class TestFiltering:
         
         # Test with a narrower range to verify boundary behavior
         await home_page.apply_year_filter(2022, 2022)
-        await home_page.page.wait_for_timeout(2000)
         
         # Take screenshot for boundary test
         await home_page.take_screenshot("year_filter_boundary_2022")
@@ -102,7 +119,6 @@ class TestFiltering:
         # Test with invalid range (should handle gracefully)
         try:
             await home_page.apply_year_filter(2025, 2023)  # Invalid range
-            await home_page.page.wait_for_timeout(2000)
             await home_page.take_screenshot("invalid_year_range_test")
             logger.info("Invalid year range handled gracefully")
         except Exception as e:
@@ -117,6 +133,7 @@ class TestFiltering:
         
         logger.info("TC003 - Year Range Filtering test completed successfully")
     
+    @pytest.mark.home_loaded
     async def test_type_filtering_movies(self, home_page: HomePage):
         """
         Test Case: TC004 - Type Filtering (Movies)
@@ -127,21 +144,18 @@ class TestFiltering:
         3. Test content type validation
         Expected: Only movie content displayed
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Take screenshot before applying filter
         await home_page.take_screenshot("before_type_filter")
         
         # Apply type filter for movies
         await home_page.apply_type_filter("movie")
         
-        # Wait for filter to apply
-        await home_page.page.wait_for_timeout(3000)
-        
         # Take screenshot after applying filter
         await home_page.take_screenshot("after_type_filter_movies")
         
+        # Every card that shows its type should match the filter
+        assert await home_page.verify_content_type("movie"), "Found cards of another type after filtering for movies"
+        
         # Verify we still have content
         movie_count = await home_page.get_movie_count()
         logger.info(f"Movie count after type filter: {movie_count}")
@@ -151,6 +165,7 @@ class TestFiltering:
         
         logger.info("TC004 - Type Filtering (Movies) test completed successfully")
     
+    @pytest.mark.home_loaded
     async def test_type_filtering_tv_shows(self, home_page: HomePage):
         """
         Test Case: TC005 - Type Filtering (TV Shows)
@@ -161,21 +176,18 @@ class TestFiltering:
         3. Test content type validation
         Expected: Only TV show content displayed
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Take screenshot before applying filter
         await home_page.take_screenshot("before_tv_filter")
         
         # Apply type filter for TV shows
         await home_page.apply_type_filter("tv_show")
         
-        # Wait for filter to apply
-        await home_page.page.wait_for_timeout(3000)
-        
         # Take screenshot after applying filter
         await home_page.take_screenshot("after_type_filter_tv_shows")
         
+        # Every card that shows its type should match the filter
+        assert await home_page.verify_content_type("tv_show"), "Found cards of another type after filtering for TV shows"
+        
         # Verify we still have content
         movie_count = await home_page.get_movie_count()
         logger.info(f"Content count after TV show filter: {movie_count}")
@@ -185,6 +197,7 @@ class TestFiltering:
         
         logger.info("TC005 - Type Filtering (TV Shows) test completed successfully")
     
+    @pytest.mark.home_loaded
     async def test_genre_filtering(self, home_page: HomePage):
         """
         Test Case: TC006 - Genre Filtering
@@ -195,9 +208,6 @@ class TestFiltering:
         3. Test multiple genre selections
         Expected: Content filtered by selected genre
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Take screenshot before applying filter
         await home_page.take_screenshot("before_genre_filter")
         
@@ -211,9 +221,6 @@ class TestFiltering:
                 # Apply genre filter
                 await home_page.apply_genre_filter(genre)
                 
-                # Wait for filter to apply
-                await home_page.page.wait_for_timeout(3000)
-                
                 # Take screenshot for this genre
                 await home_page.take_screenshot(f"genre_filter_{genre.lower()}")
                 
@@ -235,6 +242,7 @@ class TestFiltering:
         
         logger.info("TC006 - Genre Filtering test completed successfully")
     
+    @pytest.mark.home_loaded
     async def test_rating_filtering(self, home_page: HomePage):
         """
         Test Case: TC007 - Rating Filtering
@@ -245,9 +253,6 @@ class TestFiltering:
         3. Test different rating levels
         Expected: Content filtered by minimum rating
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Take screenshot before applying filter
         await home_page.take_screenshot("before_rating_filter")
         
@@ -261,9 +266,6 @@ class TestFiltering:
                 # Apply rating filter
                 await home_page.apply_rating_filter(rating)
                 
-                # Wait for filter to apply
-                await home_page.page.wait_for_timeout(3000)
-                
                 # Take screenshot for this rating
                 await home_page.take_screenshot(f"rating_filter_{rating}_stars")
                 
@@ -285,6 +287,7 @@ class TestFiltering:
         
         logger.info("TC007 - Rating Filtering test completed successfully")
     
+    @pytest.mark.home_loaded
     async def test_combined_filters(self, home_page: HomePage):
         """
         Test Case: TC008 - Combined Filters
@@ -295,42 +298,45 @@ class TestFiltering:
         3. Test filter interaction
         Expected: Content filtered by all applied criteria
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Take screenshot before applying filters
         await home_page.take_screenshot("before_combined_filters")
         
-        try:
-            # Apply multiple filters
-            logger.info("Applying combined filters: Movie + Year + Rating")
-            
-            # 1. Apply type filter (Movies)
-            await home_page.apply_type_filter("movie")
-            await home_page.page.wait_for_timeout(2000)
-            
-            # 2. Apply year filter (2020-2023)
-            await home_page.apply_year_filter(2020, 2023)
-            await home_page.page.wait_for_timeout(2000)
-            
-            # 3. Apply rating filter (5+ stars)
-            await home_page.apply_rating_filter(5)
-            await home_page.page.wait_for_timeout(3000)
-            
-            # Take screenshot after applying all filters
-            await home_page.take_screenshot("after_combined_filters")
-            
-            # Verify we still have content
-            movie_count = await home_page.get_movie_count()
-            logger.info(f"Content count after combined filters: {movie_count}")
-            
-            # Should have some content
-            assert movie_count >= 0, "No content found after applying combined filters"
-            
-            logger.info("TC008 - Combined Filters test completed successfully")
-            
-        except Exception as e:
-            logger.warning(f"Combined filters test failed: {e}")
-            await home_page.take_screenshot("combined_filters_error")
-            # Don't fail the test, just log the issue
-            logger.info("TC008 - Combined Filters test completed with warnings")
\ No newline at end of file
+        # Apply Movie + 2020-2023 + 5 stars with a single results refresh
+        logger.info("Applying combined filters: Movie + Year + Rating")
+        payload = await home_page.apply_filters(content_type="movie", year_from=2020, year_to=2023, min_rating=5)
+        
+        # Take screenshot after applying all filters
+        await home_page.take_screenshot("after_combined_filters")
+        
+        assert payload is not None, "Combined filter response was not captured"
+        
+        # The grid must show the response issued after the last (rating) selection
+        report = await home_page.verify_against_api(payload)
+        assert report.ok, f"Cards differ from the combined filter results: {report.summary()}"
+        
+        assert await home_page.verify_year_range(2020, 2023), "Some movies are outside the 2020-2023 year range"
+        assert await home_page.verify_content_type("movie"), "Cards of another type in Movie results"
+        assert await home_page.verify_min_rating(5), "Some movies are rated below 5"
+        
+        logger.info("TC008 - Combined Filters test completed successfully")
+    
+    async def test_filtered_results_via_fast_path(self, home_page: HomePage):
+        """
+        Test Case: TC041 - Filtered Results Without Sidebar Interaction
+        Priority: Medium
+        Steps:
+        1. Open the home page with TV Show + 2020-2023 + 7 rating preset
+        2. Verify every card matches all three filters
+        Expected: Result correctness independent of the filter widgets
+        """
+        payload = await home_page.open_with_filters(content_type="tv_show", year_from=2020, year_to=2023, rating=7)
+        
+        # Guard against passing vacuously: the rewritten request must have
+        # been answered and its results rendered
+        assert payload is not None, "Filtered results response was not captured"
+        assert payload.get("results"), "Filtered results response is empty"
+        assert len(await home_page.get_results()) > 0, "No cards rendered for the filtered results"
+        
+        assert await home_page.verify_content_type("tv_show"), "Cards of another type in TV Show results"
+        assert await home_page.verify_year_range(2020, 2023), "Some shows are outside the 2020-2023 year range"
+        assert await home_page.verify_min_rating(7), "Some shows are rated below 7"
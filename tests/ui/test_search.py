@@ -1,7 +1,9 @@
 """UI tests for search functionality."""
 
 import pytest
+from typing import Tuple
 from playwright.async_api import Page, expect
+from framework.page_pool import PagePool
 from pages.home_page import HomePage
 from loguru import logger
 
@@ -9,6 +11,8 @@ from loguru import logger
 @pytest.mark.asyncio
 @pytest.mark.ui
 @pytest.mark.smoke
+@pytest.mark.home_loaded
+@pytest.mark.resource_policy("placeholder")
 class TestSearch:
     """Test class for search functionality."""
     
@@ -23,9 +27,6 @@ class TestSearch:
         3. Check input field attributes
         Expected: Search input field is visible with correct placeholder
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Take screenshot before search
         await home_page.take_screenshot("before_search")
         
@@ -58,9 +59,6 @@ class TestSearch:
         4. Verify results contain the search term
         Expected: Search returns relevant results containing "POOL"
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Take screenshot before search
         await home_page.take_screenshot("before_pool_search")
         
@@ -88,7 +86,7 @@ class TestSearch:
         
         logger.info("TC014 - Basic Movie Search test completed successfully")
     
-    async def test_search_with_different_terms(self, home_page: HomePage):
+    async def test_search_with_different_terms(self, home_page: HomePage, page_pool: PagePool):
         """
         Test Case: TC015 - Search with Different Terms
         Priority: High
@@ -99,9 +97,6 @@ class TestSearch:
         3. Test case sensitivity
         Expected: All search terms return relevant results
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Test different search terms
         search_terms = [
             "Batman",
@@ -112,33 +107,31 @@ class TestSearch:
             "Horror"
         ]
         
+        async def search(page: HomePage, term: str) -> Tuple[int, bool]:
+            logger.info(f"Testing search for: {term}")
+            await page.search_movies(term)
+            results_count = await page.get_search_results_count()
+            contains_term = await page.verify_search_results_contain(term)
+            if results_count > 0 and contains_term:
+                await page.take_screenshot(f"search_{term.lower().replace(' ', '_')}")
+            return results_count, contains_term
+        
+        # Each term is searched on its own page, all at once
+        outcomes = await home_page.fan_out(search_terms, search, page_pool=page_pool)
+        
         successful_searches = 0
         
-        for term in search_terms:
-            try:
-                logger.info(f"Testing search for: {term}")
-                
-                # Clear previous search
-                await home_page.clear_search()
-                await home_page.page.wait_for_timeout(1000)
-                
-                # Perform search
-                await home_page.search_movies(term)
-                
-                # Verify results
-                results_count = await home_page.get_search_results_count()
-                contains_term = await home_page.verify_search_results_contain(term)
-                
-                if results_count > 0 and contains_term:
-                    successful_searches += 1
-                    logger.info(f"✅ Search '{term}' successful: {results_count} results")
-                    await home_page.take_screenshot(f"search_{term.lower().replace(' ', '_')}")
-                else:
-                    logger.warning(f"⚠️ Search '{term}' returned {results_count} results, contains term: {contains_term}")
-                
-            except Exception as e:
-                logger.warning(f"❌ Search failed for '{term}': {e}")
+        for term, outcome in zip(search_terms, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"❌ Search failed for '{term}': {outcome}")
                 continue
+            
+            results_count, contains_term = outcome
+            if results_count > 0 and contains_term:
+                successful_searches += 1
+                logger.info(f"✅ Search '{term}' successful: {results_count} results")
+            else:
+                logger.warning(f"⚠️ Search '{term}' returned {results_count} results, contains term: {contains_term}")
         
         # At least 50% of searches should be successful
         success_rate = (successful_searches / len(search_terms)) * 100
@@ -159,9 +152,6 @@ class TestSearch:
         3. Verify behavior (should show all movies or no results)
         Expected: Empty search handled gracefully
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Take screenshot before empty search
         await home_page.take_screenshot("before_empty_search")
         
@@ -192,9 +182,6 @@ class TestSearch:
         3. Test search with symbols
         Expected: Special characters handled gracefully
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         special_terms = [
             "2023",
             "The & The",
@@ -209,7 +196,6 @@ class TestSearch:
                 logger.info(f"Testing special character search: {term}")
                 
                 await home_page.clear_search()
-                await home_page.page.wait_for_timeout(1000)
                 
                 await home_page.search_movies(term)
                 
@@ -234,9 +220,6 @@ class TestSearch:
         3. Verify search is cleared and results reset
         Expected: Search can be cleared and results reset
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Perform initial search
         await home_page.search_movies("POOL")
         initial_results = await home_page.get_search_results_count()
@@ -271,9 +254,6 @@ class TestSearch:
         4. Compare results
         Expected: Search should be case-insensitive or handle case appropriately
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         search_term = "POOL"
         case_variations = [
             "POOL",      # Uppercase
@@ -289,7 +269,6 @@ class TestSearch:
                 logger.info(f"Testing case variation: {variation}")
                 
                 await home_page.clear_search()
-                await home_page.page.wait_for_timeout(1000)
                 
                 await home_page.search_movies(variation)
                 
@@ -322,9 +301,6 @@ class TestSearch:
         2. Verify search handles long input gracefully
         Expected: Long search terms handled without errors
         """
-        await home_page.navigate_to_home()
-        await home_page.wait_for_page_load()
-        
         # Test with very long search term
         long_term = "This is a very long search term that should test the search functionality with extended input"
         
@@ -345,4 +321,24 @@ class TestSearch:
             logger.warning(f"Long search term failed: {e}")
             # This is acceptable - long terms might not be supported
         
-        logger.info("TC020 - Search with Long Term test completed successfully")
\ No newline at end of file
+        logger.info("TC020 - Search with Long Term test completed successfully")
+    
+    async def test_search_results_match_api(self, home_page: HomePage):
+        """
+        Test Case: TC043 - Search Results Match the API Payload
+        Priority: High
+        
+        Steps:
+        1. Search for a term
+        2. Join the rendered cards against the captured search response
+        Expected: No card is missing, extra, out of order or showing the wrong year
+        """
+        payload = await home_page.search_movies("Batman")
+        assert payload is not None, "Search response was not captured"
+        
+        report = await home_page.verify_against_api(payload)
+        
+        assert report.rendered > 0, "Search should render at least one card"
+        assert report.ok, f"Cards differ from the API results: {report.summary()}"
+        
+        logger.info("TC043 - Search Results Match the API Payload test completed successfully")
@@ -2,16 +2,74 @@
 
 import sys
 import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Iterator, List, Tuple
 from loguru import logger
 from config.settings import config
 
 
-def setup_logger() -> None:
-    """Setup logger configuration."""
+class LogCostMeter:
+    """Measures the time spent emitting log records inside timed actions.
+    
+    A patcher stamps each record when it is created and a sink added after
+    all the others adds the elapsed time to every ``measure()`` block the
+    record was logged in. Formatting in enqueued sinks happens in the
+    caller, their file writes do not, so this is the cost the action sees.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize LogCostMeter."""
+        self._active: ContextVar[Tuple[List[float], ...]] = ContextVar("log_cost", default=())
+    
+    def patch(self, record: dict) -> None:
+        """Patcher: stamp records logged while a measurement is active."""
+        if self._active.get():
+            record["extra"]["log_cost_start"] = time.perf_counter()
+    
+    def sink(self, message) -> None:
+        """Last sink: charge the record's emit time to the active measurements."""
+        start = message.record["extra"].get("log_cost_start")
+        if start is not None:
+            elapsed = time.perf_counter() - start
+            for total in self._active.get():
+                total[0] += elapsed
+    
+    @contextmanager
+    def measure(self) -> Iterator[List[float]]:
+        """Measure logging cost in the block, nested blocks included.
+        
+        Yields:
+            One-element list holding the seconds spent so far
+        """
+        total = [0.0]
+        token = self._active.set(self._active.get() + (total,))
+        try:
+            yield total
+        finally:
+            self._active.reset(token)
+
+
+# Used by timed_action to report logging overhead per action
+log_cost = LogCostMeter()
+
+
+def setup_logger(fast: bool = False) -> None:
+    """Setup logger configuration.
+    
+    Args:
+        fast: Fast-logging profile - no variable dumps or extended
+            tracebacks, the file sink at LOG_LEVEL instead of DEBUG (so
+            debug calls return before formatting) and file writes on a
+            background thread
+    """
     
     # Remove default logger
     logger.remove()
+    logger.configure(patcher=log_cost.patch)
+    file_level = config.log_level if fast else "DEBUG"
     
     # Ensure logs directory exists
     log_dir = Path(config.log_file).parent
@@ -23,20 +81,21 @@ def setup_logger() -> None:
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level=config.log_level,
         colorize=True,
-        backtrace=True,
-        diagnose=True
+        backtrace=not fast,
+        diagnose=not fast
     )
     
     # File logging with rotation
     logger.add(
         config.log_file,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        level="DEBUG",
+        level=file_level,
         rotation="10 MB",
         retention="30 days",
         compression="zip",
-        backtrace=True,
-        diagnose=True
+        enqueue=fast,
+        backtrace=not fast,
+        diagnose=not fast
     )
     
     # Add test results logging
@@ -46,10 +105,19 @@ def setup_logger() -> None:
         level="INFO",
         rotation="1 day",
         retention="7 days",
+        enqueue=fast,
         filter=lambda record: "TEST_RESULT" in record["message"]
     )
     
-    logger.info("Logger initialized successfully")
+    # Added last so it sees each record after every other sink; at the lowest
+    # level already in use so it does not make skipped debug calls emit
+    logger.add(
+        log_cost.sink,
+        format="{message}",
+        level=min(logger.level(name).no for name in (config.log_level, file_level, "INFO"))
+    )
+    
+    logger.info(f"Logger initialized successfully{' (fast logging)' if fast else ''}")
 
 
 # Test result logging helpers